@@ -0,0 +1,303 @@
+# analisis.py
+from array import array
+from typing import Dict, Iterator, List, Set, Type
+from gramatica import Gramatica
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo usa el motor 'numpy'
+    np = None
+
+
+class AnalisisLineal:
+    """
+    Motor por omisión: listas de trabajo con un contador de símbolos
+    pendientes por producción, lineal en el tamaño de la gramática
+    Todos los motores devuelven conjuntos de ids de no terminales y suman en
+    `iteraciones` el trabajo de sus puntos fijos: extracciones de la lista
+    de trabajo en este motor, rondas en los vectorizados
+    """
+
+    def __init__(self, gramatica: Gramatica):
+        self.gramatica = gramatica
+        self.iteraciones = 0
+
+    def anulables(self) -> Set[int]:
+        return self._punto_fijo(con_terminales=False)
+
+    def generadores(self) -> Set[int]:
+        """No terminales que derivan alguna cadena de terminales"""
+        return self._punto_fijo(con_terminales=True)
+
+    def _punto_fijo(self, con_terminales: bool) -> Set[int]:
+        """
+        Cabezas de las producciones cuyos no terminales están todos en el
+        resultado; sin con_terminales, las producciones con algún terminal
+        no cuentan (anulables)
+        """
+        gramatica = self.gramatica
+        es_no_terminal = gramatica.tabla.no_terminal
+        listos: Set[int] = set()
+        cabezas: List[int] = []
+        pendientes: List[int] = []
+        ocurrencias: Dict[int, List[int]] = {}
+        trabajo: List[int] = []
+
+        for nt, bloque in gramatica.bloques():
+            for prod in bloque:
+                if not con_terminales and any(not es_no_terminal[s] for s in prod):
+                    continue
+                k = len(cabezas)
+                cabezas.append(nt)
+                cuenta = 0
+                for simbolo in prod:
+                    if es_no_terminal[simbolo]:
+                        cuenta += 1
+                        ocurrencias.setdefault(simbolo, []).append(k)
+                pendientes.append(cuenta)
+                if cuenta == 0 and nt not in listos:
+                    listos.add(nt)
+                    trabajo.append(nt)
+
+        while trabajo:
+            simbolo = trabajo.pop()
+            self.iteraciones += 1
+            for k in ocurrencias.pop(simbolo, ()):
+                pendientes[k] -= 1
+                if pendientes[k] == 0 and cabezas[k] not in listos:
+                    listos.add(cabezas[k])
+                    trabajo.append(cabezas[k])
+        return listos
+
+    def alcanzables(self, generadores: Set[int]) -> Set[int]:
+        """
+        No terminales alcanzables desde el inicial usando solo producciones
+        cuyos no terminales son todos generadores (búsqueda en anchura)
+        """
+        gramatica = self.gramatica
+        es_no_terminal = gramatica.tabla.no_terminal
+        alcanzables: Set[int] = set()
+        if gramatica.inicial not in generadores:
+            return alcanzables
+        alcanzables.add(gramatica.inicial)
+        frontera = [gramatica.inicial]
+        for nt in frontera:
+            self.iteraciones += 1
+            for prod in gramatica.producciones_de(nt):
+                if all(not es_no_terminal[s] or s in generadores for s in prod):
+                    for simbolo in prod:
+                        if es_no_terminal[simbolo] and simbolo not in alcanzables:
+                            alcanzables.add(simbolo)
+                            frontera.append(simbolo)
+        return alcanzables
+
+
+def _posiciones(mascara: int) -> Iterator[int]:
+    """Índices de los bits en 1, con una sola conversión a texto del entero"""
+    texto = bin(mascara)[:1:-1]
+    i = texto.find('1')
+    while i >= 0:
+        yield i
+        i = texto.find('1', i + 1)
+
+
+def _mascara(indices: List[int]) -> int:
+    """Entero con los bits indicados en 1, construido en un bytearray"""
+    if not indices:
+        return 0
+    bits = bytearray((indices[-1] >> 3) + 1)
+    for i in indices:
+        bits[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(bits, 'little')
+
+
+class AnalisisBits(AnalisisLineal):
+    """
+    Motor de conjuntos de bits con enteros de Python. Las producciones se
+    numeran por bloque y cada no terminal tiene la máscara de las
+    producciones donde aparece (una fila de la matriz de incidencia) y la
+    de su propio rango de producciones. Cada ronda de un punto fijo es un OR
+    de filas: una producción queda satisfecha si no está en la fila de
+    ningún no terminal aún pendiente. La matriz ocupa hasta
+    no terminales × producciones / 8 bytes; para los alcanzables se guardan
+    además los no terminales de cada producción en forma plana
+    """
+
+    def __init__(self, gramatica: Gramatica):
+        super().__init__(gramatica)
+        es_no_terminal = gramatica.tabla.no_terminal
+        self.cabezas = array('i')
+        self.no_terminales = array('i')          # no terminales de cada producción, en plano
+        self.limites = array('i', [0])
+        self.rangos: Dict[int, int] = {}       # no terminal -> máscara de sus producciones
+        ocurrencias: Dict[int, List[int]] = {}
+        con_terminal: List[int] = []
+        for nt, bloque in gramatica.bloques():
+            inicio = len(self.cabezas)
+            for prod in bloque:
+                k = len(self.cabezas)
+                self.cabezas.append(nt)
+                terminal = False
+                for simbolo in prod:
+                    if es_no_terminal[simbolo]:
+                        self.no_terminales.append(simbolo)
+                        filas = ocurrencias.setdefault(simbolo, [])
+                        if not filas or filas[-1] != k:
+                            filas.append(k)
+                    else:
+                        terminal = True
+                self.limites.append(len(self.no_terminales))
+                if terminal:
+                    con_terminal.append(k)
+            self.rangos[nt] = ((1 << (len(self.cabezas) - inicio)) - 1) << inicio
+        self.filas = {s: _mascara(filas) for s, filas in ocurrencias.items()}
+        self.todas = (1 << len(self.cabezas)) - 1
+        self.con_terminal = _mascara(con_terminal)
+
+    def _punto_fijo(self, candidatas: int) -> Set[int]:
+        """
+        Cabezas de las producciones candidatas que se satisfacen cuando
+        basta que sus no terminales estén en el propio conjunto resultante
+        """
+        listos: Set[int] = set()
+        pendientes = list(self.filas)
+        satisfechas = 0
+        while True:
+            self.iteraciones += 1
+            bloqueadas = 0
+            quedan = []
+            for simbolo in pendientes:
+                if simbolo not in listos:
+                    bloqueadas |= self.filas[simbolo]
+                    quedan.append(simbolo)
+            pendientes = quedan
+            nuevas = candidatas & ~bloqueadas & ~satisfechas
+            if not nuevas:
+                return listos
+            satisfechas |= nuevas
+            cabezas = self.cabezas
+            antes = len(listos)
+            listos.update(cabezas[k] for k in _posiciones(nuevas))
+            if len(listos) == antes:
+                return listos
+
+    def anulables(self) -> Set[int]:
+        return self._punto_fijo(self.todas & ~self.con_terminal)
+
+    def generadores(self) -> Set[int]:
+        return self._punto_fijo(self.todas)
+
+    def alcanzables(self, generadores: Set[int]) -> Set[int]:
+        inicial = self.gramatica.inicial
+        if inicial not in generadores:
+            return set()
+        utiles = self.todas
+        for simbolo, fila in self.filas.items():
+            if simbolo not in generadores:
+                utiles &= ~fila
+        # Cada ronda pasa de los no terminales nuevos a sus producciones útiles
+        # con un AND de máscaras; cada producción se recorre una sola vez
+        alcanzables = {inicial}
+        vivas = self.rangos.get(inicial, 0) & utiles
+        no_terminales = self.no_terminales
+        limites = self.limites
+        while vivas:
+            self.iteraciones += 1
+            nuevas = 0
+            for k in _posiciones(vivas):
+                for simbolo in no_terminales[limites[k]:limites[k + 1]]:
+                    if simbolo not in alcanzables:
+                        alcanzables.add(simbolo)
+                        nuevas |= self.rangos.get(simbolo, 0)
+            vivas = nuevas & utiles
+        return alcanzables
+
+
+class AnalisisNumpy(AnalisisLineal):
+    """
+    Motor vectorizado con NumPy sobre la gramática en forma plana (símbolos
+    de todas las producciones y la producción de cada ocurrencia): cada
+    ronda cuenta con bincount los símbolos aún no listos de cada producción,
+    con memoria lineal en el tamaño de la gramática
+    """
+
+    def __init__(self, gramatica: Gramatica):
+        super().__init__(gramatica)
+        simbolos = array('i')
+        produccion_de = array('i')
+        cabezas = array('i')
+        for nt, bloque in gramatica.bloques():
+            for prod in bloque:
+                produccion_de.extend([len(cabezas)] * len(prod))
+                simbolos.extend(prod)
+                cabezas.append(nt)
+        self.simbolos = np.frombuffer(simbolos, dtype=np.int32) if simbolos else np.zeros(0, np.int32)
+        self.produccion_de = np.frombuffer(produccion_de, dtype=np.int32) if produccion_de \
+            else np.zeros(0, np.int32)
+        self.cabezas = np.frombuffer(cabezas, dtype=np.int32) if cabezas else np.zeros(0, np.int32)
+        self.es_no_terminal = np.frombuffer(bytes(gramatica.tabla.no_terminal), dtype=np.uint8) \
+            .astype(bool)
+
+    def _satisfechas(self, listos) -> 'np.ndarray':
+        faltan = np.bincount(self.produccion_de, weights=~listos[self.simbolos],
+                             minlength=len(self.cabezas))
+        return faltan == 0
+
+    def _punto_fijo(self, listos) -> Set[int]:
+        while True:
+            self.iteraciones += 1
+            nuevos = np.zeros_like(listos)
+            nuevos[self.cabezas[self._satisfechas(listos)]] = True
+            if not (nuevos & ~listos).any():
+                return {int(s) for s in np.flatnonzero(listos & self.es_no_terminal)}
+            listos = listos | nuevos
+
+    def anulables(self) -> Set[int]:
+        return self._punto_fijo(np.zeros(len(self.es_no_terminal), dtype=bool))
+
+    def generadores(self) -> Set[int]:
+        return self._punto_fijo(~self.es_no_terminal)
+
+    def alcanzables(self, generadores: Set[int]) -> Set[int]:
+        inicial = self.gramatica.inicial
+        if inicial not in generadores:
+            return set()
+        listos = ~self.es_no_terminal
+        listos[list(generadores)] = True
+        utiles = self._satisfechas(listos)
+        alcanzables = np.zeros(len(self.es_no_terminal), dtype=bool)
+        alcanzables[inicial] = True
+        while True:
+            self.iteraciones += 1
+            vivas = utiles & alcanzables[self.cabezas]
+            nuevos = np.zeros_like(alcanzables)
+            nuevos[self.simbolos[vivas[self.produccion_de]]] = True
+            nuevos &= self.es_no_terminal
+            if not (nuevos & ~alcanzables).any():
+                return {int(s) for s in np.flatnonzero(alcanzables)}
+            alcanzables |= nuevos
+
+
+MOTORES: Dict[str, Type[AnalisisLineal]] = {
+    'lineal': AnalisisLineal,
+    'bits': AnalisisBits,
+    'numpy': AnalisisNumpy,
+}
+
+
+def motores_disponibles() -> List[str]:
+    """Motores utilizables en este entorno ('numpy' requiere NumPy)"""
+    return [motor for motor in MOTORES if motor != 'numpy' or np is not None]
+
+
+def crear_analisis(gramatica: Gramatica, motor: str = 'lineal') -> AnalisisLineal:
+    """Instancia el motor de análisis indicado para la gramática"""
+    validar_motor(motor)
+    return MOTORES[motor](gramatica)
+
+
+def validar_motor(motor: str):
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de análisis desconocido: {motor} (opciones: {', '.join(MOTORES)})")
+    if motor not in motores_disponibles():
+        raise ValueError(f"El motor '{motor}' requiere NumPy, que no está instalado")
@@ -0,0 +1,61 @@
+# bench_cyk.py
+"""
+Benchmark del reconocedor CYK con prefijos compartidos
+Reconoce lotes de cadenas con un prefijo común largo, compartiendo las
+columnas del prefijo (acepta_varias) y recalculando cada cadena desde
+cero, y compara tiempos y celdas calculadas
+
+Uso: python benchmarks/bench_cyk.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cyk import ReconocedorCYK
+from gramatica import Gramatica
+
+PARENTESIS = {'S': ['SS', '(S)', 'ε']}
+PREFIJOS = [30, 60, 90]
+REPETICIONES = 10
+
+
+def main() -> int:
+    gramatica = Gramatica()
+    gramatica.establecer_inicial('S')
+    for cabeza, producciones in PARENTESIS.items():
+        for produccion in producciones:
+            gramatica.agregar_produccion(cabeza, produccion)
+
+    print(f"{'PREFIJO':>8}  {'COMPARTIDO':>11}  {'AISLADO':>10}  {'CELDAS':>16}  {'VENTAJA':>8}")
+    for pares in PREFIJOS:
+        prefijo = '()' * pares
+        cadenas = [prefijo + a + b for a in '()' for b in '()'] * REPETICIONES
+
+        reconocedor = ReconocedorCYK(gramatica)
+        inicio = time.perf_counter()
+        compartido = reconocedor.acepta_varias(cadenas)
+        t_compartido = time.perf_counter() - inicio
+        celdas_compartido = reconocedor.celdas_calculadas
+
+        reconocedor = ReconocedorCYK(gramatica)
+        inicio = time.perf_counter()
+        aislado = []
+        for cadena in cadenas:
+            reconocedor._cadena = ''          # olvidar el prefijo anterior
+            del reconocedor._columnas[1:]
+            aislado.append(reconocedor.acepta(cadena))
+        t_aislado = time.perf_counter() - inicio
+
+        if compartido != aislado:
+            print("✗ los resultados difieren")
+            return 1
+        print(f"{len(prefijo):>8}  {t_compartido * 1e3:>9.2f}ms  {t_aislado * 1e3:>8.2f}ms  "
+              f"{celdas_compartido:>7}/{reconocedor.celdas_calculadas:<8}  "
+              f"x{t_aislado / t_compartido:>6.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+# bench_earley.py
+"""
+Benchmark del reconocedor Earley sobre entradas largas
+Reconoce y construye el bosque de expresiones aritméticas de tamaño
+creciente (hasta ~100k tokens) con la gramática de expresiones sin FNC
+
+Uso: python benchmarks/bench_earley.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from earley import ReconocedorEarley
+from gramatica import Gramatica
+
+EXPRESIONES = {'<E>': ['<E>+<T>', '<T>'], '<T>': ['<T>*<F>', '<F>'], '<F>': ['a', '(<E>)']}
+TAMANOS = [12500, 25000, 50000, 100000]
+
+
+def expresion(tamano: int, semilla: int = 0) -> str:
+    """Expresión aleatoria válida de al menos `tamano` tokens"""
+    rng = random.Random(semilla)
+    partes = []
+    total = 0
+    while total < tamano:
+        parte = rng.choice(['a', 'a*a', '(a+a)', '((a))*a', '(a*(a+a))'])
+        partes.append(parte)
+        total += len(parte) + 1
+    return '+'.join(partes)
+
+
+def main() -> int:
+    gramatica = Gramatica()
+    gramatica.establecer_inicial('<E>')
+    for cabeza, producciones in EXPRESIONES.items():
+        for produccion in producciones:
+            gramatica.agregar_produccion(cabeza, produccion)
+    reconocedor = ReconocedorEarley(gramatica)
+
+    print(f"{'TOKENS':>8}  {'RECONOCER':>10}  {'ÍTEMS':>9}  {'BOSQUE':>10}  {'NODOS':>8}")
+    for tamano in TAMANOS:
+        entrada = expresion(tamano)
+        inicio = time.perf_counter()
+        if not reconocedor.acepta(entrada):
+            print(f"✗ entrada rechazada en la posición {reconocedor.posicion_error}")
+            return 1
+        reconocer = time.perf_counter() - inicio
+        items = reconocedor.items_procesados
+        inicio = time.perf_counter()
+        bosque = reconocedor.analizar(entrada)
+        construir = time.perf_counter() - inicio
+        print(f"{len(entrada):>8}  {reconocer:>9.2f}s  {items:>9}  {construir:>9.2f}s  {len(bosque):>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+# bench_escaner.py
+"""
+Benchmark de regresión del escáner de líneas de ValidadorGramatica
+Alimenta líneas adversarias (las que hacían retroceder de forma
+catastrófica a la regex anterior) de tamaño creciente y verifica que el
+tiempo crezca linealmente con la longitud
+
+Uso: python benchmarks/bench_escaner.py
+"""
+import os
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validador import ErrorSintaxis, ValidadorGramatica
+
+# Generadores de líneas de longitud aproximada n
+LINEAS_ADVERSARIAS: Dict[str, Callable[[int], str]] = {
+    'alternativas_y_caracter_invalido': lambda n: 'A → ' + 'a | ' * (n // 4) + '!',
+    'espacios_y_barras': lambda n: 'A → ' + ' |' * (n // 2) + '>',
+    'nombre_sin_cerrar': lambda n: 'A → ' + '<' + 'x' * n,
+    'epsilon_al_final': lambda n: 'A → ' + 'ab' * (n // 2) + 'ε',
+    'valida_larga': lambda n: 'A → ' + 'a<Nt>b | ' * (n // 9) + 'c',
+}
+
+TAMANOS = [1000, 2000, 4000, 8000, 16000, 32000]
+
+# Factor máximo permitido al duplicar el tamaño (2 = lineal exacto)
+MAX_FACTOR_DUPLICAR = 3.0
+
+
+def medir(linea: str, repeticiones: int = 5) -> float:
+    """Mejor tiempo de analizar_linea sobre varias repeticiones"""
+    validador = ValidadorGramatica()
+    mejor = float('inf')
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        try:
+            validador.analizar_linea(linea)
+        except ErrorSintaxis:
+            pass
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def medir_crecimiento(generador: Callable[[int], str],
+                      tamanos: List[int]) -> Tuple[List[float], float]:
+    """
+    Tiempos por tamaño y mediana de los cocientes t(2n)/t(n); la mediana
+    tolera el ruido ocasional del sistema
+    """
+    tiempos = [medir(generador(n)) for n in tamanos]
+    factores = sorted(b / a for a, b in zip(tiempos, tiempos[1:]))
+    return tiempos, factores[len(factores) // 2]
+
+
+def main() -> int:
+    fallos = 0
+    for nombre, generador in LINEAS_ADVERSARIAS.items():
+        tiempos, mediana = medir_crecimiento(generador, TAMANOS)
+        estado = "✓" if mediana <= MAX_FACTOR_DUPLICAR else "✗"
+        if mediana > MAX_FACTOR_DUPLICAR:
+            fallos += 1
+        print(f"{estado} {nombre:36} " + " ".join(f"{t * 1e3:7.3f}ms" for t in tiempos)
+              + f"  factor mediano x{mediana:.2f}")
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
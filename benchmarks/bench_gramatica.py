@@ -0,0 +1,41 @@
+# bench_gramatica.py
+"""
+Benchmark de Gramatica.copiar (copy-on-write) en gramáticas de tamaño
+creciente: el tiempo de copiar no debe depender del tamaño
+
+Uso: python benchmarks/bench_gramatica.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gramatica import Gramatica
+
+TAMANOS = [20000, 80000, 320000]
+COPIAS = 1000
+
+
+def cadena(no_terminales: int) -> Gramatica:
+    """Gramática <N0> → a<N1>b, <N1> → a<N2>b, ..."""
+    gramatica = Gramatica()
+    for i in range(no_terminales):
+        gramatica.agregar_produccion(f'<N{i}>', f'a<N{i + 1}>b')
+    return gramatica
+
+
+def main() -> int:
+    print(f"{'NO TERMINALES':>14}  {f'{COPIAS} COPIAS':>12}")
+    for tamano in TAMANOS:
+        gramatica = cadena(tamano)
+        inicio = time.perf_counter()
+        for _ in range(COPIAS):
+            gramatica.copiar()
+        copiar = time.perf_counter() - inicio
+        print(f"{tamano:>14}  {copiar * 1e3:>10.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+# bench_pipeline.py
+"""
+Benchmark del flujo completo sobre gramáticas sintéticas
+Mide por separado cada etapa (validación, carga, cálculo de anulables,
+generación de variantes y escritura del resultado) y la memoria máxima
+de cada una, y emite los resultados en JSON para compararlos entre
+versiones
+
+Uso:
+  python benchmarks/bench_pipeline.py [-e ESCENARIO ...] [--escala F]
+                                      [--json resultados.json]
+                                      [--referencia anterior.json --tolerancia 1.5]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analisis import crear_analisis, motores_disponibles
+from benchmarks.generadores import ESCENARIOS, generar_gramatica
+from lote import escribir_gramatica
+from simplificador import SimplificadorCFG
+from validador import ValidadorGramatica
+
+ETAPAS = ('validacion', 'carga', 'anulables', 'variantes', 'escritura')
+
+
+def _etapas(archivo: str, salida: str, motor: str = 'lineal',
+            trabajadores: int = 1) -> Dict[str, Callable[[dict], None]]:
+    """
+    Funciones de cada etapa; comparten un estado para que cada una parta
+    del resultado de la anterior (la gramática cargada, la simplificada)
+    """
+    validador = ValidadorGramatica()
+
+    def validacion(estado):
+        if not validador.validar_archivo(archivo):
+            raise ValueError(f"gramática generada inválida: {archivo}")
+
+    def carga(estado):
+        estado['gramatica'] = validador.cargar_gramatica(archivo)
+
+    def anulables(estado):
+        estado['anulables'] = crear_analisis(estado['gramatica'], motor).anulables()
+
+    def variantes(estado):
+        simplificador = SimplificadorCFG(motor_analisis=motor, trabajadores=trabajadores)
+        estado['simplificada'] = simplificador.eliminar_producciones_epsilon(estado['gramatica'])
+
+    def escritura(estado):
+        escribir_gramatica(estado['simplificada'], salida)
+
+    return {'validacion': validacion, 'carga': carga, 'anulables': anulables,
+            'variantes': variantes, 'escritura': escritura}
+
+
+def medir_escenario(lineas: List[str], repeticiones: int = 3, motor: str = 'lineal',
+                    trabajadores: int = 1) -> dict:
+    """
+    Tiempo (mejor de varias repeticiones) y memoria máxima por etapa
+    La memoria se mide en una pasada aparte, porque tracemalloc
+    enlentece la ejecución y distorsionaría los tiempos
+    """
+    with tempfile.TemporaryDirectory() as directorio:
+        archivo = os.path.join(directorio, 'gramatica.txt')
+        salida = os.path.join(directorio, 'salida.txt')
+        with open(archivo, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lineas) + "\n")
+        etapas = _etapas(archivo, salida, motor, trabajadores)
+
+        segundos = {etapa: float('inf') for etapa in ETAPAS}
+        for _ in range(repeticiones):
+            estado = {}
+            for etapa in ETAPAS:
+                inicio = time.perf_counter()
+                etapas[etapa](estado)
+                segundos[etapa] = min(segundos[etapa], time.perf_counter() - inicio)
+
+        memoria = {}
+        estado = {}
+        tracemalloc.start()
+        try:
+            for etapa in ETAPAS:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                etapas[etapa](estado)
+                memoria[etapa] = tracemalloc.get_traced_memory()[1] - base
+        finally:
+            tracemalloc.stop()
+
+        original, simplificada = estado['gramatica'], estado['simplificada']
+        return {
+            'no_terminales': len(original.no_terminales),
+            'producciones_originales': original.num_producciones(),
+            'producciones_simplificadas': simplificada.num_producciones(),
+            'anulables': len(estado['anulables']),
+            'bytes_salida': os.path.getsize(salida),
+            'etapas': {etapa: {'segundos': segundos[etapa], 'memoria_pico': memoria[etapa]}
+                       for etapa in ETAPAS},
+        }
+
+
+def ejecutar(escenarios: List[str], escala: float = 1.0, repeticiones: int = 3,
+             semilla: int = 0, motor: str = 'lineal', trabajadores: int = 1) -> dict:
+    """Mide los escenarios indicados; el resultado es serializable a JSON"""
+    resultados = {}
+    for nombre in escenarios:
+        parametros = dict(ESCENARIOS[nombre])
+        parametros['no_terminales'] = max(1, int(parametros['no_terminales'] * escala))
+        lineas = generar_gramatica(semilla=semilla, **parametros)
+        resultados[nombre] = {'parametros': parametros,
+                              **medir_escenario(lineas, repeticiones, motor, trabajadores)}
+    return {'python': sys.version.split()[0], 'escala': escala, 'semilla': semilla,
+            'motor': motor, 'trabajadores': trabajadores,
+            'escenarios': resultados}
+
+
+def comparar(actual: dict, referencia: dict, tolerancia: float) -> List[str]:
+    """Etapas cuyo tiempo supera en más de `tolerancia` veces al de referencia"""
+    regresiones = []
+    for nombre, datos in actual['escenarios'].items():
+        anterior = referencia.get('escenarios', {}).get(nombre)
+        if anterior is None:
+            continue
+        for etapa, medida in datos['etapas'].items():
+            previo = anterior['etapas'].get(etapa, {}).get('segundos')
+            if previo and medida['segundos'] > previo * tolerancia:
+                regresiones.append(f"{nombre}/{etapa}: {previo * 1e3:.2f}ms → "
+                                   f"{medida['segundos'] * 1e3:.2f}ms")
+    return regresiones
+
+
+def imprimir_tabla(resultados: dict):
+    print(f"{'ESCENARIO':14} {'PRODS':>7} " + " ".join(f"{e.upper():>12}" for e in ETAPAS)
+          + f" {'MEM MÁX':>10}")
+    for nombre, datos in resultados['escenarios'].items():
+        etapas = datos['etapas']
+        pico = max(m['memoria_pico'] for m in etapas.values())
+        print(f"{nombre:14} {datos['producciones_originales']:>7} "
+              + " ".join(f"{etapas[e]['segundos'] * 1e3:>10.2f}ms" for e in ETAPAS)
+              + f" {pico / 1024:>8.0f}KB")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del flujo de simplificación")
+    parser.add_argument('-e', '--escenario', action='append', choices=sorted(ESCENARIOS),
+                        help="escenario a medir (por defecto, todos)")
+    parser.add_argument('--escala', type=float, default=1.0,
+                        help="multiplica el número de no terminales de cada escenario")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--semilla', type=int, default=0)
+    parser.add_argument('--motor', choices=motores_disponibles(), default='lineal',
+                        help="motor del análisis de anulables")
+    parser.add_argument('-j', '--trabajadores', type=int, default=1,
+                        help="procesos para generar las variantes (ver paralelo.py)")
+    parser.add_argument('--json', metavar='ARCHIVO', help="escribe los resultados en JSON")
+    parser.add_argument('--referencia', metavar='ARCHIVO',
+                        help="resultados JSON previos con los que comparar")
+    parser.add_argument('--tolerancia', type=float, default=1.5,
+                        help="factor de tiempo a partir del cual se reporta una regresión")
+    args = parser.parse_args(argv)
+
+    resultados = ejecutar(args.escenario or list(ESCENARIOS), args.escala,
+                          args.repeticiones, args.semilla, args.motor, args.trabajadores)
+    imprimir_tabla(resultados)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+
+    if args.referencia:
+        with open(args.referencia, 'r', encoding='utf-8') as f:
+            regresiones = comparar(resultados, json.load(f), args.tolerancia)
+        for regresion in regresiones:
+            print(f"✗ regresión en {regresion}")
+        return 1 if regresiones else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
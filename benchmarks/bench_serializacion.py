@@ -0,0 +1,62 @@
+# bench_serializacion.py
+"""
+Benchmark del formato binario .cfgb frente al texto
+Guarda y carga gramáticas sintéticas de tamaño creciente en binario
+(guardar_binario / cargar_binario) y en texto (escribir_texto y el
+validador) y compara tiempos y tamaños de archivo
+
+Uso: python benchmarks/bench_serializacion.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.generadores import generar_gramatica
+from gramatica import Gramatica
+from serializacion import cargar_binario, escribir_texto, guardar_binario
+from validador import ValidadorGramatica
+
+TAMANOS = [6250, 25000, 100000]     # no terminales, 4 producciones cada uno
+
+
+def main() -> int:
+    validador = ValidadorGramatica()
+    print(f"{'PRODUCCIONES':>12}  {'BINARIO':>17}  {'TEXTO':>17}  {'BYTES':>21}")
+    with tempfile.TemporaryDirectory() as directorio:
+        binario = os.path.join(directorio, 'g.cfgb')
+        texto = os.path.join(directorio, 'g.txt')
+        for tamano in TAMANOS:
+            gramatica = Gramatica()
+            for linea in generar_gramatica(no_terminales=tamano, producciones_por_nt=4):
+                cabeza, derecha = linea.split(' → ')
+                for produccion in derecha.split(' | '):
+                    gramatica.agregar_produccion(cabeza, produccion)
+
+            inicio = time.perf_counter()
+            guardar_binario(gramatica, binario)
+            guardar = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            cargada = cargar_binario(binario)
+            cargar = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            escribir_texto(gramatica, texto)
+            escribir = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            validador.cargar_gramatica(texto)
+            leer = time.perf_counter() - inicio
+
+            if cargada.num_producciones() != gramatica.num_producciones():
+                print("✗ la gramática cargada no coincide")
+                return 1
+            print(f"{gramatica.num_producciones():>12}  {guardar:>7.3f}s/{cargar:>7.3f}s  "
+                  f"{escribir:>7.3f}s/{leer:>7.3f}s  "
+                  f"{os.path.getsize(binario):>10}/{os.path.getsize(texto):<10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
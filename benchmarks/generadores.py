@@ -0,0 +1,81 @@
+# generadores.py
+"""
+Generadores de gramáticas sintéticas para los benchmarks
+Producen líneas en el formato de entrada ('A → α | β'), de modo que
+puedan escribirse a un archivo y pasar por todo el flujo de procesamiento
+"""
+import random
+from typing import List
+
+TERMINALES = 'abcdefghij0123456789'
+
+
+def generar_gramatica(no_terminales: int = 100, producciones_por_nt: int = 3,
+                      longitud: int = 4, densidad_anulable: float = 0.2,
+                      profundidad: int = 5, forma: str = 'ancha',
+                      semilla: int = 0) -> List[str]:
+    """
+    Genera las líneas de una gramática sintética
+    - no_terminales: cantidad de no terminales <N0>..<Nk>
+    - producciones_por_nt: alternativas por no terminal
+    - longitud: símbolos por producción (máximo en 'ancha')
+    - densidad_anulable: fracción de no terminales con una producción ε
+    - profundidad: niveles de la jerarquía; cada no terminal solo usa
+      no terminales de su nivel (recursión) o de niveles más profundos
+    - forma: 'ancha' (producciones largas) o 'cadenas' (muchas producciones
+      unitarias A → B que forman cadenas)
+    """
+    if forma not in ('ancha', 'cadenas'):
+        raise ValueError(f"forma desconocida: {forma}")
+
+    rng = random.Random(semilla)
+    profundidad = max(1, min(profundidad, no_terminales))
+    nombres = [f'<N{i}>' for i in range(no_terminales)]
+    nivel = [i * profundidad // no_terminales for i in range(no_terminales)]
+    # Primer índice de cada nivel, para elegir no terminales de niveles >= n
+    inicio_nivel = {}
+    for i, n in enumerate(nivel):
+        inicio_nivel.setdefault(n, i)
+
+    def no_terminal_desde(i: int) -> str:
+        return nombres[rng.randrange(inicio_nivel[nivel[i]], no_terminales)]
+
+    lineas = []
+    for i, nombre in enumerate(nombres):
+        alternativas = []
+        for k in range(producciones_por_nt):
+            if forma == 'cadenas' and k < producciones_por_nt - 1:
+                # Producción unitaria hacia el mismo nivel o uno más profundo
+                alternativas.append(no_terminal_desde(i))
+                continue
+            simbolos = []
+            largo = longitud if forma == 'ancha' else max(1, longitud // 2)
+            for _ in range(rng.randint(1, largo)):
+                if rng.random() < 0.5:
+                    simbolos.append(no_terminal_desde(i))
+                else:
+                    simbolos.append(rng.choice(TERMINALES))
+            alternativas.append(''.join(simbolos))
+
+        # El último nivel siempre tiene una salida terminal para ser productivo
+        if nivel[i] == profundidad - 1:
+            alternativas.append(rng.choice(TERMINALES))
+        if rng.random() < densidad_anulable:
+            alternativas.append('ε')
+        lineas.append(f"{nombre} → {' | '.join(alternativas)}")
+    return lineas
+
+
+# Escenarios predefinidos (el tamaño se multiplica por la escala del benchmark)
+ESCENARIOS = {
+    'pequena': dict(no_terminales=50, producciones_por_nt=3, longitud=4,
+                    densidad_anulable=0.2, profundidad=4, forma='ancha'),
+    'ancha': dict(no_terminales=500, producciones_por_nt=4, longitud=8,
+                  densidad_anulable=0.15, profundidad=6, forma='ancha'),
+    'cadenas': dict(no_terminales=1000, producciones_por_nt=4, longitud=4,
+                    densidad_anulable=0.2, profundidad=20, forma='cadenas'),
+    'muy_anulable': dict(no_terminales=300, producciones_por_nt=3, longitud=6,
+                         densidad_anulable=0.8, profundidad=3, forma='ancha'),
+    'profunda': dict(no_terminales=2000, producciones_por_nt=2, longitud=3,
+                     densidad_anulable=0.3, profundidad=200, forma='ancha'),
+}
@@ -0,0 +1,104 @@
+# cache.py
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+from gramatica import Gramatica
+from simplificador import VERSION_ALGORITMO
+
+EXTENSION = '.json'
+
+
+def huella_gramatica(gramatica: Gramatica) -> str:
+    """
+    Hash canónico de una gramática: no depende del orden de los no
+    terminales ni de sus producciones, e incluye la versión del algoritmo
+    """
+    nombres = gramatica.tabla.nombres
+    formatear = gramatica.tabla.formatear
+    h = hashlib.sha256()
+    h.update(f"v{VERSION_ALGORITMO}\x00{gramatica.simbolo_inicial}\x00".encode('utf-8'))
+    for no_terminal in gramatica.no_terminales_ordenados():
+        prods = sorted(formatear(p) for p in gramatica.producciones_de(no_terminal))
+        h.update(nombres[no_terminal].encode('utf-8'))
+        h.update(b'\x01')
+        h.update('\x02'.join(prods).encode('utf-8'))
+        h.update(b'\x00')
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché en disco de gramáticas simplificadas, un archivo JSON por huella
+    con el texto de salida y las estadísticas. Al superar max_bytes se
+    eliminan las entradas usadas hace más tiempo (LRU según mtime; cada
+    acierto actualiza el mtime de su entrada)
+    """
+
+    def __init__(self, directorio: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        os.makedirs(directorio, exist_ok=True)
+        self._bytes_estimados: Optional[int] = None
+
+    def _ruta(self, huella: str) -> str:
+        return os.path.join(self.directorio, huella + EXTENSION)
+
+    def obtener(self, huella: str) -> Optional[Tuple[str, Dict[str, int]]]:
+        """(texto de la gramática simplificada, estadísticas) o None si no está"""
+        ruta = self._ruta(huella)
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+            os.utime(ruta)
+        except (OSError, ValueError):
+            return None
+        if entrada.get("version") != VERSION_ALGORITMO:
+            return None
+        return entrada["gramatica"], entrada["estadisticas"]
+
+    def guardar(self, huella: str, texto: str, estadisticas: Dict[str, int]):
+        """Guarda una entrada de forma atómica y poda la caché si hace falta"""
+        contenido = json.dumps({"version": VERSION_ALGORITMO, "gramatica": texto,
+                                "estadisticas": estadisticas}, ensure_ascii=False)
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix='.tmp')
+        with os.fdopen(descriptor, 'w', encoding='utf-8') as f:
+            f.write(contenido)
+        os.replace(temporal, self._ruta(huella))
+
+        if self._bytes_estimados is None:
+            self._bytes_estimados = self.tamano()
+        else:
+            self._bytes_estimados += len(contenido.encode('utf-8'))
+        if self._bytes_estimados > self.max_bytes:
+            self.podar()
+
+    def tamano(self) -> int:
+        """Bytes ocupados por las entradas de la caché"""
+        return sum(tamano for _, tamano, _ in self._entradas())
+
+    def podar(self):
+        """Elimina las entradas menos usadas hasta quedar bajo el límite"""
+        entradas = sorted(self._entradas(), key=lambda e: e[2])
+        total = sum(tamano for _, tamano, _ in entradas)
+        for ruta, tamano, _ in entradas:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                continue
+            total -= tamano
+        self._bytes_estimados = total
+
+    def _entradas(self):
+        """(ruta, tamaño, mtime) de cada entrada"""
+        with os.scandir(self.directorio) as it:
+            for entrada in it:
+                if entrada.name.endswith(EXTENSION):
+                    try:
+                        info = entrada.stat()
+                    except OSError:
+                        continue
+                    yield entrada.path, info.st_size, info.st_mtime
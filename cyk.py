@@ -0,0 +1,122 @@
+# cyk.py
+from typing import Dict, Iterable, List, Tuple
+from gramatica import Gramatica
+from normalizador import ConvertidorFNC
+
+
+class ReconocedorCYK:
+    """
+    Reconocedor CYK sobre la FNC de una gramática
+    Cada celda de la tabla es un conjunto de no terminales codificado como
+    entero (bit i = no terminal i). La tabla se llena por columnas (fin del
+    intervalo), de modo que las columnas de un prefijo común se reutilizan
+    entre cadenas consecutivas en orden lexicográfico
+    """
+
+    MAX_MEMO = 1 << 20
+
+    def __init__(self, gramatica: Gramatica):
+        self.acepta_vacia = gramatica.inicial in gramatica.obtener_anulables_ids()
+
+        fnc = ConvertidorFNC().convertir(gramatica)
+        nombres = fnc.tabla.nombres
+        bits = {nt: i for i, nt in enumerate(nt for nt, _ in fnc.bloques())}
+        self._inicial = 1 << bits[fnc.inicial] if fnc.inicial in bits else 0
+
+        # Reglas A → a: terminal -> conjunto de A
+        self._terminales: Dict[str, int] = {}
+        # Reglas A → BC agrupadas por B: bit de B -> (conjunto de C, {C: conjunto de A})
+        pares: Dict[int, Dict[int, int]] = {}
+        for nt, bloque in fnc.bloques():
+            bit_a = 1 << bits[nt]
+            for prod in bloque:
+                if len(prod) == 1:
+                    terminal = nombres[prod[0]]
+                    self._terminales[terminal] = self._terminales.get(terminal, 0) | bit_a
+                elif prod[0] in bits and prod[1] in bits:
+                    por_c = pares.setdefault(bits[prod[0]], {})
+                    c = bits[prod[1]]
+                    por_c[c] = por_c.get(c, 0) | bit_a
+
+        self._reglas: List[Tuple[int, Dict[int, int]]] = [(0, {})] * len(bits)
+        for b, por_c in pares.items():
+            mascara = 0
+            for c in por_c:
+                mascara |= 1 << c
+            self._reglas[b] = (mascara, por_c)
+
+        self._memo: Dict[Tuple[int, int], int] = {}
+
+        # Columnas de la última cadena reconocida (para compartir prefijos)
+        self._cadena = ""
+        self._columnas: List[List[int]] = [[]]
+        # Celdas de la tabla calculadas en total (las reutilizadas no cuentan)
+        self.celdas_calculadas = 0
+
+    def acepta(self, cadena: str) -> bool:
+        """Indica si la cadena pertenece al lenguaje de la gramática"""
+        if not cadena:
+            return self.acepta_vacia
+        self._llenar(cadena)
+        return bool(self._columnas[len(cadena)][0] & self._inicial)
+
+    def acepta_varias(self, cadenas: Iterable[str]) -> List[bool]:
+        """Reconoce varias cadenas ordenándolas para compartir prefijos"""
+        cadenas = list(cadenas)
+        resultados = [False] * len(cadenas)
+        for i in sorted(range(len(cadenas)), key=cadenas.__getitem__):
+            resultados[i] = self.acepta(cadenas[i])
+        return resultados
+
+    def _llenar(self, cadena: str):
+        """Calcula las columnas de la cadena reutilizando el prefijo común"""
+        anterior = self._cadena
+        comun = 0
+        limite = min(len(anterior), len(cadena))
+        while comun < limite and anterior[comun] == cadena[comun]:
+            comun += 1
+
+        columnas = self._columnas
+        del columnas[comun + 1:]
+        combinar = self._combinar
+        for j in range(comun + 1, len(cadena) + 1):
+            # columna[i] = no terminales que generan cadena[i:j]
+            columna = [0] * j
+            columna[j - 1] = self._terminales.get(cadena[j - 1], 0)
+            for i in range(j - 2, -1, -1):
+                celda = 0
+                for k in range(i + 1, j):
+                    izquierda = columnas[k][i]
+                    if izquierda:
+                        derecha = columna[k]
+                        if derecha:
+                            celda |= combinar(izquierda, derecha)
+                columna[i] = celda
+            columnas.append(columna)
+            self.celdas_calculadas += j
+        self._cadena = cadena
+
+    def _combinar(self, izquierda: int, derecha: int) -> int:
+        """Conjunto de A con A → BC, B en izquierda y C en derecha (memoizado)"""
+        clave = (izquierda, derecha)
+        resultado = self._memo.get(clave)
+        if resultado is not None:
+            return resultado
+
+        resultado = 0
+        reglas = self._reglas
+        restantes = izquierda
+        while restantes:
+            bit = restantes & -restantes
+            restantes ^= bit
+            mascara, por_c = reglas[bit.bit_length() - 1]
+            comunes = mascara & derecha
+            while comunes:
+                bit_c = comunes & -comunes
+                comunes ^= bit_c
+                resultado |= por_c[bit_c.bit_length() - 1]
+
+        if len(self._memo) >= self.MAX_MEMO:
+            self._memo.clear()
+        self._memo[clave] = resultado
+        return resultado
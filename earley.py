@@ -0,0 +1,368 @@
+# earley.py
+from array import array
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Union
+from gramatica import Gramatica
+
+# Nodos del bosque: (símbolo, i, j) para símbolos y (producción, punto, i, j)
+# para los nodos intermedios del bosque binarizado
+Nodo = Tuple[int, ...]
+# Nodo empaquetado: (producción, hijo izquierdo o None, hijo derecho o None)
+Familia = Tuple[int, Optional[Nodo], Optional[Nodo]]
+
+
+class BosqueSPPF:
+    """
+    Bosque de análisis compartido y empaquetado (SPPF binarizado)
+    Cada nodo tiene una familia por forma de derivarlo; los subárboles
+    comunes se comparten, así el tamaño es polinomial aunque la cantidad de
+    árboles sea exponencial (o infinita en gramáticas cíclicas)
+    """
+
+    def __init__(self, gramatica: Gramatica, raiz: Nodo, familias: Dict[Nodo, List[Familia]]):
+        self.gramatica = gramatica
+        self.raiz = raiz
+        self.familias = familias
+
+    def __len__(self) -> int:
+        return len(self.familias)
+
+    def es_ambiguo(self) -> bool:
+        """Hay más de un árbol para la entrada"""
+        return any(len(familias) > 1 for familias in self.familias.values())
+
+    def contar_arboles(self) -> Union[int, float]:
+        """Número de árboles de derivación (inf si la gramática es cíclica)"""
+        cuentas: Dict[Nodo, int] = {}
+        en_curso: Set[Nodo] = set()
+        pila = [self.raiz]
+        while pila:
+            nodo = pila[-1]
+            if nodo in cuentas:
+                pila.pop()
+                continue
+            hijos = [h for _, izq, der in self.familias[nodo] for h in (izq, der)
+                     if h is not None and h not in cuentas]
+            if hijos:
+                if nodo in en_curso:
+                    # Se volvió a él sin poder resolver sus hijos: hay un ciclo
+                    return float('inf')
+                en_curso.add(nodo)
+                pila.extend(hijos)
+                continue
+            pila.pop()
+            en_curso.discard(nodo)
+            familias = self.familias[nodo]
+            if not familias:
+                cuentas[nodo] = 1   # hoja terminal
+                continue
+            total = 0
+            for _, izq, der in familias:
+                total += (cuentas[izq] if izq is not None else 1) * \
+                         (cuentas[der] if der is not None else 1)
+            cuentas[nodo] = total
+        return cuentas[self.raiz]
+
+    def arbol(self) -> tuple:
+        """
+        Un árbol de derivación como tuplas anidadas (no terminal, [hijos]),
+        con los terminales como texto. Se eligen familias que llevan a un
+        árbol finito aunque el bosque tenga ciclos
+        """
+        nombres = self.gramatica.tabla.nombres
+        elegida = self._familias_finitas()
+
+        def hijos_de(nodo: Nodo) -> List[Nodo]:
+            # Aplana la cadena de nodos intermedios en los símbolos del lado derecho
+            simbolos = []
+            while nodo is not None:
+                _, izq, der = elegida[nodo]
+                if der is not None:
+                    simbolos.append(der)
+                nodo = izq
+            simbolos.reverse()
+            return simbolos
+
+        raiz_arbol = (nombres[self.raiz[0]], [])
+        pila = [(self.raiz, raiz_arbol[1])]
+        while pila:
+            nodo, destino = pila.pop()
+            for hijo in hijos_de(nodo):
+                if not self.familias[hijo]:
+                    destino.append(nombres[hijo[0]])
+                else:
+                    subarbol = (nombres[hijo[0]], [])
+                    destino.append(subarbol)
+                    pila.append((hijo, subarbol[1]))
+        return raiz_arbol
+
+    def _familias_finitas(self) -> Dict[Nodo, Familia]:
+        """
+        Para cada nodo, una familia cuyos hijos ya tienen un árbol finito
+        (punto fijo de abajo hacia arriba, como el cálculo de generadores)
+        """
+        elegida: Dict[Nodo, Familia] = {}
+        padres: Dict[Nodo, List[Tuple[Nodo, Familia]]] = {}
+        pendientes: Dict[Tuple[Nodo, Familia], int] = {}
+        trabajo: List[Nodo] = []
+        for nodo, familias in self.familias.items():
+            if not familias:
+                trabajo.append(nodo)
+                continue
+            for familia in familias:
+                hijos = [h for h in familia[1:] if h is not None]
+                pendientes[(nodo, familia)] = len(hijos)
+                for hijo in hijos:
+                    padres.setdefault(hijo, []).append((nodo, familia))
+                if not hijos and nodo not in elegida:
+                    elegida[nodo] = familia
+                    trabajo.append(nodo)
+
+        while trabajo:
+            hijo = trabajo.pop()
+            for clave in padres.pop(hijo, ()):
+                pendientes[clave] -= 1
+                nodo, familia = clave
+                if pendientes[clave] == 0 and nodo not in elegida:
+                    elegida[nodo] = familia
+                    trabajo.append(nodo)
+        return elegida
+
+
+class ReconocedorEarley:
+    """
+    Reconocedor Earley sobre la gramática tal como se cargó (sin FNC)
+    Los ítems se numeran de forma global (producción, punto) -> entero, y
+    para cada no terminal se precalcula una vez su tabla de predicción: los
+    ítems que se agregan al predecirlo, ya avanzados sobre los símbolos
+    anulables (Aycock y Horspool), así las producciones-ε no necesitan un
+    tratamiento especial al completar
+    """
+
+    def __init__(self, gramatica: Gramatica):
+        self.gramatica = gramatica
+        self._es_no_terminal = gramatica.tabla.no_terminal
+        self._anulables = gramatica.obtener_anulables_ids()
+        self.posicion_error = -1
+        # Ítems (ítem, origen) de todos los conjuntos del último reconocimiento
+        self.items_procesados = 0
+
+        self._siguiente = array('i')   # ítem -> símbolo tras el punto (-1 si está completo)
+        self._produccion = array('i')  # ítem -> producción
+        self._primer_item: List[int] = []
+        self._producciones: List[Tuple[int, Tuple[int, ...]]] = []
+        self._por_cabeza: Dict[int, List[int]] = {}
+        for nt, bloque in gramatica.bloques():
+            for prod in bloque:
+                p = len(self._producciones)
+                self._producciones.append((nt, tuple(prod)))
+                self._primer_item.append(len(self._siguiente))
+                self._por_cabeza.setdefault(nt, []).append(p)
+                for simbolo in prod:
+                    self._siguiente.append(simbolo)
+                    self._produccion.append(p)
+                self._siguiente.append(-1)
+                self._produccion.append(p)
+
+        self._prediccion: Dict[int, Tuple[Tuple[int, ...], FrozenSet[int]]] = {}
+
+    def _predecir(self, no_terminal: int) -> Tuple[Tuple[int, ...], FrozenSet[int]]:
+        """
+        Tabla de predicción de un no terminal (se calcula una sola vez):
+        los ítems a agregar y los no terminales que quedan predichos
+        """
+        tabla = self._prediccion.get(no_terminal)
+        if tabla is not None:
+            return tabla
+
+        es_no_terminal = self._es_no_terminal
+        anulables = self._anulables
+        predichos = [no_terminal]
+        vistos = {no_terminal}
+        items: List[int] = []
+        for nt in predichos:
+            for p in self._por_cabeza.get(nt, ()):
+                item = self._primer_item[p]
+                for simbolo in self._producciones[p][1]:
+                    items.append(item)
+                    if es_no_terminal[simbolo] and simbolo not in vistos:
+                        vistos.add(simbolo)
+                        predichos.append(simbolo)
+                    if simbolo not in anulables:
+                        break
+                    item += 1
+                else:
+                    items.append(item)
+        tabla = self._prediccion[no_terminal] = (tuple(items), frozenset(vistos))
+        return tabla
+
+    def _simbolos(self, entrada: Union[str, Sequence[str]]) -> Optional[List[int]]:
+        """Ids de los terminales de la entrada (None si alguno no existe)"""
+        ids = self.gramatica.tabla.ids
+        simbolos = []
+        for token in entrada:
+            ident = ids.get(token)
+            if ident is None or self._es_no_terminal[ident]:
+                self.posicion_error = len(simbolos)
+                return None
+            simbolos.append(ident)
+        return simbolos
+
+    def acepta(self, entrada: Union[str, Sequence[str]]) -> bool:
+        """
+        Indica si la entrada (una cadena, un carácter por terminal, o una
+        secuencia de nombres de terminales) pertenece al lenguaje
+        """
+        simbolos = self._simbolos(entrada)
+        return simbolos is not None and self._reconocer(simbolos, None)
+
+    def analizar(self, entrada: Union[str, Sequence[str]]) -> Optional[BosqueSPPF]:
+        """Bosque de análisis de la entrada, o None si no pertenece al lenguaje"""
+        simbolos = self._simbolos(entrada)
+        if simbolos is None:
+            return None
+        registro: Tuple[List[Set[Tuple[int, int]]], List[Dict[int, Set[int]]]] = ([], [])
+        if not self._reconocer(simbolos, registro):
+            return None
+        return self._construir_bosque(simbolos, *registro)
+
+    def _reconocer(self, simbolos: List[int],
+                   registro: Optional[Tuple[List[Set[Tuple[int, int]]],
+                                            List[Dict[int, Set[int]]]]]) -> bool:
+        """
+        Construye los conjuntos de Earley. Solo se conserva de cada conjunto
+        pasado el índice no terminal -> ítems que lo esperan (para completar);
+        con registro se guardan además los ítems y las compleciones de cada
+        conjunto, necesarios para construir el bosque
+        """
+        inicial = self.gramatica.inicial
+        self.posicion_error = -1
+        self.items_procesados = 0
+        if inicial not in self._por_cabeza:
+            self.posicion_error = 0
+            return False
+
+        siguiente = self._siguiente
+        produccion = self._produccion
+        producciones = self._producciones
+        es_no_terminal = self._es_no_terminal
+        anulables = self._anulables
+        predecir = self._predecir
+        n = len(simbolos)
+
+        esperando: List[Dict[int, List[Tuple[int, int]]]] = []
+        items, _ = predecir(inicial)
+        actual = [(item, 0) for item in items]
+        aceptada = False
+
+        for j in range(n + 1):
+            vistos = set(actual)
+            trabajo = actual
+            espera_j: Dict[int, List[Tuple[int, int]]] = {}
+            por_terminal: Dict[int, List[Tuple[int, int]]] = {}
+            completos_j: Dict[int, Set[int]] = {}
+            predichos: Set[int] = set()
+            esperando.append(espera_j)
+
+            k = 0
+            while k < len(trabajo):
+                item, origen = trabajo[k]
+                k += 1
+                simbolo = siguiente[item]
+                if simbolo < 0:
+                    cabeza = producciones[produccion[item]][0]
+                    if registro is not None:
+                        completos_j.setdefault(cabeza, set()).add(origen)
+                    if j == n and origen == 0 and cabeza == inicial:
+                        aceptada = True
+                    # Con origen == j los anulables ya se avanzaron al predecir
+                    if origen == j:
+                        continue
+                    for previo, origen_previo in esperando[origen].get(cabeza, ()):
+                        nuevo = (previo + 1, origen_previo)
+                        if nuevo not in vistos:
+                            vistos.add(nuevo)
+                            trabajo.append(nuevo)
+                elif es_no_terminal[simbolo]:
+                    espera_j.setdefault(simbolo, []).append((item, origen))
+                    if simbolo not in predichos:
+                        items, nuevos_predichos = predecir(simbolo)
+                        predichos.update(nuevos_predichos)
+                        for predicho in items:
+                            nuevo = (predicho, j)
+                            if nuevo not in vistos:
+                                vistos.add(nuevo)
+                                trabajo.append(nuevo)
+                    if simbolo in anulables:
+                        nuevo = (item + 1, origen)
+                        if nuevo not in vistos:
+                            vistos.add(nuevo)
+                            trabajo.append(nuevo)
+                else:
+                    por_terminal.setdefault(simbolo, []).append((item, origen))
+            self.items_procesados += len(trabajo)
+
+            if registro is not None:
+                registro[0].append(vistos)
+                registro[1].append(completos_j)
+            if j == n:
+                break
+            actual = [(item + 1, origen) for item, origen in por_terminal.get(simbolos[j], ())]
+            if not actual:
+                self.posicion_error = j
+                return False
+
+        if not aceptada:
+            self.posicion_error = n
+        return aceptada
+
+    def _construir_bosque(self, simbolos: List[int], conjuntos: List[Set[Tuple[int, int]]],
+                          completos: List[Dict[int, Set[int]]]) -> BosqueSPPF:
+        """Construye el bosque desde la raíz, visitando solo los nodos útiles"""
+        es_no_terminal = self._es_no_terminal
+        primer_item = self._primer_item
+        producciones = self._producciones
+
+        def descomponer(p: int, punto: int, i: int, j: int) -> List[Familia]:
+            """Familias del ítem (p, punto) con origen i en el conjunto j"""
+            simbolo = producciones[p][1][punto - 1]
+            previo = primer_item[p] + punto - 1
+            if es_no_terminal[simbolo]:
+                cortes = [k for k in completos[j].get(simbolo, ()) if k >= i]
+            else:
+                cortes = [j - 1] if j > i and simbolos[j - 1] == simbolo else []
+            familias = []
+            for k in sorted(cortes):
+                if (previo, i) not in conjuntos[k]:
+                    continue
+                izquierda = None if punto == 1 else (p, punto - 1, i, k)
+                familias.append((p, izquierda, (simbolo, k, j)))
+            return familias
+
+        raiz = (self.gramatica.inicial, 0, len(simbolos))
+        familias: Dict[Nodo, List[Familia]] = {}
+        pila = [raiz]
+        while pila:
+            nodo = pila.pop()
+            if nodo in familias:
+                continue
+            if len(nodo) == 4:
+                nuevas = descomponer(*nodo)
+            else:
+                x, i, j = nodo
+                nuevas = []
+                if es_no_terminal[x]:
+                    for p in self._por_cabeza.get(x, ()):
+                        largo = len(producciones[p][1])
+                        if (primer_item[p] + largo, i) not in conjuntos[j]:
+                            continue
+                        if largo == 0:
+                            nuevas.append((p, None, None))
+                        else:
+                            nuevas.extend(descomponer(p, largo, i, j))
+            familias[nodo] = nuevas
+            for _, izquierda, derecha in nuevas:
+                for hijo in (izquierda, derecha):
+                    if hijo is not None and hijo not in familias:
+                        pila.append(hijo)
+
+        return BosqueSPPF(self.gramatica, raiz, familias)
@@ -0,0 +1,291 @@
+# enumeracion.py
+import random
+from bisect import bisect_right
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from gramatica import Gramatica
+from normalizador import ConvertidorFNC
+
+
+class EnumeradorLenguaje:
+    """
+    Enumeración y muestreo uniforme del lenguaje de una gramática sobre su
+    FNC (reglas A → BC | a), por programación dinámica sobre la longitud:
+    - árboles[l][A]: número de árboles de derivación de A de longitud l
+    - cadenas[l][A]: conjunto de cadenas de longitud l que genera A
+    Una cadena de longitud l generada por A → BC se parte en k + (l - k),
+    así cada tabla se llena a partir de las de longitudes menores
+    La cadena vacía no está en la FNC: se decide por el inicial anulable
+    """
+
+    def __init__(self, gramatica: Gramatica, longitud_maxima: int):
+        self.longitud_maxima = longitud_maxima
+        self.acepta_vacia = gramatica.inicial in gramatica.obtener_anulables_ids()
+        self.intentos = 0        # árboles muestreados
+        self.aceptadas = 0       # de ellos, los que superaron el rechazo
+
+        fnc = ConvertidorFNC().convertir(gramatica)
+        nombres = fnc.tabla.nombres
+        indices = {nt: i for i, nt in enumerate(nt for nt, _ in fnc.bloques())}
+        self._inicial = indices.get(fnc.inicial, -1)
+
+        self._terminales: List[List[str]] = [[] for _ in indices]           # A → a
+        self._binarias: List[List[Tuple[int, int]]] = [[] for _ in indices]  # A → BC
+        self._por_terminal: Dict[str, List[int]] = {}
+        self._por_izquierda: Dict[int, List[Tuple[int, int]]] = {}          # B -> [(A, C)]
+        for nt, bloque in fnc.bloques():
+            a = indices[nt]
+            for prod in bloque:
+                if len(prod) == 1:
+                    self._terminales[a].append(nombres[prod[0]])
+                    self._por_terminal.setdefault(nombres[prod[0]], []).append(a)
+                elif prod[0] in indices and prod[1] in indices:
+                    b, c = indices[prod[0]], indices[prod[1]]
+                    self._binarias[a].append((b, c))
+                    self._por_izquierda.setdefault(b, []).append((a, c))
+
+        self._arboles: List[List[int]] = [[0] * len(indices)]
+        for longitud in range(1, longitud_maxima + 1):
+            self._arboles.append(self._contar(longitud))
+        self._cadenas: List[List[FrozenSet[str]]] = [[]]
+        self._opciones: Dict[Tuple[int, int], Tuple[List[int], list]] = {}
+
+    def _contar(self, longitud: int) -> List[int]:
+        if longitud == 1:
+            return [len(terminales) for terminales in self._terminales]
+        arboles = self._arboles
+        fila = []
+        for binarias in self._binarias:
+            total = 0
+            for b, c in binarias:
+                for k in range(1, longitud):
+                    total += arboles[k][b] * arboles[longitud - k][c]
+            fila.append(total)
+        return fila
+
+    def _verificar(self, longitud: int):
+        if not 0 <= longitud <= self.longitud_maxima:
+            raise ValueError(f"Longitud fuera de rango: {longitud} "
+                             f"(el enumerador llega hasta {self.longitud_maxima})")
+
+    def contar_derivaciones(self, longitud: int) -> int:
+        """Árboles de derivación del inicial con exactamente esa longitud"""
+        self._verificar(longitud)
+        if longitud == 0:
+            return int(self.acepta_vacia)
+        return self._arboles[longitud][self._inicial] if self._inicial >= 0 else 0
+
+    def cadenas(self, longitud: int) -> FrozenSet[str]:
+        """Cadenas del lenguaje con exactamente esa longitud"""
+        self._verificar(longitud)
+        if longitud == 0:
+            return frozenset({''}) if self.acepta_vacia else frozenset()
+        if self._inicial < 0:
+            return frozenset()
+        while len(self._cadenas) <= longitud:
+            self._cadenas.append(self._generar(len(self._cadenas)))
+        return self._cadenas[longitud][self._inicial]
+
+    def _generar(self, longitud: int) -> List[FrozenSet[str]]:
+        if longitud == 1:
+            return [frozenset(terminales) for terminales in self._terminales]
+        arboles = self._arboles
+        cadenas = self._cadenas
+        fila = []
+        for a, binarias in enumerate(self._binarias):
+            conjunto: Set[str] = set()
+            if arboles[longitud][a]:
+                for b, c in binarias:
+                    for k in range(1, longitud):
+                        if arboles[k][b] and arboles[longitud - k][c]:
+                            derechas = cadenas[longitud - k][c]
+                            conjunto.update(x + y for x in cadenas[k][b] for y in derechas)
+            fila.append(frozenset(conjunto))
+        return fila
+
+    def lenguaje(self, longitud: Optional[int] = None) -> Set[str]:
+        """Todas las cadenas del lenguaje de longitud <= longitud"""
+        longitud = self.longitud_maxima if longitud is None else longitud
+        resultado: Set[str] = set()
+        for n in range(longitud + 1):
+            resultado |= self.cadenas(n)
+        return resultado
+
+    def contar_arboles(self, cadena: str) -> int:
+        """
+        Árboles de derivación de la cadena en la FNC (CYK con cuentas)
+        Para cada inicio i se guardan solo los tramos cadena[i:k] con algún
+        B que empieza una regla A → BC, así en gramáticas lineales cada
+        celda cuesta O(1) y no O(longitud)
+        """
+        if not cadena:
+            return int(self.acepta_vacia)
+        n = len(cadena)
+        por_izquierda = self._por_izquierda
+        # celdas[i][j] = {A: árboles de A que generan cadena[i:j]}
+        celdas: List[List[Dict[int, int]]] = [[{}] * (n + 1) for _ in range(n)]
+        # izquierdas[i] = [(k, [(reglas A → BC de B, árboles de B en cadena[i:k])])]
+        izquierdas: List[List[Tuple[int, list]]] = [[] for _ in range(n)]
+
+        for ancho in range(1, n + 1):
+            for i in range(n - ancho + 1):
+                j = i + ancho
+                if ancho == 1:
+                    celda = dict.fromkeys(self._por_terminal.get(cadena[i], ()), 1)
+                else:
+                    celda = {}
+                    for k, reglas in izquierdas[i]:
+                        derecha = celdas[k][j]
+                        if not derecha:
+                            continue
+                        for padres, cuenta_b in reglas:
+                            for a, c in padres:
+                                cuenta_c = derecha.get(c)
+                                if cuenta_c:
+                                    celda[a] = celda.get(a, 0) + cuenta_b * cuenta_c
+                if celda:
+                    celdas[i][j] = celda
+                    reglas = [(por_izquierda[b], cuenta) for b, cuenta in celda.items()
+                              if b in por_izquierda]
+                    if reglas:
+                        izquierdas[i].append((j, reglas))
+        return celdas[0][n].get(self._inicial, 0)
+
+    def muestrear(self, rng: random.Random, longitud: Optional[int] = None,
+                  max_intentos: Optional[int] = None) -> Optional[str]:
+        """
+        Cadena elegida con distribución uniforme entre las de esa longitud
+        (o entre todas las de longitud <= longitud_maxima); None si no hay
+        o si se agotan los intentos
+        Se elige un árbol de derivación uniforme y se acepta con
+        probabilidad 1 / (árboles de su cadena): cada intento devuelve una
+        cadena w con probabilidad árboles(w)/T · 1/árboles(w) = 1/T, igual
+        para todas. Si la FNC no es ambigua nunca se rechaza; si es muy
+        ambigua la tasa de aceptación (cadenas / árboles) puede ser ínfima
+        """
+        longitudes = [longitud] if longitud is not None else range(self.longitud_maxima + 1)
+        acumulados = []
+        total = 0
+        for n in longitudes:
+            total += self.contar_derivaciones(n)
+            acumulados.append(total)
+        if not total:
+            return None
+
+        intentos = 0
+        while max_intentos is None or intentos < max_intentos:
+            intentos += 1
+            self.intentos += 1
+            n = longitudes[bisect_right(acumulados, rng.randrange(total))]
+            cadena = self._derivar(rng, n)
+            arboles = self.contar_arboles(cadena) if n > 1 else 1
+            if arboles == 1 or rng.randrange(arboles) == 0:
+                self.aceptadas += 1
+                return cadena
+        return None
+
+    def _derivar(self, rng: random.Random, longitud: int) -> str:
+        """Árbol de derivación uniforme de esa longitud (sin recursión)"""
+        if longitud == 0:
+            return ''
+        partes = []
+        pila = [(self._inicial, longitud)]
+        while pila:
+            a, n = pila.pop()
+            acumulados, opciones = self._elecciones(a, n)
+            eleccion = opciones[bisect_right(acumulados, rng.randrange(acumulados[-1]))]
+            if n == 1:
+                partes.append(eleccion)
+            else:
+                b, c, k = eleccion
+                # B se apila último: su subárbol se escribe antes que el de C
+                pila.append((c, n - k))
+                pila.append((b, k))
+        return ''.join(partes)
+
+    def _elecciones(self, a: int, longitud: int) -> Tuple[List[int], list]:
+        """Reglas de A (con el punto de corte) y sus pesos acumulados"""
+        clave = (a, longitud)
+        guardadas = self._opciones.get(clave)
+        if guardadas is not None:
+            return guardadas
+        if longitud == 1:
+            opciones: list = self._terminales[a]
+            acumulados = list(range(1, len(opciones) + 1))
+        else:
+            arboles = self._arboles
+            opciones, acumulados = [], []
+            total = 0
+            for b, c in self._binarias[a]:
+                for k in range(1, longitud):
+                    peso = arboles[k][b] * arboles[longitud - k][c]
+                    if peso:
+                        total += peso
+                        acumulados.append(total)
+                        opciones.append((b, c, k))
+        self._opciones[clave] = (acumulados, opciones)
+        return acumulados, opciones
+
+
+class ComparacionLenguajes:
+    """Resultado de comparar dos gramáticas cadena por cadena"""
+    __slots__ = ('longitud', 'enumeradas', 'muestreadas', 'muestreo_incompleto',
+                 'solo_original', 'solo_simplificada')
+
+    def __init__(self, longitud: int):
+        self.longitud = longitud
+        self.enumeradas = 0
+        self.muestreadas = 0
+        self.muestreo_incompleto = False   # una gramática agotó los intentos
+        self.solo_original: Set[str] = set()
+        self.solo_simplificada: Set[str] = set()
+
+    @property
+    def equivalentes(self) -> bool:
+        return not self.solo_original and not self.solo_simplificada
+
+
+def comparar_gramaticas(original: Gramatica, simplificada: Gramatica, longitud: int,
+                        muestras: int = 0, longitud_muestreo: Optional[int] = None,
+                        semilla: int = 0, ignorar_vacia: bool = True,
+                        max_intentos: int = 10000) -> ComparacionLenguajes:
+    """
+    Comparación diferencial de dos gramáticas:
+    - exhaustiva: todas las cadenas de longitud <= longitud de cada una
+    - por muestreo: `muestras` cadenas uniformes de cada gramática, de
+      longitud <= max(longitud, longitud_muestreo), reconocidas en la otra
+      contando sus árboles (el muestreo solo necesita las cuentas, no los
+      conjuntos).
+      Si una muestra agota max_intentos por el rechazo, se deja de muestrear
+      esa gramática y se marca muestreo_incompleto
+    Con ignorar_vacia la cadena vacía no cuenta como diferencia, porque la
+    eliminación de producciones-ε genera L(G) - {ε}
+    """
+    longitud_muestreo = longitud if longitud_muestreo is None else longitud_muestreo
+    maxima = max(longitud, longitud_muestreo if muestras else 0)
+    enumeradores = (EnumeradorLenguaje(original, maxima), EnumeradorLenguaje(simplificada, maxima))
+    resultado = ComparacionLenguajes(longitud)
+
+    for n in range(1 if ignorar_vacia else 0, longitud + 1):
+        de_original = enumeradores[0].cadenas(n)
+        de_simplificada = enumeradores[1].cadenas(n)
+        resultado.enumeradas += len(de_original | de_simplificada)
+        resultado.solo_original |= de_original - de_simplificada
+        resultado.solo_simplificada |= de_simplificada - de_original
+
+    if muestras:
+        rng = random.Random(semilla)
+        pares = ((enumeradores[0], enumeradores[1], resultado.solo_original),
+                 (enumeradores[1], enumeradores[0], resultado.solo_simplificada))
+        for enumerador, otro, diferencias in pares:
+            extraidas = []
+            for _ in range(muestras):
+                cadena = enumerador.muestrear(rng, None, max_intentos)
+                if cadena is None:
+                    # Sin intentos es que el lenguaje no tiene cadenas en el rango
+                    resultado.muestreo_incompleto |= enumerador.intentos > 0
+                    break
+                if cadena or not ignorar_vacia:
+                    extraidas.append(cadena)
+            resultado.muestreadas += len(extraidas)
+            diferencias.update(c for c in extraidas if not otro.contar_arboles(c))
+    return resultado
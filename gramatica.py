@@ -1,93 +1,414 @@
 # gramatica.py
-from typing import Dict, List, Set, Tuple
-import re
+from array import array
+from string import ascii_letters, digits
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+EPSILON = 'ε'
+
+# Caracteres permitidos en los nombres de no terminales <nombre>
+CARACTERES_NOMBRE = frozenset(ascii_letters + digits + '_')
+
+
+def es_nombre_no_terminal(nombre: str) -> bool:
+    """Un no terminal es una mayúscula o un nombre entre < >, p. ej. <Expr>"""
+    if len(nombre) > 2 and nombre[0] == '<' and nombre[-1] == '>':
+        return True
+    return len(nombre) == 1 and nombre.isupper()
+
+
+def tokenizar(cadena: str) -> List[str]:
+    """
+    Separa el lado derecho de una producción en símbolos
+    Cada carácter es un símbolo salvo los nombres entre < >; se ignoran
+    los espacios. Los caracteres < y > solo pueden delimitar un nombre y ε
+    solo puede aparecer como producción completa, así el formato de texto
+    no es ambiguo
+    """
+    cadena = cadena.strip()
+    if cadena == EPSILON:
+        return []
+
+    simbolos = []
+    i = 0
+    n = len(cadena)
+    while i < n:
+        char = cadena[i]
+        if char == '<':
+            fin = i + 1
+            while fin < n and cadena[fin] in CARACTERES_NOMBRE:
+                fin += 1
+            if fin == i + 1 or fin == n or cadena[fin] != '>':
+                raise ValueError(f"'<' sin nombre válido en la posición {i}: {cadena}")
+            simbolos.append(cadena[i:fin + 1])
+            i = fin + 1
+            continue
+        if char == '>':
+            raise ValueError(f"'>' suelto en la posición {i}: {cadena}")
+        if char == EPSILON:
+            raise ValueError(f"ε solo puede aparecer como producción completa: {cadena}")
+        if not char.isspace():
+            simbolos.append(char)
+        i += 1
+    return simbolos
+
+
+class TablaSimbolos:
+    """Internado de símbolos: cada nombre se asocia a un entero estable"""
+    __slots__ = ('nombres', 'ids', 'no_terminal', '_contadores')
 
-class Gramatica:
     def __init__(self):
-        self.producciones: Dict[str, List[str]] = {}
-        self.simbolo_inicial: str = ""
-        self.terminales: Set[str] = set()
-        self.no_terminales: Set[str] = set()
-    
+        self.nombres: List[str] = []
+        self.ids: Dict[str, int] = {}
+        self.no_terminal = bytearray()
+        self._contadores: Dict[str, int] = {}   # prefijo -> siguiente sufijo libre
+
+    def internar(self, nombre: str) -> int:
+        """Devuelve el id del símbolo, creándolo si no existía"""
+        ident = self.ids.get(nombre)
+        if ident is None:
+            ident = len(self.nombres)
+            self.ids[nombre] = ident
+            self.nombres.append(nombre)
+            self.no_terminal.append(es_nombre_no_terminal(nombre))
+        return ident
+
+    @classmethod
+    def desde_nombres(cls, nombres: List[str]) -> 'TablaSimbolos':
+        """Tabla con ids 0..n-1 para nombres distintos, sin internar uno a uno"""
+        tabla = cls()
+        tabla.nombres = list(nombres)
+        tabla.ids = dict(zip(tabla.nombres, range(len(tabla.nombres))))
+        tabla.no_terminal = bytearray(map(es_nombre_no_terminal, tabla.nombres))
+        return tabla
+
+    def fresco(self, prefijo: str) -> int:
+        """Interna un nombre <prefijoN> que todavía no exista"""
+        n = self._contadores.get(prefijo, 1)
+        while f"<{prefijo}{n}>" in self.ids:
+            n += 1
+        self._contadores[prefijo] = n + 1
+        return self.internar(f"<{prefijo}{n}>")
+
+    def copiar(self) -> 'TablaSimbolos':
+        """Copia con los mismos ids, independiente de la original"""
+        nueva = TablaSimbolos()
+        nueva.nombres = self.nombres.copy()
+        nueva.ids = self.ids.copy()
+        nueva.no_terminal = bytearray(self.no_terminal)
+        nueva._contadores = self._contadores.copy()
+        return nueva
+
+    def es_no_terminal(self, ident: int) -> bool:
+        return bool(self.no_terminal[ident])
+
+    def formatear(self, simbolos: Sequence[int]) -> str:
+        """Convierte una secuencia de ids en texto (ε si está vacía)"""
+        if not simbolos:
+            return EPSILON
+        nombres = self.nombres
+        return ''.join(nombres[s] for s in simbolos)
+
+    def __len__(self) -> int:
+        return len(self.nombres)
+
+
+class BloqueProducciones:
+    """
+    Producciones de un no terminal guardadas en un único arreglo de enteros
+    con los límites de cada producción
+    """
+    __slots__ = ('simbolos', 'limites')
+
+    def __init__(self):
+        self.simbolos = array('i')
+        self.limites = array('i', [0])
+
+    def agregar(self, simbolos: Iterable[int]):
+        self.simbolos.extend(simbolos)
+        self.limites.append(len(self.simbolos))
+
+    def __len__(self) -> int:
+        return len(self.limites) - 1
+
+    def __getitem__(self, k: int) -> array:
+        return self.simbolos[self.limites[k]:self.limites[k + 1]]
+
+    def __iter__(self) -> Iterator[array]:
+        simbolos = self.simbolos
+        limites = self.limites
+        for k in range(len(limites) - 1):
+            yield simbolos[limites[k]:limites[k + 1]]
+
+    def copiar(self) -> 'BloqueProducciones':
+        nuevo = BloqueProducciones()
+        nuevo.simbolos = array('i', self.simbolos)
+        nuevo.limites = array('i', self.limites)
+        return nuevo
+
+
+class Gramatica:
+    """
+    Gramática con copia perezosa (copy-on-write): copiar() comparte el
+    diccionario de bloques y los conjuntos de símbolos, y cada copia duplica
+    un bloque solo la primera vez que modifica ese no terminal
+    """
+    __slots__ = ('tabla', '_bloques', '_inicial', '_terminales', '_no_terminales',
+                 '_compartida', '_propios',
+                 '_indice_construido', '_anulables', '_cabezas', '_pendientes',
+                 '_ocurrencias')
+
+    def __init__(self, tabla: Optional[TablaSimbolos] = None):
+        self.tabla = tabla if tabla is not None else TablaSimbolos()
+        self._bloques: Dict[int, BloqueProducciones] = {}
+        self._inicial: int = -1
+        self._terminales: Set[int] = set()
+        self._no_terminales: Set[int] = set()
+
+        # Copia perezosa: si _compartida, el diccionario de bloques y los
+        # conjuntos de símbolos son de otra gramática; _propios son los no
+        # terminales cuyo bloque pertenece solo a esta
+        self._compartida: bool = False
+        self._propios: Set[int] = set()
+
+        # Índice de anulables (se construye en la primera consulta y luego
+        # se mantiene de forma incremental en agregar_produccion)
+        self._indice_construido: bool = False
+        self._anulables: Set[int] = set()
+        self._cabezas = array('i')                    # producción -> no terminal
+        self._pendientes = array('i')                 # símbolos aún no anulables
+        self._ocurrencias: Dict[int, List[int]] = {}  # símbolo -> producciones
+
+    @property
+    def simbolo_inicial(self) -> str:
+        return self.tabla.nombres[self._inicial] if self._inicial >= 0 else ""
+
+    @property
+    def inicial(self) -> int:
+        """Id del símbolo inicial (-1 si no se ha establecido)"""
+        return self._inicial
+
+    @property
+    def terminales(self) -> Set[str]:
+        nombres = self.tabla.nombres
+        return {nombres[s] for s in self._terminales}
+
+    @property
+    def no_terminales(self) -> Set[str]:
+        nombres = self.tabla.nombres
+        return {nombres[s] for s in self._no_terminales}
+
+    @property
+    def producciones(self) -> Dict[str, List[str]]:
+        """Vista textual de las producciones (se construye en cada acceso)"""
+        nombres = self.tabla.nombres
+        formatear = self.tabla.formatear
+        return {nombres[nt]: [formatear(p) for p in bloque]
+                for nt, bloque in self._bloques.items()}
+
     def agregar_produccion(self, izquierda: str, derecha: str):
         """Agrega una producción A -> derecha"""
-        if izquierda not in self.producciones:
-            self.producciones[izquierda] = []
-        self.producciones[izquierda].append(derecha)
-        self.no_terminales.add(izquierda)
-        
+        internar = self.tabla.internar
+        simbolos = [internar(s) for s in tokenizar(derecha)]
+        self.agregar_produccion_ids(internar(izquierda), simbolos)
+
+    def agregar_produccion_ids(self, cabeza: int, simbolos: Sequence[int]):
+        """Agrega una producción ya expresada con ids de símbolos"""
+        self._bloque_propio(cabeza).agregar(simbolos)
+        self._no_terminales.add(cabeza)
+
         # Identificar terminales y no terminales en el lado derecho
-        self._extraer_simbolos(derecha)
-    
-    def _extraer_simbolos(self, cadena: str):
-        """Extrae terminales y no terminales de una cadena de producción"""
-        for char in cadena:
-            if char.isupper():
-                self.no_terminales.add(char)
-            elif char.islower() or char.isdigit():
-                self.terminales.add(char)
-            # ε se maneja como caso especial
-    
+        self._extraer_simbolos(simbolos)
+
+        # Mantener el índice de anulables sin recalcular desde cero
+        if self._indice_construido:
+            self._indexar_produccion(cabeza, simbolos)
+
+    def reemplazar_producciones(self, cabeza: int, producciones: Iterable[Sequence[int]]):
+        """
+        Sustituye todas las producciones de un no terminal (sin producciones,
+        el no terminal deja de tener bloque)
+        """
+        self._separar()
+        bloque = BloqueProducciones()
+        for simbolos in producciones:
+            bloque.agregar(simbolos)
+            self._extraer_simbolos(simbolos)
+        if len(bloque):
+            self._bloques[cabeza] = bloque
+            self._no_terminales.add(cabeza)
+        else:
+            self._bloques.pop(cabeza, None)
+        self._propios.add(cabeza)
+        # Quitar producciones invalida el índice de anulables
+        self._indice_construido = False
+
+    def reemplazar_bloque(self, cabeza: int, bloque: BloqueProducciones):
+        """
+        Como reemplazar_producciones con un bloque ya armado y sin recorrer
+        sus símbolos: quien llama garantiza que ya están en la gramática
+        (p. ej. variantes de las producciones que reemplaza)
+        """
+        self._separar()
+        if len(bloque):
+            self._bloques[cabeza] = bloque
+        else:
+            self._bloques.pop(cabeza, None)
+        self._propios.add(cabeza)
+        self._indice_construido = False
+
+    def _separar(self):
+        """Deja de compartir el diccionario de bloques y los conjuntos de símbolos"""
+        if self._compartida:
+            self._bloques = dict(self._bloques)
+            self._terminales = set(self._terminales)
+            self._no_terminales = set(self._no_terminales)
+            self._compartida = False
+
+    def _bloque_propio(self, cabeza: int) -> BloqueProducciones:
+        """Bloque del no terminal que esta gramática puede modificar"""
+        self._separar()
+        bloque = self._bloques.get(cabeza)
+        if cabeza not in self._propios:
+            bloque = self._bloques[cabeza] = bloque.copiar() if bloque else BloqueProducciones()
+            self._propios.add(cabeza)
+        return bloque
+
+    def _extraer_simbolos(self, simbolos: Sequence[int]):
+        """Clasifica los símbolos de una producción en terminales y no terminales"""
+        no_terminal = self.tabla.no_terminal
+        for simbolo in simbolos:
+            if no_terminal[simbolo]:
+                self._no_terminales.add(simbolo)
+            else:
+                self._terminales.add(simbolo)
+
     def establecer_inicial(self, simbolo: str):
         """Establece el símbolo inicial"""
-        self.simbolo_inicial = simbolo
-        self.no_terminales.add(simbolo)
-    
+        self._separar()
+        self._inicial = self.tabla.internar(simbolo)
+        self._no_terminales.add(self._inicial)
+
+    def nuevo_no_terminal(self, prefijo: str = "X") -> int:
+        """Interna un no terminal fresco <prefijoN> que no exista en la tabla"""
+        nuevo = self.tabla.fresco(prefijo)
+        self._separar()
+        self._no_terminales.add(nuevo)
+        return nuevo
+
+    def producciones_de(self, no_terminal: int) -> BloqueProducciones:
+        """
+        Producciones de un no terminal (bloque vacío si no tiene)
+        El bloque puede estar compartido con copias: solo lectura
+        """
+        return self._bloques.get(no_terminal) or BloqueProducciones()
+
+    def bloques(self) -> Iterator[Tuple[int, BloqueProducciones]]:
+        """Pares (no terminal, producciones) en orden de inserción"""
+        return iter(self._bloques.items())
+
+    def no_terminales_ordenados(self) -> List[int]:
+        """Ids de los no terminales con producciones, ordenados por nombre"""
+        nombres = self.tabla.nombres
+        return sorted(self._bloques, key=lambda nt: nombres[nt])
+
+    def num_producciones(self) -> int:
+        return sum(len(bloque) for bloque in self._bloques.values())
+
+    def formatear_producciones(self, no_terminal: int) -> str:
+        """Lado derecho en formato α | β"""
+        formatear = self.tabla.formatear
+        return " | ".join(formatear(p) for p in self.producciones_de(no_terminal))
+
     def obtener_producciones_epsilon(self) -> Set[str]:
         """Encuentra todos los símbolos que pueden generar ε"""
-        anulables = set()
-        
-        # Paso 1: encontrar símbolos que tienen producción directa a ε
-        for no_terminal, prods in self.producciones.items():
-            if 'ε' in prods:
-                anulables.add(no_terminal)
-        
-        # Paso 2: iterar hasta no encontrar más anulables
-        cambio = True
-        while cambio:
-            cambio = False
-            for no_terminal, prods in self.producciones.items():
-                if no_terminal not in anulables:
-                    for prod in prods:
-                        # Si todos los símbolos de la producción son anulables
-                        if self._todos_anulables(prod, anulables):
-                            anulables.add(no_terminal)
-                            cambio = True
-                            break
-        
-        return anulables
-    
-    def _todos_anulables(self, produccion: str, anulables: Set[str]) -> bool:
-        """Verifica si todos los símbolos en una producción son anulables"""
-        if produccion == 'ε':
-            return True
-        
+        nombres = self.tabla.nombres
+        return {nombres[s] for s in self.obtener_anulables_ids()}
+
+    def obtener_anulables_ids(self) -> Set[int]:
+        """
+        Ids de los símbolos que pueden generar ε
+        Algoritmo lineal: cada producción lleva un contador de símbolos que
+        todavía no se saben anulables y un índice inverso símbolo -> producciones
+        permite decrementarlos con una lista de trabajo
+        """
+        if not self._indice_construido:
+            self._construir_indice_anulables()
+        return set(self._anulables)
+
+    def _construir_indice_anulables(self):
+        """Construye el índice de ocurrencias y propaga los anulables"""
+        self._anulables = set()
+        self._cabezas = array('i')
+        self._pendientes = array('i')
+        self._ocurrencias = {}
+        self._indice_construido = True
+
+        for no_terminal, bloque in self._bloques.items():
+            for prod in bloque:
+                self._indexar_produccion(no_terminal, prod)
+
+    def _indexar_produccion(self, no_terminal: int, produccion: Sequence[int]):
+        """Registra una producción en el índice y propaga si queda anulable"""
+        indice = len(self._cabezas)
+        self._cabezas.append(no_terminal)
+        es_no_terminal = self.tabla.no_terminal
+        pendientes = 0
+
         for simbolo in produccion:
-            if simbolo in self.terminales:
-                return False
-            elif simbolo in self.no_terminales and simbolo not in anulables:
-                return False
-        
-        return True
-    
+            if simbolo in self._anulables:
+                continue
+            if not es_no_terminal[simbolo]:
+                # Un terminal impide para siempre que la producción sea anulable
+                self._pendientes.append(-1)
+                return
+            pendientes += 1
+            self._ocurrencias.setdefault(simbolo, []).append(indice)
+
+        self._pendientes.append(pendientes)
+        if pendientes == 0 and no_terminal not in self._anulables:
+            self._anulables.add(no_terminal)
+            self._propagar_anulables([no_terminal])
+
+    def _propagar_anulables(self, trabajo: List[int]):
+        """Procesa la lista de trabajo de símbolos recién descubiertos anulables"""
+        while trabajo:
+            simbolo = trabajo.pop()
+            for indice in self._ocurrencias.pop(simbolo, ()):
+                self._pendientes[indice] -= 1
+                if self._pendientes[indice] == 0:
+                    cabeza = self._cabezas[indice]
+                    if cabeza not in self._anulables:
+                        self._anulables.add(cabeza)
+                        trabajo.append(cabeza)
+
     def mostrar(self):
         """Muestra la gramática en formato legible"""
+        nombres = self.tabla.nombres
         print(f"Símbolo inicial: {self.simbolo_inicial}")
         print("Producciones:")
-        for no_terminal in sorted(self.producciones.keys()):
-            prods = " | ".join(self.producciones[no_terminal])
-            print(f"  {no_terminal} → {prods}")
+        for no_terminal in self.no_terminales_ordenados():
+            print(f"  {nombres[no_terminal]} → {self.formatear_producciones(no_terminal)}")
         print(f"Terminales: {sorted(self.terminales)}")
         print(f"No terminales: {sorted(self.no_terminales)}")
-    
-    def copiar(self):
-        """Crea una copia de la gramática"""
-        nueva = Gramatica()
-        nueva.simbolo_inicial = self.simbolo_inicial
-        nueva.terminales = self.terminales.copy()
-        nueva.no_terminales = self.no_terminales.copy()
-        
-        for nt, prods in self.producciones.items():
-            nueva.producciones[nt] = prods.copy()
-        
-        return nueva
\ No newline at end of file
+
+    def copiar_sin_producciones(self) -> 'Gramatica':
+        """Gramática vacía con la misma tabla, símbolo inicial y símbolos"""
+        nueva = Gramatica(self.tabla)
+        nueva._inicial = self._inicial
+        nueva._terminales = self._terminales.copy()
+        nueva._no_terminales = self._no_terminales.copy()
+        return nueva
+
+    def copiar(self) -> 'Gramatica':
+        """
+        Copia en O(1): comparte los bloques con la original y cada una
+        duplica un bloque recién al modificarlo
+        """
+        nueva = Gramatica(self.tabla)
+        nueva._bloques = self._bloques
+        nueva._inicial = self._inicial
+        nueva._terminales = self._terminales
+        nueva._no_terminales = self._no_terminales
+        nueva._compartida = self._compartida = True
+        self._propios = set()
+        return nueva
@@ -0,0 +1,280 @@
+# incremental.py
+import os
+import time
+from typing import Dict, List, Optional, Set, Tuple
+from gramatica import Gramatica
+from lote import nombre_salida
+from serializacion import ENCABEZADO_TEXTO
+from simplificador import SimplificadorCFG
+from validador import ErrorGramatica, ValidadorGramatica
+
+Produccion = Tuple[str, ...]
+
+
+class SimplificadorIncremental:
+    """
+    Elimina producciones-ε reutilizando el trabajo de la versión anterior
+    de la gramática. Cada llamada a actualizar compara las producciones por
+    nombre (las tablas de símbolos de dos cargas no comparten ids) y:
+    - recalcula los anulables solo en el cono de dependencias de los no
+      terminales modificados: ellos y quienes los usan, transitivamente
+    - regenera las variantes solo de los no terminales modificados y de los
+      que usan un símbolo cuya anulabilidad cambió
+    Se respeta el presupuesto de variantes: las producciones que lo superan
+    se factorizan como en SimplificadorCFG, con auxiliares <Fn> que
+    pertenecen al no terminal que los creó y se regeneran con él. Sin
+    factorizaciones el resultado es el mismo que el de
+    eliminar_producciones_epsilon; con ellas el lenguaje es el mismo, pero
+    los auxiliares no se comparten entre no terminales y pueden numerarse
+    distinto. El texto de salida se guarda por no terminal, así escribir el
+    archivo actualizado no obliga a reconstruir la gramática completa
+    """
+
+    def __init__(self):
+        self._producciones: Dict[str, List[Produccion]] = {}
+        self._anulables: Set[str] = set()
+        self._usos: Dict[str, Set[str]] = {}       # símbolo -> no terminales que lo usan
+        self._variantes: Dict[str, List[Produccion]] = {}
+        self._lineas: Dict[str, str] = {}           # no terminal -> 'A → α | β'
+        self._auxiliares: Dict[str, List[str]] = {}  # no terminal -> auxiliares que creó
+        self._inicial = ""
+        self._simplificador = SimplificadorCFG()
+        self.ultimo_cambio: Dict[str, int] = {}
+
+    def actualizar(self, gramatica: Gramatica) -> Dict[str, int]:
+        """
+        Incorpora la nueva versión de la gramática y devuelve cuánto trabajo
+        hizo falta (no terminales modificados, tamaño del cono, regenerados)
+        """
+        nombres = gramatica.tabla.nombres
+        nuevas = {nombres[nt]: [tuple(nombres[s] for s in prod) for prod in bloque]
+                  for nt, bloque in gramatica.bloques()}
+
+        cambiados = {nt for nt in nuevas.keys() | self._producciones.keys()
+                     if nuevas.get(nt) != self._producciones.get(nt)}
+        self._actualizar_usos(cambiados, nuevas)
+
+        cono = self._cono(cambiados)
+        anulables = self._anulables_en_cono(cono, nuevas)
+        cambios_anulables = anulables ^ self._anulables
+
+        regenerar = set(cambiados)
+        for simbolo in cambios_anulables:
+            regenerar.update(self._usos.get(simbolo, ()))
+        # Un auxiliar cuyo nombre pasa a usarse en la gramática se renombra
+        usados = set(cambiados)
+        for nt in cambiados:
+            for prod in nuevas.get(nt, ()):
+                usados.update(prod)
+        regenerar.update(nt for nt, auxiliares in self._auxiliares.items()
+                         if not usados.isdisjoint(auxiliares))
+        regenerar &= nuevas.keys()
+
+        for nt in regenerar | (cambiados - nuevas.keys()):
+            for auxiliar in self._auxiliares.pop(nt, ()):
+                self._variantes.pop(auxiliar, None)
+                self._lineas.pop(auxiliar, None)
+        for nt in cambiados - nuevas.keys():
+            self._variantes.pop(nt, None)
+            self._lineas.pop(nt, None)
+
+        factorizacion: List[Gramatica] = []
+        for nt in sorted(regenerar):
+            variantes = self._regenerar(nt, nuevas[nt], anulables, gramatica, factorizacion)
+            self._guardar(nt, variantes)
+        self._producciones = nuevas
+        self._anulables = anulables
+        self._inicial = gramatica.simbolo_inicial
+        self.ultimo_cambio = {
+            "no_terminales": len(nuevas),
+            "modificados": len(cambiados),
+            "cono_anulables": len(cono),
+            "anulables_cambiados": len(cambios_anulables),
+            "regenerados": len(regenerar),
+        }
+        return self.ultimo_cambio
+
+    def _regenerar(self, nt: str, producciones: List[Produccion], anulables: Set[str],
+                   gramatica: Gramatica, factorizacion: List[Gramatica]) -> List[Produccion]:
+        """
+        Variantes sin ε de un no terminal. Las producciones que superan el
+        presupuesto se factorizan por ids en una gramática auxiliar con una
+        copia de la tabla de la carga actual (una por actualización, en
+        `factorizacion`), que reserva los nombres de los auxiliares vigentes
+        """
+        simplificador = self._simplificador
+        presupuesto = simplificador.presupuesto_variantes
+        variantes: Dict[Produccion, None] = {}
+        auxiliares: Dict[Tuple[int, ...], int] = {}
+        for prod in producciones:
+            if not prod:
+                continue
+            if presupuesto is None or simplificador.contar_variantes(prod, anulables) <= presupuesto:
+                variantes.update(dict.fromkeys(simplificador._generar_variantes(prod, anulables)))
+                continue
+            if not factorizacion:
+                nueva = Gramatica(gramatica.tabla.copiar())
+                for propios in self._auxiliares.values():
+                    for auxiliar in propios:
+                        nueva.tabla.internar(auxiliar)
+                factorizacion.append(nueva)
+            nueva = factorizacion[0]
+            tabla = nueva.tabla
+            ids = [tabla.ids[s] for s in prod]
+            ids_anulables = {tabla.ids[s] for s in anulables if s in tabla.ids}
+            for variante in simplificador._factorizar(ids, ids_anulables, gramatica, nueva,
+                                                       auxiliares):
+                variantes[tuple(tabla.nombres[s] for s in variante)] = None
+        variantes.pop((), None)
+
+        if auxiliares:
+            nombres = nueva.tabla.nombres
+            propios = self._auxiliares[nt] = []
+            for auxiliar in auxiliares.values():
+                propios.append(nombres[auxiliar])
+                self._guardar(nombres[auxiliar],
+                              [tuple(nombres[s] for s in prod)
+                               for prod in nueva.producciones_de(auxiliar)])
+        return list(variantes)
+
+    def _guardar(self, nt: str, variantes: List[Produccion]):
+        """Guarda las variantes de un no terminal y su línea de texto"""
+        self._variantes[nt] = variantes
+        if variantes:
+            self._lineas[nt] = f"{nt} → {' | '.join(''.join(v) for v in variantes)}"
+        else:
+            self._lineas.pop(nt, None)
+
+    def gramatica(self) -> Gramatica:
+        """La gramática simplificada de la última versión"""
+        resultado = Gramatica()
+        if self._inicial:
+            resultado.establecer_inicial(self._inicial)
+        internar = resultado.tabla.internar
+        for nt, variantes in self._variantes.items():
+            cabeza = internar(nt)
+            for prod in variantes:
+                resultado.agregar_produccion_ids(cabeza, [internar(s) for s in prod])
+        return resultado
+
+    def texto(self) -> str:
+        """El mismo texto que lote.texto_gramatica para la gramática simplificada"""
+        lineas = [linea.format(inicial=self._inicial) for linea in ENCABEZADO_TEXTO]
+        lineas.extend(self._lineas[nt] for nt in sorted(self._lineas))
+        lineas.append("")
+        return "\n".join(lineas)
+
+    def _actualizar_usos(self, cambiados: Set[str], nuevas: Dict[str, List[Produccion]]):
+        """Mantiene el índice símbolo -> usuarios tocando solo los no terminales modificados"""
+        usos = self._usos
+        for nt in cambiados:
+            for prod in self._producciones.get(nt, ()):
+                for simbolo in prod:
+                    usuarios = usos.get(simbolo)
+                    if usuarios is not None:
+                        usuarios.discard(nt)
+                        if not usuarios:
+                            del usos[simbolo]
+            for prod in nuevas.get(nt, ()):
+                for simbolo in prod:
+                    usos.setdefault(simbolo, set()).add(nt)
+
+    def _cono(self, cambiados: Set[str]) -> Set[str]:
+        """Los no terminales modificados y todos los que dependen de ellos"""
+        cono = set(cambiados)
+        frontera = list(cambiados)
+        for simbolo in frontera:
+            for usuario in self._usos.get(simbolo, ()):
+                if usuario not in cono:
+                    cono.add(usuario)
+                    frontera.append(usuario)
+        return cono
+
+    def _anulables_en_cono(self, cono: Set[str], nuevas: Dict[str, List[Produccion]]) -> Set[str]:
+        """
+        Fuera del cono la anulabilidad no puede cambiar; dentro se recalcula
+        con el mismo esquema lineal de contadores que Gramatica
+        """
+        anulables = self._anulables - cono
+        cabezas: List[str] = []
+        pendientes: List[int] = []
+        ocurrencias: Dict[str, List[int]] = {}
+        trabajo: List[str] = []
+
+        for nt in cono:
+            for prod in nuevas.get(nt, ()):
+                faltan = 0
+                for simbolo in prod:
+                    if simbolo in anulables:
+                        continue
+                    if simbolo not in cono:
+                        # Terminal o no terminal no anulable fuera del cono
+                        faltan = -1
+                        break
+                    faltan += 1
+                if faltan < 0:
+                    continue
+                indice = len(cabezas)
+                cabezas.append(nt)
+                pendientes.append(faltan)
+                for simbolo in prod:
+                    if simbolo not in anulables:
+                        ocurrencias.setdefault(simbolo, []).append(indice)
+                if faltan == 0 and nt not in anulables:
+                    anulables.add(nt)
+                    trabajo.append(nt)
+
+        while trabajo:
+            simbolo = trabajo.pop()
+            for indice in ocurrencias.pop(simbolo, ()):
+                pendientes[indice] -= 1
+                if pendientes[indice] == 0 and cabezas[indice] not in anulables:
+                    anulables.add(cabezas[indice])
+                    trabajo.append(cabezas[indice])
+        return anulables
+
+
+def vigilar(archivo: str, directorio_salida: Optional[str] = None,
+            intervalo: float = 0.5, ciclos: Optional[int] = None) -> int:
+    """
+    Modo vigilancia: consulta el mtime del archivo cada `intervalo`
+    segundos y, cuando cambia, vuelve a escribir su *_sin_epsilon.txt con
+    el simplificador incremental. Termina con Ctrl+C (o tras `ciclos`)
+    """
+    incremental = SimplificadorIncremental()
+    validador = ValidadorGramatica()
+    salida = nombre_salida(archivo, directorio_salida)
+    firma_anterior = None
+    print(f"Vigilando {archivo} (Ctrl+C para terminar)")
+
+    try:
+        ciclo = 0
+        while ciclos is None or ciclo < ciclos:
+            if ciclo:
+                time.sleep(intervalo)
+            ciclo += 1
+            try:
+                info = os.stat(archivo)
+            except OSError:
+                continue
+            firma = (info.st_mtime_ns, info.st_size)
+            if firma == firma_anterior:
+                continue
+            firma_anterior = firma
+
+            inicio = time.perf_counter()
+            try:
+                gramatica = validador.cargar_gramatica(archivo)
+            except (ErrorGramatica, OSError) as e:
+                print(f"❌ {e}")
+                for error in getattr(e, 'errores', ()):
+                    print(f"  - {error}")
+                continue
+            cambio = incremental.actualizar(gramatica)
+            with open(salida, 'w', encoding='utf-8') as f:
+                f.write(incremental.texto())
+            print(f"✓ {salida}: {cambio['regenerados']} de {cambio['no_terminales']} "
+                  f"no terminales regenerados en {(time.perf_counter() - inicio) * 1000:.1f}ms")
+    except KeyboardInterrupt:
+        print()
+    return 0
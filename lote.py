@@ -0,0 +1,226 @@
+# lote.py
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+from cache import CacheResultados, huella_gramatica
+from gramatica import Gramatica
+from perfilador import Perfilador, PerfiladorActivo
+from serializacion import (ENCABEZADO_TEXTO, EXTENSION_BINARIA, cargar_binario, escribir_texto,
+                           guardar_binario, lineas_texto)
+from simplificador import SimplificadorCFG
+from validador import ValidadorGramatica
+
+SUFIJO_SALIDA = '_sin_epsilon.txt'
+MAX_BYTES_CACHE = 256 * 1024 * 1024
+
+
+class ResultadoArchivo:
+    """Resultado de procesar un archivo en modo por lotes"""
+    __slots__ = ('archivo', 'exito', 'salida', 'producciones_originales',
+                 'producciones_simplificadas', 'segundos', 'error', 'desde_cache', 'perfil')
+
+    def __init__(self, archivo: str):
+        self.archivo = archivo
+        self.exito = False
+        self.salida = ""
+        self.producciones_originales = 0
+        self.producciones_simplificadas = 0
+        self.segundos = 0.0
+        self.error = ""
+        self.desde_cache = False
+        self.perfil: Dict[str, Dict] = {}
+
+
+def nombre_salida(archivo: str, directorio_salida: Optional[str] = None) -> str:
+    """gramatica.txt -> gramatica_sin_epsilon.txt (opcionalmente en otro directorio)"""
+    base = os.path.splitext(archivo)[0] + SUFIJO_SALIDA
+    if directorio_salida:
+        base = os.path.join(directorio_salida, os.path.basename(base))
+    return base
+
+
+def texto_gramatica(gramatica: Gramatica) -> str:
+    """La gramática en el formato de texto de entrada, con encabezado"""
+    lineas = [linea.format(inicial=gramatica.simbolo_inicial) for linea in ENCABEZADO_TEXTO]
+    lineas.extend(lineas_texto(gramatica))
+    lineas.append("")
+    return "\n".join(lineas)
+
+
+def escribir_gramatica(gramatica: Gramatica, nombre_archivo: str) -> int:
+    """
+    Escribe la gramática en el formato de texto de entrada (o en binario
+    si el nombre termina en .cfgb) y devuelve los bytes escritos
+    """
+    if nombre_archivo.endswith(EXTENSION_BINARIA):
+        return guardar_binario(gramatica, nombre_archivo)
+    return escribir_texto(gramatica, nombre_archivo)
+
+
+def cargar_gramatica(archivo: str) -> Gramatica:
+    """Carga un archivo .cfgb sin validar de nuevo, o valida y carga uno de texto"""
+    if archivo.endswith(EXTENSION_BINARIA):
+        return cargar_binario(archivo)
+    return ValidadorGramatica().cargar_gramatica(archivo)
+
+
+def _escribir_texto(texto: str, nombre_archivo: str) -> int:
+    datos = texto.encode('utf-8')
+    with open(nombre_archivo, 'wb') as f:
+        f.write(datos)
+    return len(datos)
+
+
+# Una instancia de caché por proceso y directorio (los trabajadores del pool
+# la reutilizan entre tareas)
+_caches: Dict[Tuple[str, int], CacheResultados] = {}
+
+
+def _cache_de_proceso(directorio: str, max_bytes: int) -> CacheResultados:
+    cache = _caches.get((directorio, max_bytes))
+    if cache is None:
+        cache = _caches[(directorio, max_bytes)] = CacheResultados(directorio, max_bytes)
+    return cache
+
+
+def expandir_entradas(entradas: Iterable[str]) -> List[str]:
+    """
+    Convierte patrones glob y directorios en la lista de archivos de
+    gramática (*.txt), omitiendo los resultados *_sin_epsilon.txt
+    """
+    archivos = []
+    vistos = set()
+
+    def agregar(ruta: str):
+        if ruta.endswith(SUFIJO_SALIDA) or ruta in vistos:
+            return
+        vistos.add(ruta)
+        archivos.append(ruta)
+
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for raiz, _, nombres in os.walk(entrada):
+                for nombre in sorted(nombres):
+                    if nombre.endswith('.txt'):
+                        agregar(os.path.join(raiz, nombre))
+        elif glob.has_magic(entrada):
+            for ruta in sorted(glob.glob(entrada, recursive=True)):
+                if os.path.isfile(ruta):
+                    agregar(ruta)
+        else:
+            # Un archivo inexistente se reporta como fallo en el resumen
+            agregar(entrada)
+    return archivos
+
+
+def procesar_archivo(archivo: str, directorio_salida: Optional[str] = None,
+                     directorio_cache: Optional[str] = None,
+                     max_bytes_cache: int = MAX_BYTES_CACHE,
+                     perfilar: bool = False,
+                     motor_analisis: str = 'lineal') -> ResultadoArchivo:
+    """
+    Valida, simplifica y guarda un archivo sin imprimir nada
+    Con directorio_cache, una gramática ya procesada (misma huella) se
+    escribe desde la caché sin volver a simplificarla. Con perfilar, el
+    resultado incluye los tiempos por etapa y los contadores
+    """
+    resultado = ResultadoArchivo(archivo)
+    perfilador = PerfiladorActivo() if perfilar else Perfilador()
+    inicio = time.perf_counter()
+    try:
+        with perfilador.etapa("validacion_y_carga"):
+            original = cargar_gramatica(archivo)
+        resultado.salida = nombre_salida(archivo, directorio_salida)
+
+        cache = huella = guardado = None
+        if directorio_cache:
+            cache = _cache_de_proceso(directorio_cache, max_bytes_cache)
+            huella = huella_gramatica(original)
+            guardado = cache.obtener(huella)
+
+        if guardado is not None:
+            texto, estadisticas = guardado
+            resultado.desde_cache = True
+        else:
+            simplificador = SimplificadorCFG(perfilador=perfilador,
+                                             motor_analisis=motor_analisis)
+            simplificada = simplificador.eliminar_producciones_epsilon(original)
+            texto = texto_gramatica(simplificada)
+            estadisticas = simplificador.calcular_estadisticas(original, simplificada)
+            if cache is not None:
+                cache.guardar(huella, texto, estadisticas)
+
+        with perfilador.etapa("escritura"):
+            perfilador.contar("bytes_escritos", _escribir_texto(texto, resultado.salida))
+
+        resultado.producciones_originales = estadisticas["producciones_originales"]
+        resultado.producciones_simplificadas = estadisticas["producciones_simplificadas"]
+        resultado.exito = True
+    except Exception as e:
+        resultado.error = str(e) or type(e).__name__
+    resultado.segundos = time.perf_counter() - inicio
+    resultado.perfil = perfilador.exportar()
+    return resultado
+
+
+def _procesar_en_trabajador(argumentos) -> ResultadoArchivo:
+    return procesar_archivo(*argumentos)
+
+
+def procesar_lote(archivos: List[str], trabajadores: Optional[int] = None,
+                  directorio_salida: Optional[str] = None,
+                  directorio_cache: Optional[str] = None,
+                  max_bytes_cache: int = MAX_BYTES_CACHE,
+                  perfilar: bool = False,
+                  motor_analisis: str = 'lineal') -> List[ResultadoArchivo]:
+    """
+    Procesa los archivos en un ProcessPoolExecutor con el número de
+    trabajadores indicado (por defecto, uno por CPU). Con un trabajador se
+    procesan en el propio proceso. Los resultados conservan el orden de entrada
+    """
+    if directorio_salida:
+        os.makedirs(directorio_salida, exist_ok=True)
+
+    trabajadores = trabajadores or os.cpu_count() or 1
+    tareas = [(archivo, directorio_salida, directorio_cache, max_bytes_cache, perfilar,
+               motor_analisis) for archivo in archivos]
+    if trabajadores == 1 or len(archivos) <= 1:
+        return [_procesar_en_trabajador(tarea) for tarea in tareas]
+
+    # Lotes grandes por tarea para amortizar la comunicación entre procesos
+    tamano_lote = max(1, len(tareas) // (trabajadores * 4))
+    with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+        return list(ejecutor.map(_procesar_en_trabajador, tareas, chunksize=tamano_lote))
+
+
+def exportar_perfiles(resultados: List[ResultadoArchivo], nombre_archivo: str):
+    """JSON con el perfil de cada archivo y el total sumado de todos"""
+    total = PerfiladorActivo()
+    for r in resultados:
+        total.combinar(r.perfil)
+    with open(nombre_archivo, 'w', encoding='utf-8') as f:
+        json.dump({"archivos": {r.archivo: r.perfil for r in resultados},
+                   "total": total.exportar()}, f, indent=2, ensure_ascii=False)
+
+
+def imprimir_resumen(resultados: List[ResultadoArchivo], segundos_totales: float):
+    """Tabla con el estado y el tiempo de cada archivo"""
+    ancho = max([len(r.archivo) for r in resultados] + [len("ARCHIVO")])
+    print(f"{'ARCHIVO':{ancho}}  {'ESTADO':9}  {'ORIG':>6}  {'SIMPL':>6}  {'TIEMPO':>10}  CACHÉ")
+    print("-" * (ancho + 48))
+    for r in resultados:
+        estado = "✓ EXITOSO" if r.exito else "❌ FALLÓ"
+        print(f"{r.archivo:{ancho}}  {estado:9}  {r.producciones_originales:>6}  "
+              f"{r.producciones_simplificadas:>6}  {r.segundos * 1000:>8.2f}ms  "
+              f"{'acierto' if r.desde_cache else ''}")
+        if r.error:
+            print(f"{'':{ancho}}  {r.error}")
+
+    exitosos = sum(1 for r in resultados if r.exito)
+    aciertos = sum(1 for r in resultados if r.desde_cache)
+    print("-" * (ancho + 48))
+    print(f"Total procesadas: {exitosos}/{len(resultados)} en {segundos_totales:.2f}s "
+          f"({aciertos} desde caché)")
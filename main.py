@@ -2,10 +2,20 @@
 # Laboratorio 7 - Teoría de la Computación
 # Genser Catalan -- Javier Chávez
 
+import argparse
 import os
+import sys
+import time
+from typing import List, Optional
 from gramatica import Gramatica
+from incremental import vigilar
 from simplificador import SimplificadorCFG
-from validador import ValidadorGramatica
+from validador import ErrorGramatica, ValidadorGramatica
+from reportero import ReporteroConsola
+from analisis import motores_disponibles
+from lote import (escribir_gramatica, expandir_entradas, exportar_perfiles, imprimir_resumen,
+                  nombre_salida, procesar_lote)
+from perfilador import Perfilador, PerfiladorActivo
 
 def crear_archivos_ejemplo():
     archivos = {
@@ -49,7 +59,7 @@ def mostrar_menu():
     print("3. Procesar Gramática 3")
     print("0. Salir")
     print("-"*60)
-    print("NOTA: Cada opción incluye validación automática con regex")
+    print("NOTA: Cada opción incluye validación automática del formato")
 
 def procesar_gramatica(archivo: str):
     """Procesa una gramática específica"""
@@ -58,22 +68,26 @@ def procesar_gramatica(archivo: str):
     print(f"{'='*80}")
     
     try:
-        # Paso 1: Validar archivo
-        validador = ValidadorGramatica()
+        # Paso 1: Validar y cargar el archivo en una sola pasada
+        reportero = ReporteroConsola()
+        perfilador = PerfiladorActivo()
+        validador = ValidadorGramatica(reportero)
         print("\n" + "="*50)
-        print("PASO 1: VALIDACIÓN CON REGEX")
+        print("PASO 1: VALIDACIÓN Y CARGA")
         print("="*50)
         
-        if not validador.validar_archivo(archivo):
+        try:
+            with perfilador.etapa("validacion_y_carga"):
+                gramatica_original = validador.cargar_gramatica(archivo)
+        except (ErrorGramatica, OSError):
             print("❌ Archivo inválido. No se puede continuar.")
             return False
         
-        # Paso 2: Cargar gramática
+        # Paso 2: Mostrar gramática
         print("\n" + "="*50)
-        print("PASO 2: CARGA DE GRAMÁTICA")
+        print("PASO 2: GRAMÁTICA CARGADA")
         print("="*50)
         
-        gramatica_original = validador.cargar_gramatica_desde_archivo(archivo)
         print("\nGRAMÁTICA ORIGINAL:")
         gramatica_original.mostrar()
         
@@ -82,37 +96,32 @@ def procesar_gramatica(archivo: str):
         print("PASO 3: SIMPLIFICACIÓN")
         print("="*50)
         
-        simplificador = SimplificadorCFG()
+        simplificador = SimplificadorCFG(reportero, perfilador)
         gramatica_simplificada = simplificador.eliminar_producciones_epsilon(gramatica_original)
         
-        # Paso 4: Mostrar resultados
+        # Paso 4: Guardar resultado
+        guardar_resultado(gramatica_simplificada, nombre_salida(archivo), perfilador)
+        
+        # Paso 5: Mostrar resultados y el perfil de cada etapa
         print("\n" + "="*50)
-        print("PASO 4: RESULTADOS")
+        print("PASO 5: RESULTADOS")
         print("="*50)
         
         simplificador.mostrar_estadisticas(gramatica_original, gramatica_simplificada)
         
-        # Paso 5: Guardar resultado (opcional)
-        nombre_salida = archivo.replace('.txt', '_sin_epsilon.txt')
-        guardar_resultado(gramatica_simplificada, nombre_salida)
-        
         return True
         
     except Exception as e:
         print(f"❌ ERROR al procesar {archivo}: {e}")
         return False
 
-def guardar_resultado(gramatica: Gramatica, nombre_archivo: str):
+def guardar_resultado(gramatica: Gramatica, nombre_archivo: str,
+                      perfilador: Optional[Perfilador] = None):
     """Guarda la gramática simplificada en un archivo"""
+    perfilador = perfilador or Perfilador()
     try:
-        with open(nombre_archivo, 'w', encoding='utf-8') as f:
-            f.write(f"# Gramática simplificada (sin producciones-ε)\n")
-            f.write(f"# Símbolo inicial: {gramatica.simbolo_inicial}\n\n")
-            
-            for no_terminal in sorted(gramatica.producciones.keys()):
-                producciones = " | ".join(gramatica.producciones[no_terminal])
-                f.write(f"{no_terminal} → {producciones}\n")
-        
+        with perfilador.etapa("guardar_resultado"):
+            perfilador.contar("bytes_escritos", escribir_gramatica(gramatica, nombre_archivo))
         print(f"✓ Resultado guardado en: {nombre_archivo}")
     except Exception as e:
         print(f"❌ Error al guardar resultado: {e}")
@@ -144,8 +153,58 @@ def procesar_todas_las_gramaticas():
     
     print(f"\nTotal procesadas: {exitosos}/{total}")
 
-def main():
+def ejecutar_lote(argv: List[str]) -> int:
+    """Modo no interactivo: procesa muchos archivos en paralelo"""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Elimina las producciones-ε de muchos archivos de gramática")
+    parser.add_argument("entradas", nargs="+",
+                        help="archivos, patrones glob o directorios con gramáticas .txt")
+    parser.add_argument("-j", "--trabajadores", type=int, default=None,
+                        help="procesos en paralelo (por defecto, uno por CPU)")
+    parser.add_argument("-o", "--salida", default=None,
+                        help="directorio para los *_sin_epsilon.txt (por defecto, junto a cada archivo)")
+    parser.add_argument("--cache", default=None,
+                        help="directorio de la caché de resultados (desactivada por defecto)")
+    parser.add_argument("--cache-max-mb", type=int, default=256,
+                        help="tamaño máximo de la caché antes de expulsar entradas (MB)")
+    parser.add_argument("--perfil", metavar="ARCHIVO", default=None,
+                        help="guarda en JSON los tiempos por etapa y contadores de cada archivo")
+    parser.add_argument("--motor", choices=motores_disponibles(), default="lineal",
+                        help="motor del análisis de anulables, generadores y alcanzables")
+    parser.add_argument("--vigilar", action="store_true",
+                        help="vuelve a simplificar el archivo cada vez que cambia (modo incremental)")
+    parser.add_argument("--intervalo", type=float, default=0.5,
+                        help="segundos entre consultas del modo --vigilar")
+    args = parser.parse_args(argv)
+    
+    if args.vigilar:
+        if len(args.entradas) != 1 or not os.path.isfile(args.entradas[0]):
+            parser.error("--vigilar requiere exactamente un archivo")
+        if args.salida:
+            os.makedirs(args.salida, exist_ok=True)
+        return vigilar(args.entradas[0], args.salida, args.intervalo)
+    
+    archivos = expandir_entradas(args.entradas)
+    if not archivos:
+        print("❌ No se encontraron archivos de gramática")
+        return 1
+    
+    inicio = time.perf_counter()
+    resultados = procesar_lote(archivos, args.trabajadores, args.salida,
+                               args.cache, args.cache_max_mb * 1024 * 1024,
+                               perfilar=args.perfil is not None, motor_analisis=args.motor)
+    imprimir_resumen(resultados, time.perf_counter() - inicio)
+    if args.perfil:
+        exportar_perfiles(resultados, args.perfil)
+    return 0 if all(r.exito for r in resultados) else 1
+
+def main(argv: Optional[List[str]] = None):
     """Función principal"""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return ejecutar_lote(argv)
+    
     print("=== PROGRAMA CFG - TEORÍA DE LA COMPUTACIÓN ===")
     
     # Crear archivos de ejemplo si no existen
@@ -183,4 +242,4 @@ def main():
             input("Presione Enter para continuar...")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,184 @@
+# normalizador.py
+from typing import Dict, List, Tuple
+from gramatica import Gramatica
+from simplificador import SimplificadorCFG
+
+
+def tamano_gramatica(gramatica: Gramatica) -> Dict[str, int]:
+    """Producciones, no terminales con producciones y símbolos en los lados derechos"""
+    producciones = simbolos = 0
+    for _, bloque in gramatica.bloques():
+        producciones += len(bloque)
+        simbolos += len(bloque.simbolos)
+    return {"producciones": producciones,
+            "no_terminales": sum(1 for _ in gramatica.bloques()),
+            "simbolos": simbolos}
+
+
+class ConvertidorFNC:
+    """
+    Convierte una gramática a Forma Normal de Chomsky (FNC)
+    La cadena vacía no se representa en la gramática resultante: quien la
+    necesite debe consultar si el símbolo inicial original es anulable
+    """
+
+    def convertir(self, gramatica: Gramatica) -> Gramatica:
+        """
+        Devuelve una gramática equivalente (salvo ε) con reglas A → BC | a
+        Se aplica BIN antes que DEL: con lados derechos de longitud <= 2
+        cada producción da a lo sumo 3 variantes al quitar ε, así el
+        resultado crece de forma polinomial y no 2^m
+        El resultado usa su propia tabla de símbolos, así los no terminales
+        nuevos no aparecen en la tabla de la gramática recibida
+        """
+        propia = gramatica.copiar()
+        propia.tabla = gramatica.tabla.copiar()
+
+        # TERM + BIN: terminales aislados y lados derechos de longitud <= 2
+        binaria = self._binarizar(propia)
+
+        # DEL + UNIT + símbolos inútiles (sin traza)
+        return SimplificadorCFG().simplificar(binaria)
+
+    def _binarizar(self, gramatica: Gramatica) -> Gramatica:
+        """
+        Aplica TERM y BIN a las producciones de longitud mayor que 1
+        Los sufijos comunes se factorizan: cada sufijo X2..Xn se asigna a un
+        único no terminal nuevo compartido por todas las producciones que
+        terminan en él
+        """
+        es_no_terminal = gramatica.tabla.no_terminal
+        nueva = gramatica.copiar_sin_producciones()
+        por_terminal: Dict[int, int] = {}
+        por_sufijo: Dict[Tuple[int, ...], int] = {}
+
+        def como_no_terminal(simbolo: int) -> int:
+            if es_no_terminal[simbolo]:
+                return simbolo
+            nt = por_terminal.get(simbolo)
+            if nt is None:
+                nt = por_terminal[simbolo] = nueva.nuevo_no_terminal("T")
+                nueva.agregar_produccion_ids(nt, (simbolo,))
+            return nt
+
+        def sufijo(simbolos: Tuple[int, ...]) -> int:
+            # Partir del sufijo más largo ya creado y crear los que faltan
+            inicio = 0
+            while inicio < len(simbolos) - 2 and simbolos[inicio:] not in por_sufijo:
+                inicio += 1
+            if simbolos[inicio:] not in por_sufijo:
+                nt = por_sufijo[simbolos[inicio:]] = nueva.nuevo_no_terminal("B")
+                nueva.agregar_produccion_ids(nt, simbolos[inicio:])
+            for k in range(inicio - 1, -1, -1):
+                resto = por_sufijo[simbolos[k + 1:]]
+                nt = por_sufijo[simbolos[k:]] = nueva.nuevo_no_terminal("B")
+                nueva.agregar_produccion_ids(nt, (simbolos[k], resto))
+            return por_sufijo[simbolos]
+
+        for nt, bloque in gramatica.bloques():
+            for prod in bloque:
+                if len(prod) <= 1:
+                    nueva.agregar_produccion_ids(nt, prod)
+                    continue
+                simbolos = tuple(como_no_terminal(s) for s in prod)
+                if len(simbolos) == 2:
+                    nueva.agregar_produccion_ids(nt, simbolos)
+                else:
+                    nueva.agregar_produccion_ids(nt, (simbolos[0], sufijo(simbolos[1:])))
+        return nueva
+
+    def calcular_estadisticas(self, original: Gramatica, convertida: Gramatica) -> Dict[str, int]:
+        """Tamaño de la gramática antes y después de la conversión"""
+        antes = tamano_gramatica(original)
+        despues = tamano_gramatica(convertida)
+        estadisticas = {f"{clave}_antes": valor for clave, valor in antes.items()}
+        estadisticas.update((f"{clave}_despues", valor) for clave, valor in despues.items())
+        return estadisticas
+
+    @staticmethod
+    def imprimir_estadisticas(estadisticas: Dict[str, int]):
+        """Imprime el tamaño antes y después de la conversión"""
+        print("\n=== ESTADÍSTICAS DE CONVERSIÓN ===")
+        for clave in ("producciones", "no_terminales", "simbolos"):
+            print(f"{clave.replace('_', ' ').capitalize()}: "
+                  f"{estadisticas[clave + '_antes']} → {estadisticas[clave + '_despues']}")
+
+
+class ConvertidorFNG(ConvertidorFNC):
+    """
+    Convierte una gramática a Forma Normal de Greibach (FNG): cada regla
+    es A → a B1...Bk. Parte de la FNC y aplica la transformación de
+    esquina izquierda: <Ln> = A\\B genera las w con A ⇒* B w (B es esquina
+    izquierda de A). Sin sustituciones en cadena el tamaño queda acotado
+    por no terminales × producciones², y no crece de forma exponencial
+    Como en la FNC, la cadena vacía no se representa
+    """
+
+    def convertir(self, gramatica: Gramatica) -> Gramatica:
+        fnc = super().convertir(gramatica)
+        nueva = fnc.copiar_sin_producciones()
+        terminales_de: Dict[int, List[int]] = {}              # B → a
+        por_izquierda: Dict[int, List[Tuple[int, int]]] = {}  # C -> [(B, D)] con B → C D
+        for nt, bloque in fnc.bloques():
+            for prod in bloque:
+                if len(prod) == 1:
+                    terminales_de.setdefault(nt, []).append(prod[0])
+                else:
+                    por_izquierda.setdefault(prod[0], []).append((nt, prod[1]))
+
+        # Esquinas izquierdas de cada A: A y las C con B → C D, B esquina de A
+        esquinas: Dict[int, Dict[int, None]] = {}
+        for a, _ in fnc.bloques():
+            alcanzadas = {a: None}
+            frontera = [a]
+            for b in frontera:
+                for prod in fnc.producciones_de(b):
+                    if len(prod) == 2 and prod[0] not in alcanzadas:
+                        alcanzadas[prod[0]] = None
+                        frontera.append(prod[0])
+            esquinas[a] = alcanzadas
+
+        # A\B tiene alguna regla si B empieza una regla B' → B D con B'
+        # esquina de A; solo esos no terminales se crean (y en orden de uso)
+        restos: Dict[Tuple[int, int], int] = {}
+        pendientes: List[Tuple[int, int]] = []
+
+        def resto(a: int, b: int) -> int:
+            if (a, b) not in restos:
+                if not any(padre in esquinas[a] for padre, _ in por_izquierda.get(b, ())):
+                    restos[a, b] = -1
+                else:
+                    restos[a, b] = nueva.nuevo_no_terminal("L")
+                    pendientes.append((a, b))
+            return restos[a, b]
+
+        # A → a A\B por cada esquina B → a (y A → a si B es A)
+        reglas: Dict[int, Dict[Tuple[int, ...], None]] = {}
+        for a, alcanzadas in esquinas.items():
+            propias = reglas[a] = {}
+            for b in alcanzadas:
+                for terminal in terminales_de.get(b, ()):
+                    if b == a:
+                        propias[(terminal,)] = None
+                    l_ab = resto(a, b)
+                    if l_ab >= 0:
+                        propias[(terminal, l_ab)] = None
+
+        # A\C → (reglas de D) A\B por cada B → C D con B esquina de A (y
+        # sin A\B si B es A); las reglas de D ya empiezan por un terminal
+        for a, c in pendientes:
+            propias = reglas[restos[a, c]] = {}
+            for b, d in por_izquierda[c]:
+                if b not in esquinas[a]:
+                    continue
+                l_ab = resto(a, b)
+                for q in reglas[d]:
+                    if b == a:
+                        propias[q] = None
+                    if l_ab >= 0:
+                        propias[q + (l_ab,)] = None
+
+        for nt, propias in reglas.items():
+            for prod in propias:
+                nueva.agregar_produccion_ids(nt, prod)
+        return nueva
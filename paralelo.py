@@ -0,0 +1,164 @@
+# paralelo.py
+"""
+Generación de variantes de la eliminación de producciones-ε repartida por
+no terminales entre procesos
+
+Una vez conocidos los anulables, cada bloque se expande sin mirar a los
+demás. El inicializador del pool deja en cada trabajador, una sola vez,
+las producciones en forma plana (los arreglos de serializacion.empaquetar)
+y los anulables; cada tarea lleva solo un rango de bloques y devuelve en
+forma plana los bloques que cambian. Con fork los arreglos se heredan sin
+serializarlos; con spawn se envían una vez por trabajador
+"""
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Set, Tuple
+from gramatica import BloqueProducciones, Gramatica
+from perfilador import Perfilador
+from serializacion import empaquetar
+from simplificador import SimplificadorCFG
+
+# Por debajo de estos símbolos en producciones no compensa arrancar procesos
+MINIMO_PARALELO = 50000
+# Varias tareas por trabajador reparten mejor los bloques costosos
+TAREAS_POR_TRABAJADOR = 8
+
+# Estado de cada proceso trabajador, fijado por _iniciar_trabajador
+_compartido: dict = {}
+
+
+def _iniciar_trabajador(inicios: array, desplazamientos: array, limites: array,
+                        simbolos: array, anulables: array,
+                        presupuesto: Optional[int], contar: bool):
+    _compartido.update(inicios=inicios, desplazamientos=desplazamientos, limites=limites,
+                       simbolos=simbolos, anulables=set(anulables), presupuesto=presupuesto,
+                       contar=contar,
+                       simplificador=SimplificadorCFG(presupuesto_variantes=presupuesto))
+
+
+def _expandir_rango(desde: int, hasta: int) -> tuple:
+    """
+    Expande los bloques desde..hasta-1 en un trabajador. Devuelve los
+    índices de los bloques que cambian con sus límites (relativos a cada
+    bloque) y símbolos en plano, los bloques que hay que factorizar (crean
+    auxiliares, así que se hacen en el proceso principal y en orden) y las
+    cuentas para el perfilador
+    """
+    simplificador: SimplificadorCFG = _compartido['simplificador']
+    anulables: Set[int] = _compartido['anulables']
+    presupuesto = _compartido['presupuesto']
+    contar = _compartido['contar']
+    inicios = _compartido['inicios']
+    desplazamientos = _compartido['desplazamientos']
+    limites = _compartido['limites']
+    simbolos = _compartido['simbolos']
+
+    reescritos = array('i')
+    producciones = array('i')        # producciones de cada bloque reescrito
+    nuevos_limites = array('i')
+    nuevos_simbolos = array('i')
+    factorizar = array('i')
+    compartidos = generadas = conservadas = descartadas = 0
+    nuevo = BloqueProducciones.__new__
+    for k in range(desde, hasta):
+        bloque = nuevo(BloqueProducciones)
+        bloque.simbolos = simbolos[desplazamientos[k]:desplazamientos[k + 1]]
+        bloque.limites = limites[inicios[k] + k:inicios[k + 1] + k + 1]
+        if not simplificador._necesita_reescritura(bloque, anulables):
+            compartidos += 1
+            continue
+        if presupuesto is not None and \
+                any(simplificador.contar_variantes(p, anulables) > presupuesto for p in bloque):
+            factorizar.append(k)
+            continue
+
+        nuevas = {}
+        generadas_bloque = 0
+        for prod in bloque:
+            if not prod:
+                continue
+            if contar:
+                variantes = list(simplificador._generar_variantes(prod, anulables))
+                generadas_bloque += len(variantes)
+                nuevas.update(dict.fromkeys(variantes))
+            else:
+                nuevas.update(dict.fromkeys(simplificador._generar_variantes(prod, anulables)))
+        vacia = () in nuevas
+        nuevas.pop((), None)
+        generadas += generadas_bloque
+        conservadas += len(nuevas)
+        descartadas += generadas_bloque - len(nuevas) - vacia
+
+        reescritos.append(k)
+        producciones.append(len(nuevas))
+        base = len(nuevos_simbolos)
+        nuevos_limites.append(0)
+        for variante in nuevas:
+            nuevos_simbolos.extend(variante)
+            nuevos_limites.append(len(nuevos_simbolos) - base)
+    return (reescritos, producciones, nuevos_limites, nuevos_simbolos, factorizar,
+            (compartidos, generadas, conservadas, descartadas))
+
+
+def conviene_paralelo(gramatica: Gramatica) -> bool:
+    """Si la gramática es lo bastante grande para amortizar el pool"""
+    return sum(len(bloque.simbolos) for _, bloque in gramatica.bloques()) >= MINIMO_PARALELO
+
+
+def _rangos(desplazamientos: array, tareas: int) -> List[Tuple[int, int]]:
+    """Rangos contiguos de bloques con cantidades parecidas de símbolos"""
+    n = len(desplazamientos) - 1
+    objetivo = max(1, desplazamientos[n] // max(1, tareas))
+    rangos = []
+    desde = 0
+    for k in range(1, n + 1):
+        if desplazamientos[k] - desplazamientos[desde] >= objetivo or k == n:
+            rangos.append((desde, k))
+            desde = k
+    return rangos
+
+
+def expandir_en_paralelo(gramatica: Gramatica, anulables: Set[int],
+                         presupuesto: Optional[int], trabajadores: int,
+                         perfilador: Optional[Perfilador] = None
+                         ) -> Iterator[Tuple[int, Optional[BloqueProducciones]]]:
+    """
+    Expande los bloques en un pool de procesos y entrega, en el orden de
+    gramatica.bloques(), (no terminal, bloque nuevo) por cada bloque que
+    cambia y (no terminal, None) por cada bloque que hay que factorizar.
+    Los resultados se unen por orden de rango, así la salida no depende de
+    qué trabajador termina antes
+    """
+    perfilador = perfilador or Perfilador()
+    cabezas, inicios, desplazamientos, limites, simbolos = empaquetar(gramatica)
+    rangos = _rangos(desplazamientos, trabajadores * TAREAS_POR_TRABAJADOR)
+    inicio_args = (inicios, desplazamientos, limites, simbolos, array('i', sorted(anulables)),
+                   presupuesto, perfilador.activo)
+
+    nuevo = BloqueProducciones.__new__
+    with ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_trabajador,
+                             initargs=inicio_args) as ejecutor:
+        resultados = ejecutor.map(_expandir_rango, *zip(*rangos)) if rangos else ()
+        for reescritos, producciones, nuevos_limites, nuevos_simbolos, factorizar, cuentas \
+                in resultados:
+            if perfilador.activo:
+                for nombre, cantidad in zip(("bloques_compartidos", "variantes_generadas",
+                                             "variantes_conservadas", "duplicadas_descartadas"),
+                                            cuentas):
+                    perfilador.contar(nombre, cantidad)
+            # Intercalar los bloques a factorizar en su lugar
+            pendientes = list(factorizar)
+            pendientes.reverse()
+            posicion_limites = posicion_simbolos = 0
+            for k, cantidad in zip(reescritos, producciones):
+                while pendientes and pendientes[-1] < k:
+                    yield cabezas[pendientes.pop()], None
+                bloque = nuevo(BloqueProducciones)
+                bloque.limites = nuevos_limites[posicion_limites:posicion_limites + cantidad + 1]
+                ocupados = bloque.limites[-1]
+                bloque.simbolos = nuevos_simbolos[posicion_simbolos:posicion_simbolos + ocupados]
+                posicion_limites += cantidad + 1
+                posicion_simbolos += ocupados
+                yield cabezas[k], bloque
+            while pendientes:
+                yield cabezas[pendientes.pop()], None
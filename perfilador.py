@@ -0,0 +1,82 @@
+# perfilador.py
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator
+
+# Un único administrador de contexto vacío compartido por el perfilador nulo
+_SIN_MEDICION = nullcontext()
+
+
+class Perfilador:
+    """
+    Perfilador nulo: no mide nada
+    Igual que con Reportero, el código instrumentado consulta `activo` antes
+    de contar en los bucles internos, así desactivado no cuesta nada
+    """
+    activo = False
+
+    def etapa(self, nombre: str):
+        """Administrador de contexto que mide el tiempo de una etapa"""
+        return _SIN_MEDICION
+
+    def contar(self, nombre: str, cantidad: int = 1):
+        """Suma `cantidad` al contador `nombre`"""
+        pass
+
+    def exportar(self) -> Dict[str, Dict]:
+        """Mediciones como diccionario serializable a JSON"""
+        return {}
+
+
+class PerfiladorActivo(Perfilador):
+    """
+    Acumula el tiempo de cada etapa (las etapas anidadas se cuentan también
+    en la etapa que las contiene) y contadores con nombre
+    """
+    activo = True
+
+    def __init__(self):
+        self.segundos: Dict[str, float] = {}
+        self.llamadas: Dict[str, int] = {}
+        self.contadores: Dict[str, int] = {}
+
+    @contextmanager
+    def etapa(self, nombre: str) -> Iterator[None]:
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.segundos[nombre] = self.segundos.get(nombre, 0.0) + time.perf_counter() - inicio
+            self.llamadas[nombre] = self.llamadas.get(nombre, 0) + 1
+
+    def contar(self, nombre: str, cantidad: int = 1):
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def exportar(self) -> Dict[str, Dict]:
+        return {
+            "etapas": {nombre: {"segundos": segundos, "llamadas": self.llamadas[nombre]}
+                       for nombre, segundos in self.segundos.items()},
+            "contadores": dict(self.contadores),
+        }
+
+    def combinar(self, datos: Dict[str, Dict]):
+        """Suma mediciones exportadas por otro perfilador (p. ej. de otro proceso)"""
+        for nombre, etapa in datos.get("etapas", {}).items():
+            self.segundos[nombre] = self.segundos.get(nombre, 0.0) + etapa["segundos"]
+            self.llamadas[nombre] = self.llamadas.get(nombre, 0) + etapa["llamadas"]
+        for nombre, cantidad in datos.get("contadores", {}).items():
+            self.contar(nombre, cantidad)
+
+    def exportar_json(self, nombre_archivo: str):
+        with open(nombre_archivo, 'w', encoding='utf-8') as f:
+            json.dump(self.exportar(), f, indent=2, ensure_ascii=False)
+
+    def informe(self) -> str:
+        """Tiempos por etapa y contadores en texto legible"""
+        lineas = ["\n=== PERFIL DE EJECUCIÓN ==="]
+        for nombre, segundos in self.segundos.items():
+            lineas.append(f"{nombre:28} {segundos * 1000:>10.3f}ms  ({self.llamadas[nombre]} llamadas)")
+        for nombre, cantidad in self.contadores.items():
+            lineas.append(f"{nombre:28} {cantidad:>10}")
+        return "\n".join(lineas)
@@ -0,0 +1,153 @@
+# reportero.py
+import json
+import sys
+from typing import Dict, List, Optional, TextIO
+
+
+class Reportero:
+    """
+    Reportero nulo: descarta todos los eventos
+    Los algoritmos consultan `activo` antes de preparar los datos de un
+    evento, de modo que sin nadie escuchando no se formatea nada
+    """
+    activo = False
+
+    def evento(self, tipo: str, **datos):
+        """Recibe un evento con sus datos (valores serializables a JSON)"""
+        pass
+
+
+class ReporteroConsola(Reportero):
+    """Reproduce en texto legible la traza paso a paso de los algoritmos"""
+    activo = True
+
+    def __init__(self, salida: Optional[TextIO] = None):
+        self.salida = salida
+
+    def evento(self, tipo: str, **datos):
+        formatear = getattr(self, f"_{tipo}", None)
+        if formatear is not None:
+            print(formatear(**datos), file=self.salida or sys.stdout)
+
+    # --- Eliminación de producciones-ε ---
+
+    def _inicio_eliminacion(self) -> str:
+        return "=== ELIMINACIÓN DE PRODUCCIONES-ε ===\n"
+
+    def _anulables(self, anulables: List[str]) -> str:
+        return ("1. ENCONTRANDO SÍMBOLOS ANULABLES:\n"
+                f"Símbolos anulables encontrados: {anulables}")
+
+    def _producciones_actuales(self, producciones: Dict[str, str]) -> str:
+        lineas = ["\n2. PRODUCCIONES ACTUALES:"]
+        lineas.extend(f"  {nt} → {prods}" for nt, prods in producciones.items())
+        return "\n".join(lineas)
+
+    def _generando(self) -> str:
+        return "\n3. GENERANDO NUEVAS PRODUCCIONES:"
+
+    def _procesando_no_terminal(self, no_terminal: str) -> str:
+        return f"\nProcesando {no_terminal}:"
+
+    def _procesando_produccion(self, no_terminal: str, produccion: str) -> str:
+        return f"  Procesando producción: {no_terminal} → {produccion}"
+
+    def _produccion_epsilon(self, no_terminal: str) -> str:
+        return "    - Eliminando producción-ε"
+
+    def _variantes(self, no_terminal: str, variantes: List[str]) -> str:
+        return f"    - Variantes generadas: {{{', '.join(repr(v) for v in variantes)}}}"
+
+    def _produccion_factorizada(self, no_terminal: str, variantes: int, auxiliares: int) -> str:
+        return (f"    - {variantes} variantes superan el presupuesto: se factoriza "
+                f"con {auxiliares} auxiliares nuevos")
+
+    def _gramatica_resultante(self, simbolo_inicial: str, producciones: Dict[str, str],
+                              terminales: List[str], no_terminales: List[str]) -> str:
+        lineas = ["\n4. GRAMÁTICA RESULTANTE:",
+                  f"Símbolo inicial: {simbolo_inicial}",
+                  "Producciones:"]
+        lineas.extend(f"  {nt} → {prods}" for nt, prods in producciones.items())
+        lineas.append(f"Terminales: {terminales}")
+        lineas.append(f"No terminales: {no_terminales}")
+        return "\n".join(lineas)
+
+    def _paso_simplificacion(self, paso: str, cambio: bool, producciones: int) -> str:
+        estado = "aplicado" if cambio else "sin cambios"
+        return f"\n→ Paso '{paso}': {estado} ({producciones} producciones)"
+
+    # --- Equivalencia ---
+
+    def _inicio_equivalencia(self) -> str:
+        return "\n=== VALIDACIÓN DE EQUIVALENCIA ===\nProbando cadenas de ejemplo..."
+
+    def _probando_cadena(self, cadena: str, original: bool, simplificada: bool,
+                         coincide: bool) -> str:
+        marca = "✓" if coincide else "✗"
+        return (f"{marca} Probando cadena: '{cadena}' - original: "
+                f"{'acepta' if original else 'rechaza'}, simplificada: "
+                f"{'acepta' if simplificada else 'rechaza'}")
+
+    def _resultado_equivalencia(self, probadas: int, diferencias: List[str]) -> str:
+        if not diferencias:
+            return f"✓ Ambas gramáticas coinciden en las {probadas} cadenas probadas"
+        return (f"✗ Las gramáticas difieren en {len(diferencias)} de {probadas} cadenas: "
+                f"{diferencias}")
+
+    def _inicio_comparacion(self, longitud: int, muestras: int) -> str:
+        return (f"\n=== COMPARACIÓN DE LENGUAJES ===\nEnumerando cadenas de longitud <= {longitud}"
+                f" y {muestras} muestras uniformes por gramática...")
+
+    def _resultado_comparacion(self, enumeradas: int, muestreadas: int,
+                               solo_original: List[str], solo_simplificada: List[str]) -> str:
+        if not solo_original and not solo_simplificada:
+            return (f"✓ Los lenguajes coinciden en {enumeradas} cadenas enumeradas "
+                    f"y {muestreadas} muestreadas")
+        return (f"✗ Los lenguajes difieren: solo en la original {solo_original[:10]}, "
+                f"solo en la simplificada {solo_simplificada[:10]}")
+
+    # --- Validación de archivos ---
+
+    def _validando_archivo(self, archivo: str) -> str:
+        return f"=== VALIDANDO ARCHIVO: {archivo} ==="
+
+    def _linea_valida(self, linea: int, texto: str) -> str:
+        return f"✓ Línea {linea}: {texto}"
+
+    def _linea_invalida(self, linea: int, texto: str) -> str:
+        return f"✗ Línea {linea}: {texto}"
+
+    def _resultado_validacion(self, lineas_validas: int, errores: List[str]) -> str:
+        lineas = ["\nRESULTADOS DE VALIDACIÓN:",
+                  f"Líneas válidas: {lineas_validas}",
+                  f"Errores encontrados: {len(errores)}"]
+        if errores:
+            lineas.append("\nERRORES DETECTADOS:")
+            lineas.extend(f"  - {error}" for error in errores)
+        else:
+            lineas.append("✓ Archivo válido - todas las producciones están bien escritas")
+        return "\n".join(lineas)
+
+    def _archivo_no_encontrado(self, archivo: str) -> str:
+        return f"ERROR: No se encontró el archivo '{archivo}'"
+
+    def _error_lectura(self, archivo: str, mensaje: str) -> str:
+        return f"ERROR al leer archivo: {mensaje}"
+
+    def _gramatica_cargada(self, archivo: str) -> str:
+        return f"✓ Gramática cargada exitosamente desde {archivo}"
+
+    def _error_carga(self, archivo: str, mensaje: str) -> str:
+        return f"ERROR al cargar gramática: {mensaje}"
+
+
+class ReporteroJSONL(Reportero):
+    """Escribe cada evento como una línea JSON {"evento": tipo, ...datos}"""
+    activo = True
+
+    def __init__(self, destino: TextIO):
+        self.destino = destino
+
+    def evento(self, tipo: str, **datos):
+        registro = {"evento": tipo, **datos}
+        self.destino.write(json.dumps(registro, ensure_ascii=False) + "\n")
@@ -0,0 +1,223 @@
+# serializacion.py
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterator, List, Optional, Tuple
+from gramatica import EPSILON, BloqueProducciones, Gramatica, TablaSimbolos
+
+EXTENSION_BINARIA = '.cfgb'
+MAGIA = b'CFGB'
+VERSION_FORMATO = 1
+
+# Tras la magia: versión, inicial, símbolos, bloques, producciones,
+# símbolos en producciones, terminales, no terminales y bytes de nombres
+_CABECERA = struct.Struct('<4s9i')
+
+LINEAS_POR_LOTE = 4096
+TAMANO_BUFFER = 1 << 20
+
+ENCABEZADO_TEXTO = ("# Gramática simplificada (sin producciones-ε)",
+                    "# Símbolo inicial: {inicial}",
+                    "")
+
+
+class GramaticaMapeada:
+    """
+    Vista de solo lectura de un archivo .cfgb proyectado en memoria
+    Los arreglos son memoryview.cast('i') sobre el mmap, sin copiar: el
+    bloque k tiene sus símbolos en simbolos[desplazamientos[k]:desplazamientos[k + 1]]
+    y sus límites (relativos al bloque) en limites[inicios[k] + k:inicios[k + 1] + k + 1]
+    Se usa como administrador de contexto para liberar el mmap; los cortes
+    que se tomen de los arreglos deben liberarse antes de cerrar
+    """
+    __slots__ = ('nombres', 'inicial', 'cabezas', 'inicios', 'desplazamientos',
+                 'limites', 'simbolos', 'terminales', 'no_terminales',
+                 '_archivo', '_mapa', '_vistas')
+
+    def __init__(self, nombre_archivo: str):
+        self._archivo = open(nombre_archivo, 'rb')
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Un archivo vacío no se puede proyectar
+            self._archivo.close()
+            raise ValueError(f"{nombre_archivo}: no es un archivo {EXTENSION_BINARIA}")
+        datos = memoryview(self._mapa)
+        self._vistas = [datos]
+        try:
+            self._leer(datos, nombre_archivo)
+        except Exception:
+            self.cerrar()
+            raise
+
+    def _leer(self, datos: memoryview, nombre_archivo: str):
+        if len(datos) < _CABECERA.size:
+            raise ValueError(f"{nombre_archivo}: no es un archivo {EXTENSION_BINARIA}")
+        (magia, version, self.inicial, n_simbolos, n_bloques, n_producciones,
+         n_ocupados, n_terminales, n_no_terminales, bytes_nombres) = _CABECERA.unpack_from(datos)
+        if magia != MAGIA:
+            raise ValueError(f"{nombre_archivo}: no es un archivo {EXTENSION_BINARIA}")
+        if version != VERSION_FORMATO:
+            raise ValueError(f"{nombre_archivo}: versión de formato {version} no soportada")
+
+        tamanos = (n_bloques, n_bloques + 1, n_bloques + 1, n_producciones + n_bloques,
+                   n_ocupados, n_terminales, n_no_terminales)
+        fin_enteros = _CABECERA.size + 4 * sum(tamanos)
+        if len(datos) != fin_enteros + bytes_nombres:
+            raise ValueError(f"{nombre_archivo}: archivo truncado o dañado")
+
+        bytes_enteros = datos[_CABECERA.size:fin_enteros]
+        self._vistas.append(bytes_enteros)
+        enteros = bytes_enteros.cast('i')
+        if sys.byteorder == 'big':
+            # El formato es little-endian: aquí no se puede evitar la copia
+            copia = array('i', enteros)
+            copia.byteswap()
+            enteros = memoryview(copia)
+        self._vistas.append(enteros)
+        arreglos = []
+        inicio = 0
+        for tamano in tamanos:
+            arreglos.append(enteros[inicio:inicio + tamano])
+            inicio += tamano
+        (self.cabezas, self.inicios, self.desplazamientos, self.limites,
+         self.simbolos, self.terminales, self.no_terminales) = arreglos
+        self._vistas.extend(arreglos)
+
+        # Los nombres van separados por '\n', que nunca es un símbolo
+        # (los espacios se ignoran al tokenizar)
+        texto = bytes(datos[fin_enteros:]).decode('utf-8')
+        self.nombres: List[str] = texto.split('\n') if n_simbolos else []
+
+    def __len__(self) -> int:
+        """Número de no terminales con producciones"""
+        return len(self.cabezas)
+
+    def gramatica(self) -> Gramatica:
+        """Materializa la gramática: cada bloque se copia de una vez desde el mmap"""
+        gramatica = Gramatica(TablaSimbolos.desde_nombres(self.nombres))
+        gramatica._inicial = self.inicial
+        gramatica._terminales = set(self.terminales)
+        gramatica._no_terminales = set(self.no_terminales)
+
+        # Una copia de todo y luego cortes de array: sin un memoryview por bloque
+        inicios = self.inicios.tolist()
+        desplazamientos = self.desplazamientos.tolist()
+        simbolos = array('i')
+        simbolos.frombytes(self.simbolos.cast('B'))
+        limites = array('i')
+        limites.frombytes(self.limites.cast('B'))
+        nuevo = BloqueProducciones.__new__
+        bloques = gramatica._bloques
+        for k, cabeza in enumerate(self.cabezas.tolist()):
+            bloque = nuevo(BloqueProducciones)
+            bloque.simbolos = simbolos[desplazamientos[k]:desplazamientos[k + 1]]
+            bloque.limites = limites[inicios[k] + k:inicios[k + 1] + k + 1]
+            bloques[cabeza] = bloque
+        return gramatica
+
+    def cerrar(self):
+        for vista in reversed(self._vistas):
+            vista.release()
+        self._vistas = []
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self) -> 'GramaticaMapeada':
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def empaquetar(gramatica: Gramatica) -> Tuple[array, array, array, array, array]:
+    """
+    Producciones en arreglos planos (cabezas, inicios, desplazamientos,
+    límites, símbolos) con la disposición de GramaticaMapeada
+    """
+    cabezas = array('i')
+    inicios = array('i', [0])
+    desplazamientos = array('i', [0])
+    limites = array('i')
+    simbolos = array('i')
+    for cabeza, bloque in gramatica.bloques():
+        cabezas.append(cabeza)
+        limites.extend(bloque.limites)
+        simbolos.extend(bloque.simbolos)
+        inicios.append(inicios[-1] + len(bloque))
+        desplazamientos.append(len(simbolos))
+    return cabezas, inicios, desplazamientos, limites, simbolos
+
+
+def guardar_binario(gramatica: Gramatica, nombre_archivo: str) -> int:
+    """
+    Escribe la gramática en formato .cfgb: cabecera con la magia, arreglos
+    int32 little-endian (cabezas, índices por bloque, límites y símbolos de
+    las producciones, terminales y no terminales) y al final la tabla de
+    símbolos. Devuelve los bytes escritos
+    """
+    cabezas, inicios, desplazamientos, limites, simbolos = empaquetar(gramatica)
+    terminales = array('i', sorted(gramatica._terminales))
+    no_terminales = array('i', sorted(gramatica._no_terminales))
+    nombres = '\n'.join(gramatica.tabla.nombres).encode('utf-8')
+
+    arreglos = (cabezas, inicios, desplazamientos, limites, simbolos, terminales, no_terminales)
+    if sys.byteorder == 'big':
+        for arreglo in arreglos:
+            arreglo.byteswap()
+    cabecera = _CABECERA.pack(MAGIA, VERSION_FORMATO, gramatica.inicial,
+                              len(gramatica.tabla), len(cabezas), inicios[-1],
+                              len(simbolos), len(terminales), len(no_terminales),
+                              len(nombres))
+    with open(nombre_archivo, 'wb') as f:
+        escritos = f.write(cabecera)
+        for arreglo in arreglos:
+            escritos += f.write(arreglo)
+        escritos += f.write(nombres)
+    return escritos
+
+
+def cargar_binario(nombre_archivo: str) -> Gramatica:
+    """Carga una gramática guardada con guardar_binario"""
+    with GramaticaMapeada(nombre_archivo) as mapeada:
+        return mapeada.gramatica()
+
+
+def lineas_texto(gramatica: Gramatica) -> Iterator[str]:
+    """
+    Líneas 'A → α | β' ordenadas por no terminal. Los nombres de cada bloque
+    se buscan una sola vez y cada producción se une con un solo join
+    """
+    nombres = gramatica.tabla.nombres
+    for no_terminal in gramatica.no_terminales_ordenados():
+        bloque = gramatica.producciones_de(no_terminal)
+        texto = [nombres[s] for s in bloque.simbolos]
+        limites = bloque.limites
+        alternativas = [''.join(texto[limites[k]:limites[k + 1]]) or EPSILON
+                        for k in range(len(limites) - 1)]
+        yield f"{nombres[no_terminal]} → {' | '.join(alternativas)}"
+
+
+def escribir_texto(gramatica: Gramatica, nombre_archivo: str,
+                   lineas_por_lote: int = LINEAS_POR_LOTE,
+                   encabezado: Optional[List[str]] = None) -> int:
+    """
+    Escribe la gramática en el formato de texto de entrada acumulando las
+    líneas en lotes: una escritura por lote y no por no terminal, sin armar
+    el texto completo en memoria. Devuelve los bytes escritos
+    """
+    if encabezado is None:
+        encabezado = [linea.format(inicial=gramatica.simbolo_inicial)
+                      for linea in ENCABEZADO_TEXTO]
+    escritos = 0
+    with open(nombre_archivo, 'wb', buffering=TAMANO_BUFFER) as f:
+        lote = list(encabezado)
+        for linea in lineas_texto(gramatica):
+            lote.append(linea)
+            if len(lote) >= lineas_por_lote:
+                escritos += f.write(('\n'.join(lote) + '\n').encode('utf-8'))
+                lote = []
+        if lote:
+            escritos += f.write(('\n'.join(lote) + '\n').encode('utf-8'))
+    return escritos
@@ -0,0 +1,289 @@
+# servicio.py
+"""
+Servicio HTTP de simplificación de gramáticas (solo biblioteca estándar)
+
+    POST /simplificar   cuerpo: la gramática en texto; responde JSON con la
+                        gramática sin producciones-ε y sus estadísticas
+    GET  /metricas      latencias, rendimiento, cola y lotes
+
+Las solicitudes se encolan (cola acotada: si está llena se responde 503) y
+se agrupan en lotes que se validan y simplifican en un ProcessPoolExecutor,
+así un proceso largo evita pagar el arranque del intérprete por gramática
+
+    python servicio.py --puerto 8080 -j 8
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from lote import texto_gramatica
+from simplificador import SimplificadorCFG
+from validador import ErrorGramatica, ValidadorGramatica
+
+MAX_BYTES_CUERPO = 16 * 1024 * 1024
+MUESTRAS_LATENCIA = 2048
+VENTANA_RENDIMIENTO = 60.0
+
+MOTIVOS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+def simplificar_textos(textos: List[str]) -> List[Tuple[int, dict]]:
+    """
+    Trabajo de un lote en un proceso del pool: valida y simplifica cada
+    gramática y devuelve (código HTTP, respuesta) por cada una. Un error en
+    una gramática no afecta al resto del lote
+    """
+    validador = ValidadorGramatica()
+    resultados = []
+    for texto in textos:
+        try:
+            original = validador.cargar_gramatica_texto(texto)
+            simplificador = SimplificadorCFG()
+            simplificada = simplificador.eliminar_producciones_epsilon(original)
+            resultados.append((200, {
+                "gramatica": texto_gramatica(simplificada),
+                "estadisticas": simplificador.calcular_estadisticas(original, simplificada),
+            }))
+        except ErrorGramatica as e:
+            resultados.append((400, {"error": str(e), "errores": e.errores}))
+        except Exception as e:
+            resultados.append((500, {"error": str(e) or type(e).__name__}))
+    return resultados
+
+
+class Metricas:
+    """
+    Contadores del servicio, latencias recientes y rendimiento. Las
+    respuestas 4xx cuentan como errores del cliente; solo las 5xx son fallas
+    del servicio
+    """
+
+    def __init__(self):
+        self.inicio = time.monotonic()
+        self.atendidas = 0
+        self.rechazadas = 0
+        self.errores_cliente = 0
+        self.fallidas = 0
+        self.lotes = 0
+        self.en_lotes = 0
+        self.latencias: deque = deque(maxlen=MUESTRAS_LATENCIA)
+        self.terminadas: deque = deque()     # instantes de fin de la última ventana
+
+    def registrar(self, segundos: float, codigo: int):
+        self.atendidas += 1
+        if codigo >= 500:
+            self.fallidas += 1
+        elif codigo >= 400:
+            self.errores_cliente += 1
+        self.latencias.append(segundos)
+        ahora = time.monotonic()
+        self.terminadas.append(ahora)
+        while self.terminadas[0] < ahora - VENTANA_RENDIMIENTO:
+            self.terminadas.popleft()
+
+    def registrar_lote(self, tamano: int):
+        self.lotes += 1
+        self.en_lotes += tamano
+
+    def exportar(self, en_cola: int, capacidad: int) -> Dict:
+        ahora = time.monotonic()
+        activo = max(ahora - self.inicio, 1e-9)
+        recientes = sum(1 for t in self.terminadas if t >= ahora - VENTANA_RENDIMIENTO)
+        ordenadas = sorted(self.latencias)
+
+        def percentil(p: float) -> float:
+            if not ordenadas:
+                return 0.0
+            return ordenadas[min(len(ordenadas) - 1, int(p * len(ordenadas)))] * 1000
+
+        return {
+            "atendidas": self.atendidas,
+            "rechazadas": self.rechazadas,
+            "errores_cliente": self.errores_cliente,
+            "fallidas": self.fallidas,
+            "lotes": self.lotes,
+            "tamano_medio_lote": self.en_lotes / self.lotes if self.lotes else 0.0,
+            "latencia_ms": {"p50": percentil(0.50), "p95": percentil(0.95),
+                            "p99": percentil(0.99), "max": percentil(1.0)},
+            "rendimiento": {"por_segundo": self.atendidas / activo,
+                            "ultimo_minuto_por_segundo": recientes / min(activo, VENTANA_RENDIMIENTO)},
+            "cola": {"en_espera": en_cola, "capacidad": capacidad},
+            "segundos_activo": activo,
+        }
+
+
+class ServicioSimplificacion:
+    """
+    Servidor asyncio con una cola acotada de solicitudes y un recolector de
+    lotes por proceso trabajador: cada recolector espera una solicitud,
+    junta las que ya estén o lleguen en los siguientes `espera_lote`
+    segundos (hasta `tamano_lote`) y las manda juntas al pool en una sola tarea
+    """
+
+    def __init__(self, host: str = "127.0.0.1", puerto: int = 8080,
+                 trabajadores: Optional[int] = None, max_cola: int = 256,
+                 tamano_lote: int = 32, espera_lote: float = 0.005):
+        self.host = host
+        self.puerto = puerto
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.max_cola = max_cola
+        self.tamano_lote = tamano_lote
+        self.espera_lote = espera_lote
+        self.metricas = Metricas()
+        self._cola: Optional[asyncio.Queue] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self._recolectores: List[asyncio.Task] = []
+
+    async def iniciar(self):
+        """Abre el puerto (con puerto=0 se elige uno libre y queda en self.puerto)"""
+        self._cola = asyncio.Queue(self.max_cola)
+        # Con fork, un trabajador creado mientras hay conexiones abiertas
+        # heredaría sus sockets y el cliente no vería el cierre: se usa spawn
+        # y se arranca el pool antes de aceptar conexiones
+        self._pool = ProcessPoolExecutor(max_workers=self.trabajadores,
+                                         mp_context=multiprocessing.get_context('spawn'))
+        await asyncio.get_running_loop().run_in_executor(self._pool, simplificar_textos, [])
+        self._recolectores = [asyncio.create_task(self._recolectar())
+                              for _ in range(self.trabajadores)]
+        self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def detener(self):
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        for tarea in self._recolectores:
+            tarea.cancel()
+        await asyncio.gather(*self._recolectores, return_exceptions=True)
+        self._pool.shutdown(cancel_futures=True)
+
+    async def servir_para_siempre(self):
+        await self.iniciar()
+        print(f"Sirviendo en http://{self.host}:{self.puerto} "
+              f"({self.trabajadores} trabajadores, cola de {self.max_cola})")
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def _recolectar(self):
+        """Arma lotes desde la cola y los procesa en el pool"""
+        bucle = asyncio.get_running_loop()
+        while True:
+            lote = [await self._cola.get()]
+            self._juntar(lote)
+            if len(lote) < self.tamano_lote and self.espera_lote > 0:
+                # Ventana para que lleguen más solicitudes al mismo lote
+                await asyncio.sleep(self.espera_lote)
+                self._juntar(lote)
+
+            self.metricas.registrar_lote(len(lote))
+            try:
+                resultados = await bucle.run_in_executor(
+                    self._pool, simplificar_textos, [texto for texto, _ in lote])
+            except Exception as e:
+                resultados = [(500, {"error": str(e) or type(e).__name__})] * len(lote)
+            for (_, futuro), resultado in zip(lote, resultados):
+                # El cliente pudo haberse desconectado mientras tanto
+                if not futuro.done():
+                    futuro.set_result(resultado)
+
+    def _juntar(self, lote: list):
+        """Completa el lote con lo que ya está en la cola, sin esperar"""
+        while len(lote) < self.tamano_lote and not self._cola.empty():
+            lote.append(self._cola.get_nowait())
+
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        inicio = time.perf_counter()
+        try:
+            codigo, respuesta = await self._responder(lector)
+        except (asyncio.IncompleteReadError, ValueError, UnicodeDecodeError):
+            codigo, respuesta = 400, {"error": "solicitud HTTP mal formada"}
+        except ConnectionError:
+            escritor.close()
+            return
+        cuerpo = json.dumps(respuesta, ensure_ascii=False).encode('utf-8')
+        cabeceras = [f"HTTP/1.1 {codigo} {MOTIVOS[codigo]}",
+                     "Content-Type: application/json; charset=utf-8",
+                     f"Content-Length: {len(cuerpo)}",
+                     "Connection: close"]
+        if codigo == 503:
+            cabeceras.append("Retry-After: 1")
+        try:
+            escritor.write(("\r\n".join(cabeceras) + "\r\n\r\n").encode('latin-1') + cuerpo)
+            await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+        if codigo != 503:
+            self.metricas.registrar(time.perf_counter() - inicio, codigo)
+
+    async def _responder(self, lector: asyncio.StreamReader) -> Tuple[int, dict]:
+        """Lee una solicitud HTTP/1.1 y devuelve (código, respuesta JSON)"""
+        metodo, ruta, _ = (await lector.readline()).decode('latin-1').split(' ', 2)
+        longitud: Optional[int] = None
+        while True:
+            linea = (await lector.readline()).decode('latin-1').strip()
+            if not linea:
+                break
+            nombre, _, valor = linea.partition(':')
+            if nombre.strip().lower() == 'content-length':
+                longitud = int(valor)
+        ruta = ruta.split('?', 1)[0]
+
+        if ruta == '/metricas':
+            if metodo != 'GET':
+                return 405, {"error": "use GET"}
+            return 200, self.metricas.exportar(self._cola.qsize(), self.max_cola)
+        if ruta != '/simplificar':
+            return 404, {"error": f"ruta desconocida: {ruta}"}
+        if metodo != 'POST':
+            return 405, {"error": "use POST"}
+        if longitud is None or longitud <= 0:
+            # Sin Content-Length o con cuerpo vacío no hay gramática que encolar
+            return 400, {"error": "falta la gramática en el cuerpo (Content-Length)"}
+        if longitud > MAX_BYTES_CUERPO:
+            return 413, {"error": f"la gramática supera {MAX_BYTES_CUERPO} bytes"}
+
+        texto = (await lector.readexactly(longitud)).decode('utf-8')
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self._cola.put_nowait((texto, futuro))
+        except asyncio.QueueFull:
+            self.metricas.rechazadas += 1
+            return 503, {"error": "cola llena, reintente más tarde"}
+        return await futuro
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Servicio HTTP de simplificación de gramáticas")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--puerto', type=int, default=8080)
+    parser.add_argument('-j', '--trabajadores', type=int, default=None,
+                        help="procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument('--max-cola', type=int, default=256,
+                        help="solicitudes en espera antes de responder 503")
+    parser.add_argument('--tamano-lote', type=int, default=32)
+    parser.add_argument('--espera-lote-ms', type=float, default=5.0,
+                        help="cuánto espera un lote a que lleguen más solicitudes")
+    args = parser.parse_args(argv)
+
+    servicio = ServicioSimplificacion(args.host, args.puerto, args.trabajadores, args.max_cola,
+                                      args.tamano_lote, args.espera_lote_ms / 1000)
+    try:
+        asyncio.run(servicio.servir_para_siempre())
+    except KeyboardInterrupt:
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
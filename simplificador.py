@@ -1,130 +1,591 @@
 # simplificador.py
-from typing import Set, List, Dict
-from gramatica import Gramatica
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from analisis import crear_analisis, validar_motor
+from gramatica import BloqueProducciones, Gramatica
+from perfilador import Perfilador
+from reportero import Reportero
+
+# Cambia cada vez que cambia la salida de la simplificación (invalida cachés)
+VERSION_ALGORITMO = "2"
+
+# Máximo de variantes que se generan para una producción; por encima se
+# usa la eliminación factorizada con no terminales auxiliares
+PRESUPUESTO_VARIANTES = 4096
+
+
+def componentes_fuertes(nodos: Iterable[int], sucesores: Dict[int, List[int]]) -> List[List[int]]:
+    """
+    Componentes fuertemente conexas (Tarjan, iterativo para no agotar la
+    pila en cadenas largas). Se devuelven en orden topológico inverso:
+    cada componente aparece después de todas las que alcanza
+    """
+    indice: Dict[int, int] = {}
+    bajo: Dict[int, int] = {}
+    pila: List[int] = []
+    en_pila: Set[int] = set()
+    componentes: List[List[int]] = []
+
+    for raiz in nodos:
+        if raiz in indice:
+            continue
+        indice[raiz] = bajo[raiz] = len(indice)
+        pila.append(raiz)
+        en_pila.add(raiz)
+        trabajo = [(raiz, iter(sucesores.get(raiz, ())))]
+        while trabajo:
+            nodo, hijos = trabajo[-1]
+            for hijo in hijos:
+                if hijo not in indice:
+                    indice[hijo] = bajo[hijo] = len(indice)
+                    pila.append(hijo)
+                    en_pila.add(hijo)
+                    trabajo.append((hijo, iter(sucesores.get(hijo, ()))))
+                    break
+                if hijo in en_pila and indice[hijo] < bajo[nodo]:
+                    bajo[nodo] = indice[hijo]
+            else:
+                # Todos los hijos procesados: cerrar el nodo
+                trabajo.pop()
+                if trabajo:
+                    padre = trabajo[-1][0]
+                    if bajo[nodo] < bajo[padre]:
+                        bajo[padre] = bajo[nodo]
+                if bajo[nodo] == indice[nodo]:
+                    componente = []
+                    while True:
+                        miembro = pila.pop()
+                        en_pila.discard(miembro)
+                        componente.append(miembro)
+                        if miembro == nodo:
+                            break
+                    componentes.append(componente)
+    return componentes
+
 
 class SimplificadorCFG:
-    def __init__(self):
+    # Pasos de simplificar() en su orden canónico y los pasos que pueden
+    # volver a tener trabajo cuando cada uno cambia la gramática: quitar ε
+    # crea unitarias (A → BC con B anulable da A → C) y puede dejar sin
+    # producciones a un símbolo; quitar unitarias puede dejar inalcanzables
+    PASOS: Dict[str, Tuple[str, ...]] = {
+        'epsilon': ('unitarias', 'inutiles'),
+        'unitarias': ('inutiles',),
+        'inutiles': (),
+    }
+
+    def __init__(self, reportero: Optional[Reportero] = None,
+                 perfilador: Optional[Perfilador] = None,
+                 presupuesto_variantes: Optional[int] = PRESUPUESTO_VARIANTES,
+                 motor_analisis: str = 'lineal', trabajadores: int = 1):
+        validar_motor(motor_analisis)
         self.anulables_encontrados = set()
+        self.pasos_ejecutados: List[Tuple[str, bool]] = []
+        self.reportero = reportero or Reportero()
+        self.perfilador = perfilador or Perfilador()
+        # None desactiva el límite: siempre se generan las 2^m variantes
+        self.presupuesto_variantes = presupuesto_variantes
+        self.producciones_factorizadas = 0
+        self.auxiliares_creados = 0
+        # Motor de anulables, generadores y alcanzables (ver analisis.py)
+        self.motor_analisis = motor_analisis
+        # Procesos para generar las variantes por no terminal (ver paralelo.py)
+        self.trabajadores = trabajadores
+    
+    def simplificar(self, gramatica: Gramatica, pasos: Sequence[str] = tuple(PASOS)) -> Gramatica:
+        """
+        Aplica los pasos indicados ('epsilon', 'unitarias', 'inutiles') en
+        su orden canónico hasta un punto fijo. Un paso solo se repite si otro
+        cambió la gramática de una forma que puede darle trabajo, y un paso
+        sin nada que hacer no copia la gramática
+        """
+        desconocidos = set(pasos) - set(self.PASOS)
+        if desconocidos:
+            raise ValueError(f"Pasos desconocidos: {sorted(desconocidos)}")
+        
+        rep = self.reportero
+        orden = [paso for paso in self.PASOS if paso in pasos]
+        pendientes = set(orden)
+        self.pasos_ejecutados = []
+        actual = gramatica
+        
+        while pendientes:
+            paso = next(p for p in orden if p in pendientes)
+            pendientes.discard(paso)
+            with self.perfilador.etapa(f"paso_{paso}"):
+                actual, cambio = getattr(self, f"_paso_{paso}")(actual)
+            self.perfilador.contar("iteraciones_planificador")
+            self.pasos_ejecutados.append((paso, cambio))
+            if rep.activo:
+                rep.evento("paso_simplificacion", paso=paso, cambio=cambio,
+                           producciones=actual.num_producciones())
+            if cambio:
+                pendientes.update(p for p in self.PASOS[paso] if p in orden)
+        
+        return actual if actual is not gramatica else gramatica.copiar()
     
     def eliminar_producciones_epsilon(self, gramatica: Gramatica) -> Gramatica:
         """
         Elimina producciones-ε de una gramática CFG
-        Algoritmo basado en el método de los 2^m casos
+        Algoritmo basado en el método de los 2^m casos, generando las
+        variantes de forma perezosa. Las producciones con más variantes que
+        presupuesto_variantes se factorizan con no terminales auxiliares
+        Con trabajadores > 1 los bloques se expanden en un pool de procesos
+        (paralelo.py) con el mismo resultado que en secuencial
         """
-        print("=== ELIMINACIÓN DE PRODUCCIONES-ε ===\n")
+        rep = self.reportero
+        perf = self.perfilador
+        presupuesto = self.presupuesto_variantes
+        self.producciones_factorizadas = 0
+        self.auxiliares_creados = 0
+        if rep.activo:
+            rep.evento("inicio_eliminacion")
         
         # Paso 1: Encontrar símbolos anulables
-        print("1. ENCONTRANDO SÍMBOLOS ANULABLES:")
-        anulables = gramatica.obtener_producciones_epsilon()
-        self.anulables_encontrados = anulables
-        print(f"Símbolos anulables encontrados: {sorted(anulables)}")
+        with perf.etapa("anulables"):
+            analisis = crear_analisis(gramatica, self.motor_analisis)
+            anulables = analisis.anulables()
+        nombres = gramatica.tabla.nombres
+        self.anulables_encontrados = {nombres[s] for s in anulables}
+        if perf.activo:
+            perf.contar("iteraciones_punto_fijo", analisis.iteraciones)
         
         # Paso 2: Mostrar producciones actuales
-        print("\n2. PRODUCCIONES ACTUALES:")
-        for nt in sorted(gramatica.producciones.keys()):
-            prods = " | ".join(gramatica.producciones[nt])
-            print(f"  {nt} → {prods}")
+        if rep.activo:
+            rep.evento("anulables", anulables=sorted(self.anulables_encontrados))
+            rep.evento("producciones_actuales", producciones=self._producciones_texto(gramatica))
+            rep.evento("generando")
         
         # Paso 3: Generar nueva gramática sin producciones-ε
-        print("\n3. GENERANDO NUEVAS PRODUCCIONES:")
-        nueva_gramatica = Gramatica()
-        nueva_gramatica.simbolo_inicial = gramatica.simbolo_inicial
-        nueva_gramatica.terminales = gramatica.terminales.copy()
-        nueva_gramatica.no_terminales = gramatica.no_terminales.copy()
-        
-        for no_terminal, producciones in gramatica.producciones.items():
-            print(f"\nProcesando {no_terminal}:")
-            nuevas_prods = set()
-            
-            for prod in producciones:
-                print(f"  Procesando producción: {no_terminal} → {prod}")
-                
-                if prod == 'ε':
-                    print("    - Eliminando producción-ε")
-                    continue
-                
-                # Generar todas las combinaciones posibles
-                variantes = self._generar_variantes(prod, anulables)
-                print(f"    - Variantes generadas: {variantes}")
-                
-                nuevas_prods.update(variantes)
+        # La copia comparte los bloques con la original; solo se reescriben
+        # los no terminales con producciones-ε, símbolos anulables o
+        # producciones repetidas
+        nueva_gramatica = gramatica.copiar()
+        auxiliares: Dict[Tuple[int, ...], int] = {}
+        with perf.etapa("variantes"):
+            if self._usar_paralelo(gramatica):
+                from paralelo import expandir_en_paralelo
+                for no_terminal, bloque in expandir_en_paralelo(
+                        gramatica, anulables, presupuesto, self.trabajadores, perf):
+                    if bloque is None:
+                        # Factorizar crea auxiliares: en este proceso y en orden
+                        self._expandir_no_terminal(no_terminal, anulables, gramatica,
+                                                   nueva_gramatica, auxiliares)
+                    else:
+                        nueva_gramatica.reemplazar_bloque(no_terminal, bloque)
+            else:
+                for no_terminal, producciones in gramatica.bloques():
+                    if not rep.activo and not self._necesita_reescritura(producciones, anulables):
+                        if perf.activo:
+                            perf.contar("bloques_compartidos")
+                        continue
+                    self._expandir_no_terminal(no_terminal, anulables, gramatica,
+                                               nueva_gramatica, auxiliares)
+        if perf.activo and self.producciones_factorizadas:
+            perf.contar("producciones_factorizadas", self.producciones_factorizadas)
+            perf.contar("auxiliares_creados", self.auxiliares_creados)
+        
+        if rep.activo:
+            rep.evento("gramatica_resultante",
+                       simbolo_inicial=nueva_gramatica.simbolo_inicial,
+                       producciones=self._producciones_texto(nueva_gramatica),
+                       terminales=sorted(nueva_gramatica.terminales),
+                       no_terminales=sorted(nueva_gramatica.no_terminales))
+        
+        return nueva_gramatica
+    
+    def _usar_paralelo(self, gramatica: Gramatica) -> bool:
+        """
+        La traza paso a paso necesita el orden secuencial, y en gramáticas
+        chicas el arranque de los procesos cuesta más que lo que se reparte
+        """
+        if self.trabajadores <= 1 or self.reportero.activo:
+            return False
+        from paralelo import conviene_paralelo
+        return conviene_paralelo(gramatica)
+    
+    def _expandir_no_terminal(self, no_terminal: int, anulables: Set[int], gramatica: Gramatica,
+                              nueva_gramatica: Gramatica, auxiliares: Dict[Tuple[int, ...], int]):
+        """Reescribe en nueva_gramatica las producciones de un no terminal sin ε"""
+        rep = self.reportero
+        perf = self.perfilador
+        presupuesto = self.presupuesto_variantes
+        nombres = gramatica.tabla.nombres
+        producciones = gramatica.producciones_de(no_terminal)
+        generadas = 0
+        if rep.activo:
+            rep.evento("procesando_no_terminal", no_terminal=nombres[no_terminal])
+        nuevas_prods = {}
+        
+        for prod in producciones:
+            if rep.activo:
+                rep.evento("procesando_produccion", no_terminal=nombres[no_terminal],
+                           produccion=gramatica.tabla.formatear(prod))
             
-            # Eliminar cadena vacía si no es el símbolo inicial
-            nuevas_prods.discard('')
-            if no_terminal == gramatica.simbolo_inicial and '' in nuevas_prods:
-                nuevas_prods.add('ε')
-                nuevas_prods.discard('')
+            if not prod:
+                if rep.activo:
+                    rep.evento("produccion_epsilon", no_terminal=nombres[no_terminal])
+                continue
             
-            # Agregar producciones a la nueva gramática
-            if nuevas_prods:
-                nueva_gramatica.producciones[no_terminal] = list(nuevas_prods)
+            if presupuesto is not None and \
+                    self.contar_variantes(prod, anulables) > presupuesto:
+                # Demasiadas combinaciones: factorizar en vez de expandir
+                creados = self.auxiliares_creados
+                variantes = self._factorizar(prod, anulables, gramatica,
+                                             nueva_gramatica, auxiliares)
+                self.producciones_factorizadas += 1
+                if rep.activo:
+                    formatear = nueva_gramatica.tabla.formatear
+                    rep.evento("produccion_factorizada", no_terminal=nombres[no_terminal],
+                               variantes=self.contar_variantes(prod, anulables),
+                               auxiliares=self.auxiliares_creados - creados)
+                    rep.evento("variantes", no_terminal=nombres[no_terminal],
+                               variantes=[formatear(v) for v in variantes])
+                generadas += len(variantes)
+                nuevas_prods.update(dict.fromkeys(variantes))
+            # Generar todas las combinaciones posibles
+            elif rep.activo or perf.activo:
+                variantes = list(self._generar_variantes(prod, anulables))
+                if rep.activo:
+                    formatear = gramatica.tabla.formatear
+                    rep.evento("variantes", no_terminal=nombres[no_terminal],
+                               variantes=[formatear(v) for v in variantes])
+                generadas += len(variantes)
+                nuevas_prods.update(dict.fromkeys(variantes))
+            else:
+                nuevas_prods.update(dict.fromkeys(self._generar_variantes(prod, anulables)))
         
-        print("\n4. GRAMÁTICA RESULTANTE:")
-        nueva_gramatica.mostrar()
+        # Eliminar cadena vacía si no es el símbolo inicial
+        vacia = () in nuevas_prods
+        nuevas_prods.pop((), None)
+        if perf.activo:
+            perf.contar("variantes_generadas", generadas)
+            perf.contar("variantes_conservadas", len(nuevas_prods))
+            perf.contar("duplicadas_descartadas", generadas - len(nuevas_prods) - vacia)
         
-        return nueva_gramatica
+        nueva_gramatica.reemplazar_producciones(no_terminal, nuevas_prods)
+    
+    def eliminar_producciones_unitarias(self, gramatica: Gramatica) -> Gramatica:
+        """
+        Reemplaza las producciones A → B por las producciones no unitarias
+        de todos los símbolos alcanzables desde A por cadenas unitarias
+        """
+        return self._paso_unitarias(gramatica)[0]
+    
+    def eliminar_simbolos_inutiles(self, gramatica: Gramatica) -> Gramatica:
+        """
+        Elimina los símbolos que no generan ninguna cadena de terminales y
+        luego los que no son alcanzables desde el símbolo inicial
+        """
+        return self._paso_inutiles(gramatica)[0]
+    
+    def _paso_epsilon(self, gramatica: Gramatica) -> Tuple[Gramatica, bool]:
+        if not crear_analisis(gramatica, self.motor_analisis).anulables():
+            return gramatica, False
+        return self.eliminar_producciones_epsilon(gramatica), True
     
-    def _generar_variantes(self, produccion: str, anulables: Set[str]) -> Set[str]:
+    def _paso_unitarias(self, gramatica: Gramatica) -> Tuple[Gramatica, bool]:
         """
-        Genera todas las variantes posibles de una producción
-        eliminando combinaciones de símbolos anulables
+        Cierre unitario por componentes fuertemente conexas del grafo
+        A → B: todos los símbolos de una componente comparten el mismo
+        cierre, que se calcula una sola vez a partir de los cierres de las
+        componentes sucesoras (ya calculados, por el orden de Tarjan)
         """
-        if not produccion or produccion == 'ε':
-            return {produccion}
+        es_no_terminal = gramatica.tabla.no_terminal
+        unitarias: Dict[int, List[int]] = {}
+        hay_unitarias = False
+        for nt, bloque in gramatica.bloques():
+            destinos = [p[0] for p in bloque if len(p) == 1 and es_no_terminal[p[0]]]
+            unitarias[nt] = destinos
+            hay_unitarias = hay_unitarias or bool(destinos)
+        if not hay_unitarias:
+            return gramatica, False
         
-        # Encontrar posiciones de símbolos anulables
-        posiciones_anulables = []
-        for i, simbolo in enumerate(produccion):
-            if simbolo in anulables:
-                posiciones_anulables.append(i)
+        componentes = componentes_fuertes(list(unitarias), unitarias)
+        componente_de = {nt: c for c, miembros in enumerate(componentes) for nt in miembros}
         
-        if not posiciones_anulables:
-            return {produccion}
+        cierres: List[Dict[Tuple[int, ...], None]] = []
+        for c, miembros in enumerate(componentes):
+            cierre: Dict[Tuple[int, ...], None] = {}
+            for nt in miembros:
+                for prod in gramatica.producciones_de(nt):
+                    if not (len(prod) == 1 and es_no_terminal[prod[0]]):
+                        cierre[tuple(prod)] = None
+            for nt in miembros:
+                for destino in unitarias.get(nt, ()):
+                    d = componente_de[destino]
+                    if d != c:
+                        cierre.update(cierres[d])
+            cierres.append(cierre)
         
-        # Generar todos los casos posibles (2^m combinaciones)
-        num_anulables = len(posiciones_anulables)
-        variantes = set()
+        nueva = self._gramatica_vacia(gramatica)
+        for nt in unitarias:
+            for prod in cierres[componente_de[nt]]:
+                nueva.agregar_produccion_ids(nt, prod)
+        return nueva, True
+    
+    def _paso_inutiles(self, gramatica: Gramatica) -> Tuple[Gramatica, bool]:
+        """
+        Quita los no terminales que no son generadores y luego los que no
+        son alcanzables por producciones útiles, con el motor de análisis
+        configurado
+        """
+        es_no_terminal = gramatica.tabla.no_terminal
+        analisis = crear_analisis(gramatica, self.motor_analisis)
+        generadores = analisis.generadores()
+        alcanzables = analisis.alcanzables(generadores)
+        
+        def util(prod) -> bool:
+            return all(not es_no_terminal[s] or s in generadores for s in prod)
+        
+        nueva = self._gramatica_vacia(gramatica)
+        for nt, bloque in gramatica.bloques():
+            if nt in alcanzables:
+                for prod in bloque:
+                    if util(prod):
+                        nueva.agregar_produccion_ids(nt, prod)
+        
+        if nueva.num_producciones() == gramatica.num_producciones():
+            return gramatica, False
+        return nueva, True
+    
+    def _gramatica_vacia(self, gramatica: Gramatica) -> Gramatica:
+        """Gramática sin producciones con la misma tabla y símbolo inicial"""
+        nueva = Gramatica(gramatica.tabla)
+        if gramatica.inicial >= 0:
+            nueva.establecer_inicial(gramatica.simbolo_inicial)
+        return nueva
+    
+    def _necesita_reescritura(self, producciones: BloqueProducciones, anulables: Set[int]) -> bool:
+        """Un bloque se puede compartir tal cual si no cambia al quitar ε"""
+        limites = producciones.limites
+        if any(limites[k] == limites[k + 1] for k in range(len(limites) - 1)):
+            return True
+        if not anulables.isdisjoint(producciones.simbolos):
+            return True
+        # Las producciones repetidas se eliminan al reescribir
+        return len({p.tobytes() for p in producciones}) != len(producciones)
+    
+    def _producciones_texto(self, gramatica: Gramatica) -> Dict[str, str]:
+        """Producciones en texto (A → α | β) ordenadas por no terminal"""
+        nombres = gramatica.tabla.nombres
+        return {nombres[nt]: gramatica.formatear_producciones(nt)
+                for nt in gramatica.no_terminales_ordenados()}
+    
+    def _generar_variantes(self, produccion: Sequence[int], anulables: Set[int],
+                           limite: Optional[int] = None) -> Iterator[Tuple[int, ...]]:
+        """
+        Genera perezosamente las variantes de una producción eliminando
+        combinaciones de símbolos anulables
+        Las rachas de un mismo símbolo anulable (p. ej. AAA) se tratan como
+        un solo segmento del que se conservan 0..k copias, así no se generan
+        los duplicados que producirían sus 2^k subconjuntos. Las variantes se
+        construyen como un odómetro sobre un prefijo compartido: al avanzar
+        el segmento j solo se reconstruye el prefijo a partir de j
+        """
+        segmentos, cola = self._segmentar(produccion, anulables)
+        
+        if not segmentos:
+            if limite is None or limite > 0:
+                yield tuple(produccion)
+            return
+        
+        n = len(segmentos)
+        cuentas = [cantidad for _, _, cantidad in segmentos]
+        marcas = [0] * (n + 1)   # longitud del prefijo al inicio de cada segmento
+        prefijo: List[int] = []
+        desde = 0
+        emitidas = 0
         
-        # Para cada combinación binaria posible
-        for i in range(2 ** num_anulables):
-            nueva_prod = list(produccion)
+        while limite is None or emitidas < limite:
+            # Reconstruir el prefijo solo a partir del segmento que cambió
+            del prefijo[marcas[desde]:]
+            for k in range(desde, n):
+                fijo, simbolo, _ = segmentos[k]
+                prefijo.extend(fijo)
+                prefijo.extend((simbolo,) * cuentas[k])
+                marcas[k + 1] = len(prefijo)
             
-            # Determinar qué símbolos anulables omitir
-            for j in range(num_anulables):
-                if (i >> j) & 1:  # Si el bit j está activado
-                    pos = posiciones_anulables[j]
-                    nueva_prod[pos] = None  # Marcar para eliminación
+            yield tuple(prefijo) + cola
+            emitidas += 1
             
-            # Construir la nueva producción
-            resultado = ''.join(s for s in nueva_prod if s is not None)
-            variantes.add(resultado)
+            # Avanzar el odómetro (el último segmento cambia más rápido)
+            k = n - 1
+            while k >= 0 and cuentas[k] == 0:
+                cuentas[k] = segmentos[k][2]
+                k -= 1
+            if k < 0:
+                return
+            cuentas[k] -= 1
+            desde = k
+    
+    def _factorizar(self, produccion: Sequence[int], anulables: Set[int],
+                    gramatica: Gramatica, nueva: Gramatica,
+                    auxiliares: Dict[Tuple[int, ...], int]) -> List[Tuple[int, ...]]:
+        """
+        Eliminación factorizada de ε para una producción con demasiadas
+        variantes: se binariza por segmentos en una cadena a derecha
+        A → α₀ F₁, F₁ → α₁ F₂, ... con un auxiliar por sufijo, y cada eslabón
+        solo decide cuántas copias de su racha anulable conserva y si su
+        sufijo desaparece. El tamaño queda lineal en la producción
+        Los auxiliares se agregan a `nueva` (con su propia tabla, como en la
+        FNC) y se comparten entre producciones con el mismo sufijo; se
+        devuelven las variantes de la producción original
+        """
+        if nueva.tabla is gramatica.tabla:
+            nueva.tabla = gramatica.tabla.copiar()
+        segmentos, cola = self._segmentar(produccion, anulables)
+        inicios = []
+        inicio = 0
+        for fijo, _, cantidad in segmentos:
+            inicios.append(inicio)
+            inicio += len(fijo) + cantidad
         
-        return variantes
+        # Sufijo ya procesado: su representación y si puede desaparecer
+        resto: Tuple[int, ...] = cola
+        resto_anulable = not cola
+        for k in range(len(segmentos) - 1, -1, -1):
+            fijo, simbolo, cantidad = segmentos[k]
+            variantes: Dict[Tuple[int, ...], None] = {}
+            for copias in range(cantidad, -1, -1):
+                base = fijo + (simbolo,) * copias
+                variantes[base + resto] = None
+                if resto and resto_anulable:
+                    variantes[base] = None
+            variantes.pop((), None)
+            if k == 0:
+                return list(variantes)
+            
+            sufijo = tuple(produccion[inicios[k]:])
+            auxiliar = auxiliares.get(sufijo)
+            if auxiliar is None:
+                auxiliar = nueva.nuevo_no_terminal("F")
+                nueva.reemplazar_producciones(auxiliar, variantes)
+                auxiliares[sufijo] = auxiliar
+                self.auxiliares_creados += 1
+            resto = (auxiliar,)
+            resto_anulable = resto_anulable and not fijo
+        return [tuple(produccion)]
+    
+    def contar_variantes(self, produccion: Sequence[int], anulables: Set[int]) -> int:
+        """Número de variantes que generaría _generar_variantes, sin generarlas"""
+        segmentos, _ = self._segmentar(produccion, anulables)
+        total = 1
+        for _, _, cantidad in segmentos:
+            total *= cantidad + 1
+        return total
+    
+    def _segmentar(self, produccion: Sequence[int], anulables: Set[int]
+                   ) -> Tuple[List[Tuple[Tuple[int, ...], int, int]], Tuple[int, ...]]:
+        """
+        Divide una producción en segmentos (fijo, simbolo, cantidad): símbolos
+        no anulables seguidos de una racha de un mismo símbolo anulable
+        Devuelve además la cola fija final
+        """
+        segmentos = []
+        fijo: List[int] = []
+        i = 0
+        n = len(produccion)
+        while i < n:
+            simbolo = produccion[i]
+            if simbolo not in anulables:
+                fijo.append(simbolo)
+                i += 1
+                continue
+            j = i + 1
+            while j < n and produccion[j] == simbolo:
+                j += 1
+            segmentos.append((tuple(fijo), simbolo, j - i))
+            fijo = []
+            i = j
+        return segmentos, tuple(fijo)
+    
+    def calcular_estadisticas(self, original: Gramatica, simplificada: Gramatica) -> Dict[str, int]:
+        """Estadísticas de la simplificación como diccionario"""
+        prod_originales = original.num_producciones()
+        prod_simplificadas = simplificada.num_producciones()
+        return {
+            "producciones_originales": prod_originales,
+            "producciones_simplificadas": prod_simplificadas,
+            "anulables": len(self.anulables_encontrados),
+            "reduccion": prod_originales - prod_simplificadas,
+            "factorizadas": self.producciones_factorizadas,
+            "auxiliares": self.auxiliares_creados,
+        }
     
     def mostrar_estadisticas(self, original: Gramatica, simplificada: Gramatica):
-        """Muestra estadísticas de la simplificación"""
+        """Muestra estadísticas de la simplificación (y el perfil, si se midió)"""
+        self.imprimir_estadisticas(self.calcular_estadisticas(original, simplificada))
+        if self.perfilador.activo:
+            print(self.perfilador.informe())
+    
+    @staticmethod
+    def imprimir_estadisticas(estadisticas: Dict[str, int]):
+        """Imprime estadísticas ya calculadas (p. ej. recuperadas de la caché)"""
         print("\n=== ESTADÍSTICAS DE SIMPLIFICACIÓN ===")
+        print(f"Producciones originales: {estadisticas['producciones_originales']}")
+        print(f"Producciones simplificadas: {estadisticas['producciones_simplificadas']}")
+        print(f"Símbolos anulables eliminados: {estadisticas['anulables']}")
+        print(f"Reducción: {estadisticas['reduccion']} producciones")
+        # Las estadísticas guardadas por versiones anteriores no tienen estas claves
+        if estadisticas.get("factorizadas"):
+            print(f"Producciones factorizadas (superaban el presupuesto de variantes): "
+                  f"{estadisticas['factorizadas']} con {estadisticas['auxiliares']} auxiliares")
+    
+    def validar_equivalencia(self, original: Gramatica, simplificada: Gramatica, 
+                           cadenas_prueba: List[str], ignorar_vacia: bool = True) -> bool:
+        """
+        Valida que ambas gramáticas acepten exactamente las mismas cadenas
+        de prueba, reconociéndolas con CYK sobre la FNC de cada una
+        La eliminación de producciones-ε genera L(G) - {ε}, por eso con
+        ignorar_vacia la cadena vacía no cuenta como diferencia
+        """
+        from cyk import ReconocedorCYK
+        
+        rep = self.reportero
+        if rep.activo:
+            rep.evento("inicio_equivalencia")
+        
+        en_original = ReconocedorCYK(original).acepta_varias(cadenas_prueba)
+        en_simplificada = ReconocedorCYK(simplificada).acepta_varias(cadenas_prueba)
         
-        prod_originales = sum(len(prods) for prods in original.producciones.values())
-        prod_simplificadas = sum(len(prods) for prods in simplificada.producciones.values())
+        diferencias = []
+        for cadena, a, b in zip(cadenas_prueba, en_original, en_simplificada):
+            coincide = a == b or (ignorar_vacia and not cadena)
+            if rep.activo:
+                rep.evento("probando_cadena", cadena=cadena, original=a, simplificada=b,
+                           coincide=coincide)
+            if not coincide:
+                diferencias.append(cadena)
         
-        print(f"Producciones originales: {prod_originales}")
-        print(f"Producciones simplificadas: {prod_simplificadas}")
-        print(f"Símbolos anulables eliminados: {len(self.anulables_encontrados)}")
-        print(f"Reducción: {prod_originales - prod_simplificadas} producciones")
+        if rep.activo:
+            rep.evento("resultado_equivalencia", probadas=len(cadenas_prueba),
+                       diferencias=diferencias)
+        
+        return not diferencias
     
-    def validar_equivalencia(self, original: Gramatica, simplificada: Gramatica, 
-                           cadenas_prueba: List[str]) -> bool:
+    def comparar_lenguajes(self, original: Gramatica, simplificada: Gramatica, longitud: int,
+                           muestras: int = 0, longitud_muestreo: Optional[int] = None,
+                           semilla: int = 0, ignorar_vacia: bool = True):
         """
-        Valida que ambas gramáticas generen el mismo lenguaje
-        (Implementación básica para demostración)
+        Comparación diferencial sin cadenas elegidas a mano: enumera todas
+        las cadenas de ambas gramáticas hasta `longitud` y además prueba
+        `muestras` cadenas uniformes de cada una en la otra
+        (ver enumeracion.comparar_gramaticas)
         """
-        print("\n=== VALIDACIÓN DE EQUIVALENCIA ===")
-        print("Probando cadenas de ejemplo...")
+        from enumeracion import comparar_gramaticas
+        
+        rep = self.reportero
+        if rep.activo:
+            rep.evento("inicio_comparacion", longitud=longitud, muestras=muestras)
         
-        for cadena in cadenas_prueba:
-            print(f"Probando cadena: '{cadena}'")
-            # Aquí iría la implementación del algoritmo CYK o similar
-            # Por ahora solo mostramos que se puede probar
+        with self.perfilador.etapa("comparacion_lenguajes"):
+            resultado = comparar_gramaticas(original, simplificada, longitud, muestras,
+                                            longitud_muestreo, semilla, ignorar_vacia)
         
-        return True
\ No newline at end of file
+        if rep.activo:
+            rep.evento("resultado_comparacion", enumeradas=resultado.enumeradas,
+                       muestreadas=resultado.muestreadas,
+                       solo_original=sorted(resultado.solo_original, key=lambda c: (len(c), c)),
+                       solo_simplificada=sorted(resultado.solo_simplificada,
+                                                key=lambda c: (len(c), c)))
+        return resultado
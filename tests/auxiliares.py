@@ -0,0 +1,44 @@
+# auxiliares.py
+from typing import Dict, Set
+from gramatica import Gramatica
+
+
+def lenguaje_hasta(gramatica: Gramatica, longitud: int) -> Set[str]:
+    """
+    Cadenas de longitud <= longitud generadas por la gramática, calculadas
+    por punto fijo sobre conjuntos de cadenas (referencia independiente)
+    """
+    nombres = gramatica.tabla.nombres
+    es_no_terminal = gramatica.tabla.no_terminal
+    lenguajes: Dict[int, Set[str]] = {nt: set() for nt, _ in gramatica.bloques()}
+
+    cambio = True
+    while cambio:
+        cambio = False
+        for nt, bloque in gramatica.bloques():
+            for prod in bloque:
+                parciales = {''}
+                for simbolo in prod:
+                    if es_no_terminal[simbolo]:
+                        opciones = lenguajes.get(simbolo, set())
+                    else:
+                        opciones = {nombres[simbolo]}
+                    parciales = {p + o for p in parciales for o in opciones
+                                 if len(p) + len(o) <= longitud}
+                nuevas = parciales - lenguajes[nt]
+                if nuevas:
+                    lenguajes[nt] |= nuevas
+                    cambio = True
+    return lenguajes.get(gramatica.inicial, set())
+
+
+def gramatica_desde(*lineas: str) -> Gramatica:
+    """Construye una gramática a partir de líneas 'A → α | β'"""
+    gramatica = Gramatica()
+    for linea in lineas:
+        izquierda, derecha = linea.split('→')
+        if gramatica.inicial < 0:
+            gramatica.establecer_inicial(izquierda.strip())
+        for prod in derecha.split('|'):
+            gramatica.agregar_produccion(izquierda.strip(), prod.strip())
+    return gramatica
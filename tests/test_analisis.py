@@ -0,0 +1,69 @@
+# test_analisis.py
+import random
+import pytest
+import analisis
+from auxiliares import gramatica_desde
+from analisis import crear_analisis, motores_disponibles
+from benchmarks.generadores import generar_gramatica
+from simplificador import SimplificadorCFG
+
+MOTORES = motores_disponibles()
+
+
+def _resultados(gramatica, motor):
+    motor = crear_analisis(gramatica, motor)
+    generadores = motor.generadores()
+    return motor.anulables(), generadores, motor.alcanzables(generadores)
+
+
+def _aleatoria(rng):
+    lineas = []
+    for nt in 'SABCDE':
+        alternativas = [''.join(rng.choice('SABCDEFab') for _ in range(rng.randint(0, 3)))
+                        for _ in range(rng.randint(1, 3))]
+        lineas.append(f"{nt} → {' | '.join(a or 'ε' for a in alternativas)}")
+    return gramatica_desde(*lineas)
+
+
+@pytest.mark.parametrize('motor', MOTORES)
+def test_motores_coinciden_con_el_lineal(motor):
+    rng = random.Random(6)
+    for _ in range(300):
+        gramatica = _aleatoria(rng)
+        assert _resultados(gramatica, motor) == _resultados(gramatica, 'lineal')
+
+    gramatica = gramatica_desde(*generar_gramatica(no_terminales=500, densidad_anulable=0.3))
+    assert _resultados(gramatica, motor) == _resultados(gramatica, 'lineal')
+
+
+@pytest.mark.parametrize('motor', MOTORES)
+def test_casos_borde(motor):
+    ids = lambda g, *nombres: {g.tabla.ids[n] for n in nombres}
+    gramatica = gramatica_desde('S → AB | a', 'A → ε | AA', 'B → A | C', 'C → cC')
+    anulables, generadores, alcanzables = _resultados(gramatica, motor)
+    assert anulables == ids(gramatica, 'S', 'A', 'B')
+    assert generadores == ids(gramatica, 'S', 'A', 'B')
+    assert alcanzables == ids(gramatica, 'S', 'A', 'B')
+
+    # El inicial no genera nada: no hay alcanzables
+    gramatica = gramatica_desde('S → aS', 'A → a')
+    assert _resultados(gramatica, motor) == (set(), ids(gramatica, 'A'), set())
+
+
+@pytest.mark.parametrize('motor', MOTORES)
+def test_simplificador_con_cada_motor(motor):
+    rng = random.Random(8)
+    for _ in range(40):
+        gramatica = _aleatoria(rng)
+        referencia = SimplificadorCFG().simplificar(gramatica)
+        resultado = SimplificadorCFG(motor_analisis=motor).simplificar(gramatica)
+        assert resultado.producciones == referencia.producciones
+
+
+def test_motor_invalido(monkeypatch):
+    with pytest.raises(ValueError, match='desconocido'):
+        SimplificadorCFG(motor_analisis='gpu')
+    monkeypatch.setattr(analisis, 'np', None)
+    assert motores_disponibles() == ['lineal', 'bits']
+    with pytest.raises(ValueError, match='NumPy'):
+        crear_analisis(gramatica_desde('S → a'), 'numpy')
@@ -0,0 +1,41 @@
+# test_benchmarks.py
+import json
+import pytest
+from benchmarks.bench_pipeline import ETAPAS, comparar, ejecutar
+from benchmarks.generadores import ESCENARIOS, generar_gramatica
+from validador import ValidadorGramatica
+
+
+@pytest.mark.parametrize('nombre', sorted(ESCENARIOS))
+def test_escenarios_generan_gramaticas_validas(nombre):
+    parametros = dict(ESCENARIOS[nombre], no_terminales=30)
+    validador = ValidadorGramatica()
+    for linea in generar_gramatica(**parametros):
+        validador.analizar_linea(linea)
+
+
+def test_generador_es_determinista_y_respeta_densidad():
+    assert generar_gramatica(semilla=3) == generar_gramatica(semilla=3)
+    assert not any('ε' in linea for linea in generar_gramatica(densidad_anulable=0.0))
+    todas = generar_gramatica(no_terminales=20, densidad_anulable=1.0)
+    assert all(linea.endswith('| ε') for linea in todas)
+
+
+def test_cadenas_produce_unitarias():
+    lineas = generar_gramatica(no_terminales=10, producciones_por_nt=3, forma='cadenas')
+    primera = lineas[0].split('→')[1].split('|')[0].strip()
+    assert primera.startswith('<N') and primera.endswith('>') and primera.count('<') == 1
+
+
+def test_ejecutar_emite_json_y_detecta_regresiones():
+    resultados = ejecutar(['pequena'], escala=0.2, repeticiones=1)
+    json.dumps(resultados)
+    datos = resultados['escenarios']['pequena']
+    assert set(datos['etapas']) == set(ETAPAS)
+    assert datos['producciones_simplificadas'] > 0 and datos['bytes_salida'] > 0
+
+    assert comparar(resultados, resultados, 1.5) == []
+    lenta = json.loads(json.dumps(resultados))
+    for medida in lenta['escenarios']['pequena']['etapas'].values():
+        medida['segundos'] = medida['segundos'] * 10 + 1
+    assert len(comparar(lenta, resultados, 1.5)) == len(ETAPAS)
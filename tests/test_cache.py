@@ -0,0 +1,61 @@
+# test_cache.py
+import os
+from auxiliares import gramatica_desde
+from cache import CacheResultados, huella_gramatica
+from lote import procesar_lote
+
+
+def test_huella_no_depende_del_orden():
+    a = gramatica_desde('S → aA | B | ε', 'A → b', 'B → c | A')
+    b = gramatica_desde('S → B | ε | aA', 'B → A | c', 'A → b')
+    c = gramatica_desde('S → aA | B', 'A → b', 'B → c | A')
+    assert huella_gramatica(a) == huella_gramatica(b)
+    assert huella_gramatica(a) != huella_gramatica(c)
+
+
+def test_huella_depende_del_simbolo_inicial():
+    a = gramatica_desde('S → A', 'A → a')
+    b = gramatica_desde('A → a', 'S → A')
+    assert huella_gramatica(a) != huella_gramatica(b)
+
+
+def test_obtener_y_guardar(tmp_path):
+    cache = CacheResultados(str(tmp_path))
+    assert cache.obtener('abc') is None
+    cache.guardar('abc', 'S → a\n', {'producciones_originales': 2})
+    assert cache.obtener('abc') == ('S → a\n', {'producciones_originales': 2})
+
+
+def test_expulsion_lru(tmp_path):
+    cache = CacheResultados(str(tmp_path), max_bytes=10 ** 6)
+    texto = 'x' * 300
+    for i, clave in enumerate(['a', 'b', 'c']):
+        cache.guardar(clave, texto, {})
+        os.utime(tmp_path / f'{clave}.json', (1000 + i, 1000 + i))
+    # Un acierto en 'a' la convierte en la más reciente
+    assert cache.obtener('a') is not None
+
+    cache.max_bytes = cache.tamano() - 1
+    cache.podar()
+    assert cache.obtener('b') is None
+    assert cache.obtener('a') is not None and cache.obtener('c') is not None
+
+
+def test_lote_usa_la_cache(tmp_path):
+    for nombre, contenido in [('g1.txt', 'S → aA | ε\nA → b | ε'),
+                              ('g2.txt', 'A → b | ε\nS → ε | aA'),
+                              ('g3.txt', 'S → aS | b')]:
+        (tmp_path / nombre).write_text(contenido, encoding='utf-8')
+    archivos = [str(tmp_path / n) for n in ('g1.txt', 'g2.txt', 'g3.txt')]
+    directorio_cache = str(tmp_path / 'cache')
+
+    primera = procesar_lote(archivos, 1, directorio_cache=directorio_cache)
+    assert [r.desde_cache for r in primera] == [False, False, False]
+
+    segunda = procesar_lote(archivos, 1, directorio_cache=directorio_cache)
+    assert [r.desde_cache for r in segunda] == [True, True, True]
+    assert all(r.exito for r in segunda)
+    assert [r.producciones_simplificadas for r in segunda] == \
+        [r.producciones_simplificadas for r in primera]
+    with open(segunda[0].salida, encoding='utf-8') as f:
+        assert 'S → aA | a' in f.read()
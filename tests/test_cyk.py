@@ -0,0 +1,92 @@
+# test_cyk.py
+import itertools
+import pytest
+from auxiliares import gramatica_desde, lenguaje_hasta
+from cyk import ReconocedorCYK
+from normalizador import ConvertidorFNC
+from simplificador import SimplificadorCFG
+
+GRAMATICAS = {
+    'gramatica2': ('S → aAa | bBb | ε', 'A → C | a', 'B → C | b',
+                   'C → CDE | ε', 'D → A | B | ab'),
+    'gramatica3': ('S → ASA | aB', 'A → B | S', 'B → b | ε'),
+    'cadena_unitaria': ('S → A | aSb', 'A → B', 'B → C | ab', 'C → S | ε'),
+    'parentesis': ('S → SS | (S) | ε',),
+    'nombres_largos': ('<E> → <E>+<T> | <T>', '<T> → a | (<E>)'),
+}
+
+
+def _cadenas(terminales, longitud):
+    return [''.join(p) for n in range(longitud + 1)
+            for p in itertools.product(sorted(terminales), repeat=n)]
+
+
+@pytest.mark.parametrize('nombre', sorted(GRAMATICAS))
+def test_cyk_coincide_con_enumeracion(nombre):
+    gramatica = gramatica_desde(*GRAMATICAS[nombre])
+    lenguaje = lenguaje_hasta(gramatica, 6)
+    cadenas = _cadenas(gramatica.terminales, 6)
+
+    reconocedor = ReconocedorCYK(gramatica)
+    aceptadas = reconocedor.acepta_varias(cadenas)
+    assert {c for c, a in zip(cadenas, aceptadas) if a} == lenguaje
+    # Cadena por cadena (sin ordenar) el resultado es el mismo
+    assert [reconocedor.acepta(c) for c in reversed(cadenas)] == aceptadas[::-1]
+
+
+def test_cadena_vacia_segun_inicial_anulable():
+    assert ReconocedorCYK(gramatica_desde('S → AB', 'A → ε | a', 'B → A')).acepta('')
+    assert not ReconocedorCYK(gramatica_desde('S → aA', 'A → ε')).acepta('')
+
+
+def test_fnc_no_modifica_la_tabla_original():
+    gramatica = gramatica_desde(*GRAMATICAS['gramatica3'])
+    simbolos = list(gramatica.tabla.nombres)
+    fnc = ConvertidorFNC().convertir(gramatica)
+    assert gramatica.tabla.nombres == simbolos
+    es_no_terminal = fnc.tabla.no_terminal
+    for _, bloque in fnc.bloques():
+        for prod in bloque:
+            assert (len(prod) == 1 and not es_no_terminal[prod[0]]) or \
+                (len(prod) == 2 and all(es_no_terminal[s] for s in prod))
+
+
+@pytest.mark.parametrize('nombre', sorted(GRAMATICAS))
+def test_validar_equivalencia_tras_eliminar_epsilon(nombre):
+    original = gramatica_desde(*GRAMATICAS[nombre])
+    simplificador = SimplificadorCFG()
+    simplificada = simplificador.eliminar_producciones_epsilon(original)
+    cadenas = _cadenas(original.terminales, 5)
+    assert simplificador.validar_equivalencia(original, simplificada, cadenas)
+
+    # Sin ignorar ε solo difieren si la original genera la cadena vacía
+    acepta_vacia = '' in lenguaje_hasta(original, 0)
+    estricta = simplificador.validar_equivalencia(original, simplificada, cadenas,
+                                                 ignorar_vacia=False)
+    assert estricta == (not acepta_vacia)
+
+
+def test_validar_equivalencia_detecta_diferencias():
+    original = gramatica_desde('S → aS | b')
+    distinta = gramatica_desde('S → aS | a')
+    assert not SimplificadorCFG().validar_equivalencia(original, distinta, ['ab', 'b'])
+
+
+def test_prefijos_compartidos_evitan_recalcular_columnas():
+    gramatica = gramatica_desde(*GRAMATICAS['parentesis'])
+    prefijo = '()' * 30
+    cadenas = [prefijo + a + b for a in '()' for b in '()'] * 10
+
+    reconocedor = ReconocedorCYK(gramatica)
+    compartido = reconocedor.acepta_varias(cadenas)
+    # Una tabla completa de 62 columnas (62·63/2 celdas) y, al pasar a
+    # cada una de las otras tres cadenas, solo las columnas tras el prefijo
+    assert reconocedor.celdas_calculadas == 1953 + 62 + (61 + 62) + 62
+
+    aislado = []
+    for cadena in cadenas:
+        reconocedor._cadena = ''          # olvidar el prefijo anterior
+        del reconocedor._columnas[1:]
+        aislado.append(reconocedor.acepta(cadena))
+    assert compartido == aislado
+    assert reconocedor.celdas_calculadas == 2200 + 40 * 1953
@@ -0,0 +1,76 @@
+# test_earley.py
+import random
+import pytest
+from auxiliares import gramatica_desde, lenguaje_hasta
+from earley import ReconocedorEarley
+from test_cyk import GRAMATICAS, _cadenas
+
+EXPRESIONES = ('<E> → <E>+<T> | <T>', '<T> → <T>*<F> | <F>', '<F> → a | (<E>)')
+
+
+def _hojas(arbol):
+    if isinstance(arbol, str):
+        return arbol
+    return ''.join(_hojas(hijo) for hijo in arbol[1])
+
+
+@pytest.mark.parametrize('nombre', sorted(GRAMATICAS))
+def test_earley_coincide_con_enumeracion(nombre):
+    gramatica = gramatica_desde(*GRAMATICAS[nombre])
+    lenguaje = lenguaje_hasta(gramatica, 5)
+    reconocedor = ReconocedorEarley(gramatica)
+    for cadena in _cadenas(gramatica.terminales, 5):
+        assert reconocedor.acepta(cadena) == (cadena in lenguaje), cadena
+        bosque = reconocedor.analizar(cadena)
+        assert (bosque is not None) == (cadena in lenguaje)
+        if bosque is not None:
+            assert _hojas(bosque.arbol()) == cadena
+
+
+def test_bosque_comparte_arboles_ambiguos():
+    reconocedor = ReconocedorEarley(gramatica_desde('S → SS | a'))
+    bosque = reconocedor.analizar('a' * 8)
+    # Número de Catalan C7: árboles binarios con 8 hojas
+    assert bosque.contar_arboles() == 429 and bosque.es_ambiguo()
+    assert len(bosque) < 429
+
+    bosque = ReconocedorEarley(gramatica_desde(*EXPRESIONES)).analizar('a+a*(a+a)')
+    assert bosque.contar_arboles() == 1 and not bosque.es_ambiguo()
+    assert bosque.arbol()[0] == '<E>'
+
+
+def test_gramatica_ciclica_y_producciones_epsilon():
+    bosque = ReconocedorEarley(gramatica_desde('S → S | a')).analizar('a')
+    assert bosque.contar_arboles() == float('inf')
+    assert bosque.arbol() == ('S', ['a'])
+
+    reconocedor = ReconocedorEarley(gramatica_desde('S → ABA', 'A → ε | a', 'B → ε | b'))
+    assert [reconocedor.acepta(c) for c in ('', 'a', 'b', 'aba', 'aa', 'bb')] == \
+        [True, True, True, True, True, False]
+    assert reconocedor.analizar('a').contar_arboles() == 2
+
+
+def test_posicion_de_error_y_tokens():
+    reconocedor = ReconocedorEarley(gramatica_desde(*EXPRESIONES))
+    assert not reconocedor.acepta('a+*a')
+    assert reconocedor.posicion_error == 2
+    assert not reconocedor.acepta('a+b')
+    assert reconocedor.posicion_error == 2
+    assert not reconocedor.acepta('a+')
+    assert reconocedor.posicion_error == 2
+    assert reconocedor.acepta(['a', '+', 'a']) and reconocedor.posicion_error == -1
+
+
+def test_entrada_larga_en_tiempo_lineal():
+    reconocedor = ReconocedorEarley(gramatica_desde(*EXPRESIONES))
+    rng = random.Random(5)
+    partes = []
+    while sum(map(len, partes)) < 20000:
+        partes.append(rng.choice(['a', 'a*a', '(a+a)', '((a))*a']))
+    entrada = '+'.join(partes)
+    assert reconocedor.acepta(entrada)
+    # Los conjuntos quedan acotados por la cantidad de ítems de la gramática;
+    # si los orígenes crecieran con la entrada se superaría (los tiempos
+    # están en benchmarks/bench_earley.py)
+    assert reconocedor.items_procesados <= len(reconocedor._siguiente) * (len(entrada) + 1)
+    assert reconocedor.analizar(entrada).contar_arboles() == 1
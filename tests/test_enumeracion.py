@@ -0,0 +1,89 @@
+# test_enumeracion.py
+import random
+from collections import Counter
+import pytest
+from auxiliares import gramatica_desde, lenguaje_hasta
+from enumeracion import EnumeradorLenguaje, comparar_gramaticas
+from simplificador import SimplificadorCFG
+from test_cyk import GRAMATICAS
+
+
+@pytest.mark.parametrize('nombre', sorted(GRAMATICAS))
+def test_enumeracion_coincide_con_punto_fijo(nombre):
+    gramatica = gramatica_desde(*GRAMATICAS[nombre])
+    enumerador = EnumeradorLenguaje(gramatica, 7)
+    assert enumerador.lenguaje() == lenguaje_hasta(gramatica, 7)
+    # Las cuentas de árboles por longitud suman los árboles de cada cadena
+    for n in range(1, 6):
+        assert enumerador.contar_derivaciones(n) == \
+            sum(enumerador.contar_arboles(c) for c in enumerador.cadenas(n))
+
+
+def test_lenguaje_vacio_y_longitudes_fuera_de_rango():
+    enumerador = EnumeradorLenguaje(gramatica_desde('S → aS', 'A → a'), 4)
+    assert enumerador.lenguaje() == set()
+    assert enumerador.muestrear(random.Random(0)) is None
+    with pytest.raises(ValueError, match='fuera de rango'):
+        enumerador.cadenas(5)
+
+    solo_vacia = EnumeradorLenguaje(gramatica_desde('S → ε'), 3)
+    assert solo_vacia.lenguaje() == {''}
+    assert solo_vacia.muestrear(random.Random(0)) == ''
+
+
+def test_muestreo_uniforme_en_gramatica_ambigua():
+    # 'aba' tiene dos árboles y 'aab', 'baa' uno: sin el rechazo 'aba'
+    # saldría la mitad de las veces
+    enumerador = EnumeradorLenguaje(gramatica_desde('S → aS | Sa | b'), 3)
+    assert enumerador.contar_derivaciones(3) == 4
+    assert enumerador.contar_arboles('aba') == 2
+    rng = random.Random(3)
+    frecuencias = Counter(enumerador.muestrear(rng, 3) for _ in range(3000))
+    assert set(frecuencias) == {'aab', 'aba', 'baa'}
+    assert all(abs(f / 3000 - 1 / 3) < 0.04 for f in frecuencias.values())
+    assert enumerador.aceptadas < enumerador.intentos
+
+    # Sin longitud fija la distribución es uniforme entre todas las cadenas
+    frecuencias = Counter(enumerador.muestrear(rng) for _ in range(3000))
+    assert set(frecuencias) == {'b', 'ab', 'ba', 'aab', 'aba', 'baa'}
+    assert all(abs(f / 3000 - 1 / 6) < 0.04 for f in frecuencias.values())
+
+
+def test_muestreo_de_cadenas_largas():
+    gramatica = gramatica_desde(*GRAMATICAS['nombres_largos'])
+    enumerador = EnumeradorLenguaje(gramatica, 60)
+    rng = random.Random(1)
+    for _ in range(50):
+        cadena = enumerador.muestrear(rng, 59)
+        assert len(cadena) == 59 and cadena.count('(') == cadena.count(')')
+
+
+@pytest.mark.parametrize('nombre', sorted(GRAMATICAS))
+def test_comparacion_diferencial_tras_eliminar_epsilon(nombre):
+    original = gramatica_desde(*GRAMATICAS[nombre])
+    simplificada = SimplificadorCFG().eliminar_producciones_epsilon(original)
+    resultado = comparar_gramaticas(original, simplificada, 6, muestras=200,
+                                    longitud_muestreo=12, max_intentos=300)
+    assert resultado.equivalentes
+    assert resultado.enumeradas > 0
+    # gramatica3 es tan ambigua que el rechazo agota los intentos
+    assert resultado.muestreo_incompleto == (nombre == 'gramatica3')
+    assert resultado.muestreadas > 0 or resultado.muestreo_incompleto
+
+    estricta = comparar_gramaticas(original, simplificada, 3, ignorar_vacia=False)
+    assert estricta.solo_original == ({''} if '' in lenguaje_hasta(original, 0) else set())
+
+
+def test_comparacion_detecta_diferencias():
+    original = gramatica_desde('S → aS | b')
+    distinta = gramatica_desde('S → aaS | b')
+    resultado = SimplificadorCFG().comparar_lenguajes(original, distinta, 3)
+    assert resultado.solo_original == {'ab'} and not resultado.solo_simplificada
+
+    # Más allá de la longitud enumerada solo el muestreo encuentra diferencias
+    original = gramatica_desde('S → aS | c')
+    distinta = gramatica_desde('S → aaS | c')
+    assert comparar_gramaticas(original, distinta, 1).equivalentes
+    resultado = comparar_gramaticas(original, distinta, 1, muestras=50, longitud_muestreo=9)
+    assert resultado.solo_original and not resultado.solo_simplificada
+    assert all(len(c) % 2 == 0 for c in resultado.solo_original)
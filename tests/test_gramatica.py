@@ -0,0 +1,155 @@
+# test_gramatica.py
+from gramatica import Gramatica
+
+
+def _gramatica(*lineas):
+    gramatica = Gramatica()
+    for linea in lineas:
+        izquierda, derecha = linea.split('→')
+        for prod in derecha.split('|'):
+            gramatica.agregar_produccion(izquierda.strip(), prod.strip())
+    gramatica.establecer_inicial(lineas[0].split('→')[0].strip())
+    return gramatica
+
+
+def _anulables_referencia(gramatica):
+    """Punto fijo ingenuo, usado como referencia"""
+    producciones = gramatica.producciones
+    anulables = set()
+    cambio = True
+    while cambio:
+        cambio = False
+        for nt, prods in producciones.items():
+            if nt in anulables:
+                continue
+            for prod in prods:
+                if prod == 'ε' or all(c in anulables for c in prod):
+                    anulables.add(nt)
+                    cambio = True
+                    break
+    return anulables
+
+
+def test_anulables_gramatica_2():
+    gramatica = _gramatica('S → aAa | bBb | ε', 'A → C | a', 'B → C | b',
+                           'C → CDE | ε', 'D → A | B | ab')
+    assert gramatica.obtener_producciones_epsilon() == {'S', 'A', 'B', 'C', 'D'}
+
+
+def test_anulables_con_terminal_no_propagan():
+    gramatica = _gramatica('S → AB | a', 'A → ε', 'B → Ab')
+    assert gramatica.obtener_producciones_epsilon() == {'A'}
+
+
+def test_anulables_incrementales_tras_agregar_produccion():
+    gramatica = _gramatica('S → AB', 'A → aA | C', 'B → BB | b', 'C → c')
+    assert gramatica.obtener_producciones_epsilon() == set()
+
+    gramatica.agregar_produccion('C', 'ε')
+    assert gramatica.obtener_producciones_epsilon() == {'A', 'C'}
+
+    gramatica.agregar_produccion('B', 'CA')
+    assert gramatica.obtener_producciones_epsilon() == {'A', 'B', 'C', 'S'}
+
+
+def test_anulables_incrementales_coinciden_con_recalculo():
+    import random
+    rng = random.Random(7)
+    no_terminales = 'ABCDEFG'
+    for _ in range(50):
+        gramatica = Gramatica()
+        gramatica.establecer_inicial('A')
+        for paso in range(30):
+            derecha = ''.join(rng.choice(no_terminales + 'ab') for _ in range(rng.randint(0, 3)))
+            gramatica.agregar_produccion(rng.choice(no_terminales), derecha or 'ε')
+            if paso % 5 == 0:
+                # Consultar a mitad de camino activa el mantenimiento incremental
+                gramatica.obtener_producciones_epsilon()
+        assert gramatica.obtener_producciones_epsilon() == _anulables_referencia(gramatica)
+
+
+def test_tokenizar_nombres_largos_y_epsilon():
+    from gramatica import tokenizar
+    assert tokenizar('0A0') == ['0', 'A', '0']
+    assert tokenizar('<Expr>+<Term> a') == ['<Expr>', '+', '<Term>', 'a']
+    assert tokenizar(' ε ') == []
+
+
+def test_tokenizar_rechaza_delimitadores_sueltos_y_epsilon_interno():
+    import pytest
+    from gramatica import tokenizar
+    for cadena in ['<x y>', 'a<', 'a>b', '<>', 'aεb']:
+        with pytest.raises(ValueError):
+            tokenizar(cadena)
+
+
+def test_representacion_interna_y_vistas_textuales():
+    gramatica = _gramatica('<Expr> → <Expr>+<Term> | <Term>', '<Term> → a | ε')
+    assert gramatica.simbolo_inicial == '<Expr>'
+    assert gramatica.producciones == {'<Expr>': ['<Expr>+<Term>', '<Term>'],
+                                      '<Term>': ['a', 'ε']}
+    assert gramatica.terminales == {'+', 'a'}
+    assert gramatica.no_terminales == {'<Expr>', '<Term>'}
+    assert gramatica.num_producciones() == 4
+
+    expr = gramatica.tabla.ids['<Expr>']
+    primera = gramatica.producciones_de(expr)[0]
+    assert primera.typecode == 'i'
+    assert gramatica.tabla.formatear(primera) == '<Expr>+<Term>'
+
+
+def test_copiar_es_independiente():
+    original = _gramatica('S → aS | ε')
+    copia = original.copiar()
+    copia.agregar_produccion('S', 'b')
+    assert original.producciones == {'S': ['aS', 'ε']}
+    assert copia.producciones == {'S': ['aS', 'ε', 'b']}
+
+
+def test_copiar_comparte_bloques_hasta_modificarlos():
+    original = _gramatica('S → aA | ε', 'A → b')
+    s, a = original.tabla.ids['S'], original.tabla.ids['A']
+    copia = original.copiar()
+    assert copia.producciones_de(s) is original.producciones_de(s)
+
+    copia.agregar_produccion('S', 'c')
+    assert copia.producciones_de(s) is not original.producciones_de(s)
+    assert copia.producciones_de(a) is original.producciones_de(a)
+
+    # La original tampoco puede modificar un bloque que comparte
+    original.agregar_produccion('A', 'd')
+    assert original.producciones == {'S': ['aA', 'ε'], 'A': ['b', 'd']}
+    assert copia.producciones == {'S': ['aA', 'ε', 'c'], 'A': ['b']}
+    original.agregar_produccion('<X>', 'x')
+    assert '<X>' not in copia.no_terminales and 'x' not in copia.terminales
+
+
+def test_copias_encadenadas_y_reemplazo():
+    original = _gramatica('S → aS | b')
+    primera = original.copiar()
+    segunda = primera.copiar()
+    s = original.tabla.ids['S']
+    segunda.reemplazar_producciones(s, [(original.tabla.ids['b'],)])
+    primera.reemplazar_producciones(s, [])
+    assert original.producciones == {'S': ['aS', 'b']}
+    assert primera.producciones == {}
+    assert segunda.producciones == {'S': ['b']}
+    assert not primera.obtener_anulables_ids()
+
+
+def test_copiar_es_o1():
+    # Copiar no duplica bloques ni símbolos: las copias comparten todo con
+    # la original hasta modificarse (los tiempos, en bench_gramatica)
+    gramatica = Gramatica()
+    for i in range(20000):
+        gramatica.agregar_produccion(f'<N{i}>', f'a<N{i + 1}>b')
+    copias = [gramatica.copiar() for _ in range(1000)]
+    assert all(c._bloques is gramatica._bloques and c._terminales is gramatica._terminales
+               for c in copias)
+
+    # Modificar un no terminal duplica solo su bloque
+    copia = copias[0]
+    copia.agregar_produccion('<N7>', 'c')
+    propios = [nt for nt, bloque in copia._bloques.items() if bloque is not gramatica._bloques[nt]]
+    assert propios == [copia.tabla.ids['<N7>']]
+    assert copias[1]._bloques is gramatica._bloques
@@ -0,0 +1,120 @@
+# test_incremental.py
+import os
+import random
+import pytest
+from auxiliares import gramatica_desde
+from benchmarks.generadores import generar_gramatica
+from enumeracion import comparar_gramaticas
+from incremental import SimplificadorIncremental, vigilar
+from lote import SUFIJO_SALIDA, texto_gramatica
+from main import main
+from simplificador import SimplificadorCFG
+from validador import ValidadorGramatica
+
+
+def _completa(lineas):
+    return SimplificadorCFG().eliminar_producciones_epsilon(gramatica_desde(*lineas)).producciones
+
+
+def test_incremental_coincide_con_recalculo_tras_ediciones_aleatorias():
+    rng = random.Random(4)
+    lineas = generar_gramatica(no_terminales=40, densidad_anulable=0.4, semilla=1)
+    incremental = SimplificadorIncremental()
+    incremental.actualizar(gramatica_desde(*lineas))
+    assert incremental.gramatica().producciones == _completa(lineas)
+
+    for _ in range(60):
+        k = rng.randrange(1, len(lineas))
+        cabeza, derecha = lineas[k].split(' → ')
+        alternativas = derecha.split(' | ')
+        if 'ε' in alternativas and rng.random() < 0.5:
+            alternativas.remove('ε')
+        elif rng.random() < 0.5:
+            alternativas.append('ε')
+        else:
+            alternativas[0] = f'<N{rng.randrange(len(lineas))}>' + alternativas[0].replace('ε', '')
+        lineas[k] = f"{cabeza} → {' | '.join(alternativas or ['a'])}"
+        gramatica = gramatica_desde(*lineas)
+        incremental.actualizar(gramatica)
+        assert incremental.gramatica().producciones == _completa(lineas)
+        completa = SimplificadorCFG().eliminar_producciones_epsilon(gramatica)
+        assert incremental.texto() == texto_gramatica(completa)
+
+
+def test_solo_se_regenera_el_cono_afectado():
+    lineas = ['S → A | B', 'A → aC', 'C → c', 'B → bD', 'D → d | dD']
+    incremental = SimplificadorIncremental()
+    incremental.actualizar(gramatica_desde(*lineas))
+    assert incremental.ultimo_cambio['regenerados'] == 5
+
+    lineas[2] = 'C → c | ε'
+    assert incremental.actualizar(gramatica_desde(*lineas)) == {"no_terminales": 5, "modificados": 1,
+                                         "cono_anulables": 3, "anulables_cambiados": 1,
+                                         "regenerados": 2}
+    assert incremental.gramatica().producciones['A'] == ['aC', 'a']
+
+    incremental.actualizar(gramatica_desde(*lineas))
+    assert incremental.ultimo_cambio['regenerados'] == 0
+
+
+def test_no_terminal_eliminado():
+    incremental = SimplificadorIncremental()
+    incremental.actualizar(gramatica_desde('S → aA | b', 'A → ε | a'))
+    incremental.actualizar(gramatica_desde('S → aA | b'))
+    assert incremental.gramatica().producciones == {'S': ['aA', 'b']}
+
+
+def test_producciones_sobre_el_presupuesto_se_factorizan():
+    # 2^20 variantes: sin presupuesto la actualización no terminaría
+    larga = 'S → ' + 'aA' * 20 + ' | b'
+    lineas = [larga, 'A → a | ε', 'B → Sb | ε']
+    incremental = SimplificadorIncremental()
+    incremental.actualizar(gramatica_desde(*lineas))
+    resultado = incremental.gramatica()
+    auxiliares = [nt for nt in resultado.producciones if nt.startswith('<F')]
+    assert auxiliares and '<F' in incremental.texto()
+    assert sum(map(len, resultado.producciones.values())) < 200
+    assert comparar_gramaticas(gramatica_desde(*lineas), resultado, 8).equivalentes
+
+    # Editar otro no terminal conserva los auxiliares; A deja de ser
+    # anulable y S se regenera sin ellos
+    lineas[2] = 'B → Sb | bb'
+    incremental.actualizar(gramatica_desde(*lineas))
+    assert incremental.ultimo_cambio['regenerados'] == 1
+    assert [nt for nt in incremental.gramatica().producciones if nt.startswith('<F')] == auxiliares
+    lineas[1] = 'A → a'
+    incremental.actualizar(gramatica_desde(*lineas))
+    assert incremental.gramatica().producciones == _completa(lineas)
+
+    # Un no terminal nuevo con el nombre de un auxiliar obliga a renombrarlo
+    lineas[1] = 'A → a | ε'
+    incremental.actualizar(gramatica_desde(*lineas))
+    ocupado = next(nt for nt in incremental.gramatica().producciones if nt.startswith('<F'))
+    lineas.append(f'{ocupado} → c')
+    lineas[2] = f'B → Sb | {ocupado}'
+    incremental.actualizar(gramatica_desde(*lineas))
+    resultado = incremental.gramatica()
+    assert resultado.producciones[ocupado] == ['c']
+    assert comparar_gramaticas(gramatica_desde(*lineas), resultado, 8).equivalentes
+
+
+def test_vigilar_escribe_la_salida(tmp_path, capsys):
+    archivo = tmp_path / 'g.txt'
+    archivo.write_text('S → aA | ε\nA → b | ε', encoding='utf-8')
+    assert vigilar(str(archivo), intervalo=0, ciclos=2) == 0
+    salida = str(archivo)[:-4] + SUFIJO_SALIDA
+    assert ValidadorGramatica().cargar_gramatica(salida).producciones == \
+        {'S': ['aA', 'a'], 'A': ['b']}
+    assert capsys.readouterr().out.count('regenerados') == 1
+
+    archivo.write_text('S  a\n', encoding='utf-8')
+    vigilar(str(archivo), intervalo=0, ciclos=1)
+    assert '❌' in capsys.readouterr().out
+
+
+def test_cli_vigilar_requiere_un_archivo(tmp_path, capsys):
+    with pytest.raises(SystemExit) as salida:
+        main([str(tmp_path), '--vigilar'])
+    assert salida.value.code == 2
+    assert 'exactamente un archivo' in capsys.readouterr().err
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,48 @@
+# test_lote.py
+import os
+import pytest
+from lote import SUFIJO_SALIDA, expandir_entradas, procesar_lote
+from main import main
+from validador import ValidadorGramatica
+
+
+@pytest.fixture
+def directorio(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'g1.txt').write_text('S → aA | ε\nA → b | ε', encoding='utf-8')
+    (tmp_path / 'sub' / 'g2.txt').write_text('S → ASA | aB\nA → B | S\nB → b | ε',
+                                             encoding='utf-8')
+    (tmp_path / 'sub' / 'mala.txt').write_text('S  a', encoding='utf-8')
+    (tmp_path / 'sub' / ('g2' + SUFIJO_SALIDA)).write_text('S → a', encoding='utf-8')
+    return tmp_path
+
+
+def test_expandir_directorios_y_globs(directorio):
+    por_directorio = expandir_entradas([str(directorio)])
+    assert sorted(os.path.relpath(r, directorio) for r in por_directorio) == \
+        ['g1.txt', os.path.join('sub', 'g2.txt'), os.path.join('sub', 'mala.txt')]
+    por_glob = expandir_entradas([str(directorio / '**' / 'g*.txt')])
+    assert sorted(os.path.basename(r) for r in por_glob) == ['g1.txt', 'g2.txt']
+
+
+@pytest.mark.parametrize('trabajadores', [1, 2])
+def test_procesar_lote_conserva_orden_y_escribe_salidas(directorio, trabajadores):
+    archivos = expandir_entradas([str(directorio)])
+    resultados = procesar_lote(archivos, trabajadores)
+    assert [r.archivo for r in resultados] == archivos
+    assert [r.exito for r in resultados] == [True, True, False]
+
+    salida = ValidadorGramatica().cargar_gramatica(resultados[0].salida)
+    assert salida.producciones == {'S': ['aA', 'a'], 'A': ['b']}
+    assert resultados[2].error and resultados[2].segundos >= 0
+
+
+def test_cli_por_lotes(directorio, capsys):
+    destino = directorio / 'salidas'
+    codigo = main([str(directorio / 'g1.txt'), str(directorio / 'sub' / 'g2.txt'),
+                   '-j', '2', '-o', str(destino)])
+    assert codigo == 0
+    assert sorted(os.listdir(destino)) == ['g1' + SUFIJO_SALIDA, 'g2' + SUFIJO_SALIDA]
+    assert 'Total procesadas: 2/2' in capsys.readouterr().out
+
+    assert main([str(directorio / 'sub' / 'mala.txt')]) == 1
@@ -0,0 +1,91 @@
+# test_normalizador.py
+import random
+import pytest
+from auxiliares import gramatica_desde, lenguaje_hasta
+from normalizador import ConvertidorFNC, ConvertidorFNG, tamano_gramatica
+from test_cyk import GRAMATICAS
+
+
+def _es_fnc(gramatica):
+    es_no_terminal = gramatica.tabla.no_terminal
+    return all((len(p) == 1 and not es_no_terminal[p[0]]) or
+               (len(p) == 2 and all(es_no_terminal[s] for s in p))
+               for _, bloque in gramatica.bloques() for p in bloque)
+
+
+def _es_fng(gramatica):
+    es_no_terminal = gramatica.tabla.no_terminal
+    return all(len(p) >= 1 and not es_no_terminal[p[0]] and
+               all(es_no_terminal[s] for s in p[1:])
+               for _, bloque in gramatica.bloques() for p in bloque)
+
+
+@pytest.mark.parametrize('nombre', sorted(GRAMATICAS))
+@pytest.mark.parametrize('convertidor, forma', [(ConvertidorFNC, _es_fnc),
+                                                (ConvertidorFNG, _es_fng)])
+def test_forma_normal_conserva_el_lenguaje(nombre, convertidor, forma):
+    gramatica = gramatica_desde(*GRAMATICAS[nombre])
+    convertida = convertidor().convertir(gramatica)
+    assert forma(convertida)
+    assert lenguaje_hasta(convertida, 6) == lenguaje_hasta(gramatica, 6) - {''}
+
+
+def test_bin_antes_de_del_crece_polinomialmente():
+    anulables = [f'<A{i}>' for i in range(30)]
+    gramatica = gramatica_desde('S → ' + ''.join(anulables) + 'c',
+                                *[f'{a} → b | ε' for a in anulables])
+    fnc = ConvertidorFNC().convertir(gramatica)
+    # Con DEL primero la producción de S daría 2^30 variantes
+    assert tamano_gramatica(fnc)['producciones'] < 30 ** 2
+    assert lenguaje_hasta(fnc, 3) == {'c', 'bc', 'bbc'}
+
+
+def _adversaria(n):
+    # Con sustituciones en cadena <A0> tendría 2^n producciones
+    return gramatica_desde(*[f'<A{i}> → <A{i + 1}><A{i + 1}> | <B{i + 1}><B{i + 1}>' for i in range(n)],
+                           *[f'<B{i}> → <A{i + 1}><B{i + 1}> | <B{i + 1}><A{i + 1}>' for i in range(n)],
+                           f'<A{n}> → a | <A{n}>a', f'<B{n}> → b')
+
+
+def test_fng_crece_polinomialmente():
+    gramatica = _adversaria(30)
+    fnc = tamano_gramatica(ConvertidorFNC().convertir(gramatica))
+    fng = ConvertidorFNG().convertir(gramatica)
+    assert _es_fng(fng)
+    assert tamano_gramatica(fng)['producciones'] <= fnc['producciones'] ** 2
+
+    pequena = _adversaria(2)
+    assert lenguaje_hasta(ConvertidorFNG().convertir(pequena), 7) == lenguaje_hasta(pequena, 7)
+
+
+def test_fng_en_gramaticas_aleatorias():
+    rng = random.Random(24)
+    for _ in range(60):
+        lineas = [f"{nt} → " + ' | '.join(''.join(rng.choice('SABCDab') for _ in range(rng.randint(0, 4)))
+                                          or 'ε' for _ in range(rng.randint(1, 3)))
+                  for nt in 'SABCD']
+        gramatica = gramatica_desde(*lineas)
+        fng = ConvertidorFNG().convertir(gramatica)
+        assert _es_fng(fng)
+        assert lenguaje_hasta(fng, 5) == lenguaje_hasta(gramatica, 5) - {''}
+
+
+def test_sufijos_comunes_se_comparten():
+    gramatica = gramatica_desde('S → a<X>bcd | <Y>bcd', '<X> → x', '<Y> → y')
+    fnc = ConvertidorFNC()._binarizar(gramatica)
+    nombres = fnc.tabla.nombres
+    ayudantes = [nombres[nt] for nt, _ in fnc.bloques() if nombres[nt].startswith('<B')]
+    # <X>bcd y bcd comparten la cadena de ayudantes de bcd
+    assert len(ayudantes) == 3
+
+
+def test_estadisticas_antes_y_despues(capsys):
+    gramatica = gramatica_desde(*GRAMATICAS['gramatica3'])
+    convertidor = ConvertidorFNC()
+    estadisticas = convertidor.calcular_estadisticas(gramatica, convertidor.convertir(gramatica))
+    assert estadisticas['producciones_antes'] == 6
+    assert estadisticas['no_terminales_antes'] == 3
+    assert estadisticas['simbolos_antes'] == 8
+    assert estadisticas['producciones_despues'] > 0
+    convertidor.imprimir_estadisticas(estadisticas)
+    assert "Producciones: 6 →" in capsys.readouterr().out
@@ -0,0 +1,84 @@
+# test_paralelo.py
+import random
+import pytest
+import paralelo
+from auxiliares import gramatica_desde
+from benchmarks.generadores import generar_gramatica
+from lote import texto_gramatica
+from perfilador import PerfiladorActivo
+from simplificador import SimplificadorCFG
+
+
+@pytest.fixture
+def siempre_paralelo(monkeypatch):
+    monkeypatch.setattr(paralelo, 'MINIMO_PARALELO', 0)
+
+
+def _iguales(a, b):
+    assert [(nt, list(bloque)) for nt, bloque in a.bloques()] == \
+        [(nt, list(bloque)) for nt, bloque in b.bloques()]
+    assert texto_gramatica(a) == texto_gramatica(b)
+    assert a.terminales == b.terminales and a.no_terminales == b.no_terminales
+
+
+def test_paralelo_coincide_con_secuencial(siempre_paralelo):
+    gramatica = gramatica_desde(*generar_gramatica(no_terminales=400, densidad_anulable=0.4,
+                                                   longitud=6))
+    secuencial = SimplificadorCFG().eliminar_producciones_epsilon(gramatica)
+    for trabajadores in (2, 3):
+        simplificador = SimplificadorCFG(trabajadores=trabajadores)
+        assert simplificador._usar_paralelo(gramatica)
+        _iguales(simplificador.eliminar_producciones_epsilon(gramatica), secuencial)
+
+    # Gramáticas pequeñas con bloques que quedan vacíos, repetidos o sin cambios
+    rng = random.Random(4)
+    for _ in range(10):
+        lineas = [f"{nt} → " + ' | '.join(''.join(rng.choice('SABCab') for _ in range(rng.randint(0, 3)))
+                                          or 'ε' for _ in range(rng.randint(1, 3)))
+                  for nt in 'SABC']
+        gramatica = gramatica_desde(*lineas)
+        _iguales(SimplificadorCFG(trabajadores=2).eliminar_producciones_epsilon(gramatica),
+                 SimplificadorCFG().eliminar_producciones_epsilon(gramatica))
+
+
+def test_factorizacion_en_orden(siempre_paralelo):
+    # Los bloques que superan el presupuesto se factorizan en el proceso
+    # principal: los auxiliares se numeran igual que en secuencial
+    lineas = [f"<N{i}> → a{'A' * (i % 3)}B{'C' * 5}<N{i + 1}> | b" for i in range(30)]
+    lineas += ['<N30> → c', 'A → a | ε', 'B → b | ε', 'C → c | ε']
+    gramatica = gramatica_desde(*lineas)
+    secuencial = SimplificadorCFG(presupuesto_variantes=8)
+    esperada = secuencial.eliminar_producciones_epsilon(gramatica)
+    assert secuencial.producciones_factorizadas == 30
+
+    paralela = SimplificadorCFG(presupuesto_variantes=8, trabajadores=4)
+    _iguales(paralela.eliminar_producciones_epsilon(gramatica), esperada)
+    assert paralela.producciones_factorizadas == 30
+    assert paralela.auxiliares_creados == secuencial.auxiliares_creados
+
+
+def test_contadores_del_perfilador(siempre_paralelo):
+    gramatica = gramatica_desde(*generar_gramatica(no_terminales=200, densidad_anulable=0.5))
+    perfiles = []
+    for trabajadores in (1, 2):
+        perfilador = PerfiladorActivo()
+        SimplificadorCFG(perfilador=perfilador, trabajadores=trabajadores) \
+            .eliminar_producciones_epsilon(gramatica)
+        perfiles.append(perfilador.contadores)
+    assert perfiles[0] == perfiles[1]
+    assert perfiles[0]['variantes_generadas'] > perfiles[0]['variantes_conservadas']
+
+
+def test_gramaticas_chicas_quedan_en_secuencial():
+    gramatica = gramatica_desde('S → aA | ε', 'A → b | ε')
+    assert not SimplificadorCFG(trabajadores=8)._usar_paralelo(gramatica)
+
+
+def test_rangos_cubren_todos_los_bloques():
+    from array import array
+    desplazamientos = array('i', [0, 5, 5, 40, 41, 42, 100])
+    for tareas in (1, 2, 4, 100):
+        rangos = paralelo._rangos(desplazamientos, tareas)
+        assert rangos[0][0] == 0 and rangos[-1][1] == 6
+        assert all(a[1] == b[0] for a, b in zip(rangos, rangos[1:]))
+    assert paralelo._rangos(array('i', [0]), 4) == []
@@ -0,0 +1,82 @@
+# test_perfilador.py
+import json
+from auxiliares import gramatica_desde
+from lote import procesar_lote
+from main import main
+from perfilador import Perfilador, PerfiladorActivo
+from simplificador import SimplificadorCFG
+
+
+def test_perfilador_nulo_no_mide_nada():
+    perfilador = Perfilador()
+    with perfilador.etapa("x"):
+        perfilador.contar("y", 3)
+    assert not perfilador.activo and perfilador.exportar() == {}
+    assert SimplificadorCFG().perfilador.activo is False
+
+
+def test_contadores_de_variantes():
+    perfilador = PerfiladorActivo()
+    gramatica = gramatica_desde('S → Ab | b', 'A → ε | a')
+    SimplificadorCFG(perfilador=perfilador).eliminar_producciones_epsilon(gramatica)
+    contadores = perfilador.exportar()["contadores"]
+    # Ab -> Ab, b repite la alternativa b de S
+    assert contadores["variantes_generadas"] == 4
+    assert contadores["variantes_conservadas"] == 3
+    assert contadores["duplicadas_descartadas"] == 1
+    assert {"anulables", "variantes"} <= perfilador.exportar()["etapas"].keys()
+
+
+def _iteraciones(gramatica, motor):
+    perfilador = PerfiladorActivo()
+    SimplificadorCFG(perfilador=perfilador, motor_analisis=motor) \
+        .eliminar_producciones_epsilon(gramatica)
+    return perfilador.exportar()["contadores"]["iteraciones_punto_fijo"]
+
+
+def test_iteraciones_del_punto_fijo_segun_el_motor():
+    # El motor lineal saca cada anulable una vez de la lista de trabajo; el
+    # de bits hace una ronda por nivel de la cadena más una sin novedades
+    cadena = gramatica_desde('S → Bc | B', 'B → A | b', 'A → ε | a')
+    assert _iteraciones(cadena, 'lineal') == 3
+    assert _iteraciones(cadena, 'bits') == 4
+    plana = gramatica_desde('S → ABC | s', 'A → ε', 'B → ε', 'C → ε')
+    assert _iteraciones(plana, 'lineal') == 4
+    assert _iteraciones(plana, 'bits') == 3
+
+
+def test_combinar_y_exportar_json(tmp_path):
+    a, b = PerfiladorActivo(), PerfiladorActivo()
+    with a.etapa("carga"):
+        a.contar("bytes_escritos", 10)
+    with b.etapa("carga"):
+        b.contar("bytes_escritos", 5)
+    a.combinar(b.exportar())
+    a.exportar_json(str(tmp_path / 'p.json'))
+    datos = json.loads((tmp_path / 'p.json').read_text(encoding='utf-8'))
+    assert datos["etapas"]["carga"]["llamadas"] == 2
+    assert datos["contadores"] == {"bytes_escritos": 15}
+
+
+def test_estadisticas_incluyen_el_perfil(capsys):
+    simplificador = SimplificadorCFG(perfilador=PerfiladorActivo())
+    original = gramatica_desde('S → aA', 'A → ε | b')
+    simplificada = simplificador.eliminar_producciones_epsilon(original)
+    simplificador.mostrar_estadisticas(original, simplificada)
+    salida = capsys.readouterr().out
+    assert 'PERFIL DE EJECUCIÓN' in salida and 'variantes_generadas' in salida
+
+
+def test_lote_exporta_perfiles(tmp_path):
+    archivo = tmp_path / 'g.txt'
+    archivo.write_text('S → aA | ε\nA → b | ε', encoding='utf-8')
+    resultado, = procesar_lote([str(archivo)], trabajadores=1, perfilar=True)
+    salida = tmp_path / 'g_sin_epsilon.txt'
+    assert resultado.perfil["contadores"]["bytes_escritos"] == len(salida.read_bytes())
+    assert procesar_lote([str(archivo)], trabajadores=1)[0].perfil == {}
+
+    perfil = tmp_path / 'perfil.json'
+    assert main([str(archivo), '--perfil', str(perfil)]) == 0
+    datos = json.loads(perfil.read_text(encoding='utf-8'))
+    assert "escritura" in datos["archivos"][str(archivo)]["etapas"]
+    assert datos["total"]["contadores"]["bytes_escritos"] > 0
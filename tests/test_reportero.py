@@ -0,0 +1,125 @@
+# test_reportero.py
+import io
+import json
+from auxiliares import gramatica_desde
+from reportero import Reportero, ReporteroConsola, ReporteroJSONL
+from simplificador import SimplificadorCFG
+from validador import ValidadorGramatica
+
+LINEAS = ('S → aAb | ε', 'A → AA | a | ε')
+
+# Salida de los print que había antes de los reporteros
+VALIDACION = """\
+=== VALIDANDO ARCHIVO: {ruta} ===
+✓ Línea 1: S → aAb | ε
+✓ Línea 3: A → AA | a | ε
+✗ Línea 4: B b
+
+RESULTADOS DE VALIDACIÓN:
+Líneas válidas: 2
+Errores encontrados: 1
+
+ERRORES DETECTADOS:
+  - Línea 4: formato inválido - B b
+=== VALIDANDO ARCHIVO: {faltante} ===
+ERROR: No se encontró el archivo '{faltante}'
+"""
+
+ELIMINACION = """\
+=== ELIMINACIÓN DE PRODUCCIONES-ε ===
+
+1. ENCONTRANDO SÍMBOLOS ANULABLES:
+Símbolos anulables encontrados: ['A', 'S']
+
+2. PRODUCCIONES ACTUALES:
+  A → AA | a | ε
+  S → aAb | ε
+
+3. GENERANDO NUEVAS PRODUCCIONES:
+
+Procesando S:
+  Procesando producción: S → aAb
+    - Variantes generadas: {'aAb', 'ab'}
+  Procesando producción: S → ε
+    - Eliminando producción-ε
+
+Procesando A:
+  Procesando producción: A → AA
+    - Variantes generadas: {'AA', 'A', 'ε'}
+  Procesando producción: A → a
+    - Variantes generadas: {'a'}
+  Procesando producción: A → ε
+    - Eliminando producción-ε
+
+4. GRAMÁTICA RESULTANTE:
+Símbolo inicial: S
+Producciones:
+  A → AA | A | a
+  S → aAb | ab
+Terminales: ['a', 'b']
+No terminales: ['A', 'S']
+"""
+
+
+def test_consola_durante_la_validacion(tmp_path, capsys):
+    ruta = tmp_path / 'g.txt'
+    ruta.write_text(f'{LINEAS[0]}\n\n{LINEAS[1]}\nB b\n', encoding='utf-8')
+    faltante = str(tmp_path / 'no_existe.txt')
+    validador = ValidadorGramatica(ReporteroConsola())
+    assert not validador.validar_archivo(str(ruta))
+    assert not validador.validar_archivo(faltante)
+    assert capsys.readouterr().out == VALIDACION.format(ruta=ruta, faltante=faltante)
+
+    ruta.write_text('\n'.join(LINEAS), encoding='utf-8')
+    validador.cargar_gramatica_desde_archivo(str(ruta))
+    assert capsys.readouterr().out.endswith(
+        "Errores encontrados: 0\n"
+        "✓ Archivo válido - todas las producciones están bien escritas\n"
+        f"✓ Gramática cargada exitosamente desde {ruta}\n")
+
+
+def test_consola_durante_la_simplificacion(capsys):
+    SimplificadorCFG(ReporteroConsola()).eliminar_producciones_epsilon(gramatica_desde(*LINEAS))
+    assert capsys.readouterr().out == ELIMINACION
+
+    # Con un destino propio no se escribe en stdout
+    destino = io.StringIO()
+    SimplificadorCFG(ReporteroConsola(destino)).eliminar_producciones_epsilon(
+        gramatica_desde(*LINEAS))
+    assert destino.getvalue() == ELIMINACION and not capsys.readouterr().out
+
+
+def test_reportero_nulo_no_escribe(capsys):
+    assert not Reportero.activo
+    SimplificadorCFG().eliminar_producciones_epsilon(gramatica_desde(*LINEAS))
+    assert not capsys.readouterr().out
+
+
+def test_jsonl_del_simplificador():
+    destino = io.StringIO()
+    SimplificadorCFG(ReporteroJSONL(destino)).eliminar_producciones_epsilon(
+        gramatica_desde(*LINEAS))
+    eventos = [json.loads(linea) for linea in destino.getvalue().splitlines()]
+    assert [e['evento'] for e in eventos] == [
+        'inicio_eliminacion', 'anulables', 'producciones_actuales', 'generando',
+        'procesando_no_terminal', 'procesando_produccion', 'variantes',
+        'procesando_produccion', 'produccion_epsilon',
+        'procesando_no_terminal', 'procesando_produccion', 'variantes',
+        'procesando_produccion', 'variantes', 'procesando_produccion', 'produccion_epsilon',
+        'gramatica_resultante']
+    assert eventos[1] == {'evento': 'anulables', 'anulables': ['A', 'S']}
+    assert eventos[6] == {'evento': 'variantes', 'no_terminal': 'S', 'variantes': ['aAb', 'ab']}
+    assert eventos[-1] == {'evento': 'gramatica_resultante', 'simbolo_inicial': 'S',
+                           'producciones': {'A': 'AA | A | a', 'S': 'aAb | ab'},
+                           'terminales': ['a', 'b'], 'no_terminales': ['A', 'S']}
+
+
+def test_jsonl_de_una_produccion_factorizada():
+    destino = io.StringIO()
+    simplificador = SimplificadorCFG(ReporteroJSONL(destino), presupuesto_variantes=4)
+    simplificador.eliminar_producciones_epsilon(gramatica_desde('S → AbAbA', 'A → a | ε'))
+    eventos = [json.loads(linea) for linea in destino.getvalue().splitlines()]
+    factorizada, = [e for e in eventos if e['evento'] == 'produccion_factorizada']
+    assert factorizada == {'evento': 'produccion_factorizada', 'no_terminal': 'S',
+                           'variantes': 8, 'auxiliares': simplificador.auxiliares_creados}
+    assert factorizada['auxiliares'] > 0
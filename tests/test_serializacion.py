@@ -0,0 +1,107 @@
+# test_serializacion.py
+import os
+import pytest
+from auxiliares import gramatica_desde
+from benchmarks.generadores import generar_gramatica
+from gramatica import Gramatica
+from lote import cargar_gramatica, escribir_gramatica, procesar_lote, texto_gramatica
+from serializacion import (_CABECERA, GramaticaMapeada, cargar_binario, escribir_texto,
+                           guardar_binario)
+
+
+def _iguales(a, b):
+    assert a.producciones == b.producciones
+    assert a.simbolo_inicial == b.simbolo_inicial
+    assert a.terminales == b.terminales and a.no_terminales == b.no_terminales
+    assert a.tabla.nombres == b.tabla.nombres
+
+
+def test_ida_y_vuelta_binaria(tmp_path):
+    gramatica = gramatica_desde('<Expr> → <Expr>+T | T | ε', 'T → (<Expr>) | ñ', 'A → A')
+    archivo = str(tmp_path / 'g.cfgb')
+    assert guardar_binario(gramatica, archivo) == (tmp_path / 'g.cfgb').stat().st_size
+    cargada = cargar_binario(archivo)
+    _iguales(cargada, gramatica)
+    assert cargada.obtener_anulables_ids() == gramatica.obtener_anulables_ids()
+
+    # La gramática cargada se puede seguir modificando
+    cargada.agregar_produccion('T', 'x')
+    assert cargada.producciones['T'] == ['(<Expr>)', 'ñ', 'x']
+
+    vacia = str(tmp_path / 'vacia.cfgb')
+    guardar_binario(Gramatica(), vacia)
+    _iguales(cargar_binario(vacia), Gramatica())
+
+
+def test_vista_mapeada_sin_copia(tmp_path):
+    gramatica = gramatica_desde('S → aSb | ε', 'B → b')
+    archivo = str(tmp_path / 'g.cfgb')
+    guardar_binario(gramatica, archivo)
+    with GramaticaMapeada(archivo) as mapeada:
+        assert len(mapeada) == 2 and mapeada.simbolos.format == 'i'
+        assert mapeada.simbolos.readonly
+        k = list(mapeada.cabezas).index(gramatica.tabla.ids['S'])
+        with mapeada.limites[mapeada.inicios[k] + k:mapeada.inicios[k + 1] + k + 1] as limites:
+            assert limites.tolist() == [0, 3, 3]
+        assert [mapeada.nombres[s] for s in mapeada.simbolos.tolist()[:3]] == ['a', 'S', 'b']
+
+
+def test_archivos_binarios_invalidos(tmp_path):
+    archivo = tmp_path / 'g.cfgb'
+    for contenido in (b'', b'CFGB', b'XXXX' + bytes(40)):
+        archivo.write_bytes(contenido)
+        with pytest.raises(ValueError):
+            cargar_binario(str(archivo))
+
+    guardar_binario(gramatica_desde('S → a'), str(archivo))
+    archivo.write_bytes(archivo.read_bytes()[:-1])
+    with pytest.raises(ValueError, match='truncado'):
+        cargar_binario(str(archivo))
+
+
+def test_escritor_por_lotes_coincide_con_el_texto(tmp_path):
+    gramatica = gramatica_desde(*generar_gramatica(no_terminales=50, densidad_anulable=0.3))
+    archivo = tmp_path / 'g.txt'
+    for lineas_por_lote in (1, 7, 4096):
+        escritos = escribir_texto(gramatica, str(archivo), lineas_por_lote)
+        assert archivo.read_text(encoding='utf-8') == texto_gramatica(gramatica)
+        assert escritos == len(archivo.read_bytes())
+
+
+def test_escribir_y_cargar_segun_extension(tmp_path):
+    gramatica = gramatica_desde('S → aA | ε', 'A → b | ε')
+    binario = str(tmp_path / 'g.cfgb')
+    escribir_gramatica(gramatica, binario)
+    assert open(binario, 'rb').read(4) == b'CFGB'
+    _iguales(cargar_gramatica(binario), gramatica)
+
+    # Una etapa del pipeline puede recibir la gramática en binario
+    resultado, = procesar_lote([binario], trabajadores=1)
+    assert resultado.exito
+    assert cargar_gramatica(resultado.salida).producciones == {'S': ['aA', 'a'], 'A': ['b']}
+
+
+def test_ida_y_vuelta_de_100k_producciones(tmp_path, monkeypatch):
+    gramatica = gramatica_desde(*generar_gramatica(no_terminales=25000, producciones_por_nt=4))
+    assert gramatica.num_producciones() >= 100000
+    archivo = str(tmp_path / 'g.cfgb')
+    escritos = guardar_binario(gramatica, archivo)
+
+    # Cabecera, un int32 por entrada de cada arreglo y los nombres: nada
+    # por producción más allá de su límite (los tiempos, en bench_serializacion)
+    bloques = [bloque for _, bloque in gramatica.bloques()]
+    enteros = (len(bloques) + 2 * (len(bloques) + 1) + gramatica.num_producciones()
+               + len(bloques) + sum(len(b.simbolos) for b in bloques)
+               + len(gramatica.terminales) + len(gramatica.no_terminales))
+    nombres = len('\n'.join(gramatica.tabla.nombres).encode('utf-8'))
+    assert escritos == os.path.getsize(archivo) == _CABECERA.size + 4 * enteros + nombres
+
+    # La carga copia bloques enteros, sin agregar producción por producción
+    llamadas = []
+    monkeypatch.setattr(Gramatica, 'agregar_produccion_ids',
+                        lambda self, *args: llamadas.append(args))
+    cargada = cargar_binario(archivo)
+    assert not llamadas
+    assert cargada.num_producciones() == gramatica.num_producciones()
+    k = gramatica.tabla.ids['<N7>']
+    assert list(cargada.producciones_de(k)) == list(gramatica.producciones_de(k))
@@ -0,0 +1,112 @@
+# test_servicio.py
+import asyncio
+import json
+from servicio import Metricas, ServicioSimplificacion, simplificar_textos
+
+GRAMATICA = 'S → aA | ε\nA → b | ε\n'
+
+
+async def _solicitud(puerto, metodo, ruta, cuerpo=b''):
+    lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+    escritor.write(f"{metodo} {ruta} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(cuerpo)}\r\n\r\n"
+                   .encode('latin-1') + cuerpo)
+    await escritor.drain()
+    respuesta = await lector.read()
+    escritor.close()
+    cabeceras, _, cuerpo = respuesta.partition(b'\r\n\r\n')
+    codigo = int(cabeceras.split()[1])
+    return codigo, json.loads(cuerpo)
+
+
+def _con_servicio(prueba, **opciones):
+    async def ejecutar():
+        servicio = ServicioSimplificacion(puerto=0, trabajadores=1, **opciones)
+        await servicio.iniciar()
+        try:
+            return await prueba(servicio)
+        finally:
+            await servicio.detener()
+    return asyncio.run(ejecutar())
+
+
+def test_simplificar_textos_por_lote():
+    (codigo, ok), (codigo_error, error) = simplificar_textos([GRAMATICA, 'S  a'])
+    assert codigo == 200 and ok['estadisticas']['anulables'] == 2
+    assert 'S → aA | a' in ok['gramatica']
+    assert codigo_error == 400 and error['errores']
+
+
+def test_rutas_del_servicio():
+    async def prueba(servicio):
+        codigo, respuesta = await _solicitud(servicio.puerto, 'POST', '/simplificar',
+                                             GRAMATICA.encode('utf-8'))
+        assert codigo == 200
+        assert respuesta['gramatica'].splitlines()[3:] == ['A → b', 'S → aA | a']
+
+        codigo, respuesta = await _solicitud(servicio.puerto, 'POST', '/simplificar', b'S -> a')
+        assert codigo == 400 and 'Línea 1' in respuesta['errores'][0]
+
+        assert (await _solicitud(servicio.puerto, 'GET', '/otra'))[0] == 404
+        assert (await _solicitud(servicio.puerto, 'GET', '/simplificar'))[0] == 405
+
+        codigo, metricas = await _solicitud(servicio.puerto, 'GET', '/metricas')
+        assert codigo == 200
+        assert metricas['atendidas'] == 4
+        assert metricas['errores_cliente'] == 3 and metricas['fallidas'] == 0
+        assert metricas['lotes'] == 2 and metricas['latencia_ms']['p50'] > 0
+        assert metricas['rendimiento']['por_segundo'] > 0
+    _con_servicio(prueba)
+
+
+def test_cuerpo_vacio_responde_400_sin_encolar():
+    async def sin_content_length(puerto):
+        lector, escritor = await asyncio.open_connection('127.0.0.1', puerto)
+        escritor.write(b"POST /simplificar HTTP/1.1\r\nHost: x\r\n\r\n")
+        await escritor.drain()
+        respuesta = await lector.read()
+        escritor.close()
+        return int(respuesta.split()[1])
+
+    async def prueba(servicio):
+        codigo, respuesta = await _solicitud(servicio.puerto, 'POST', '/simplificar')
+        assert codigo == 400 and 'Content-Length' in respuesta['error']
+        assert await sin_content_length(servicio.puerto) == 400
+        assert servicio.metricas.lotes == 0
+        assert servicio.metricas.errores_cliente == 2 and servicio.metricas.fallidas == 0
+    _con_servicio(prueba)
+
+
+def test_solo_los_5xx_cuentan_como_fallas():
+    metricas = Metricas()
+    for codigo in (200, 400, 404, 413, 500):
+        metricas.registrar(0.001, codigo)
+    exportadas = metricas.exportar(0, 1)
+    assert exportadas['atendidas'] == 5
+    assert exportadas['errores_cliente'] == 3 and exportadas['fallidas'] == 1
+
+
+def test_solicitudes_concurrentes_se_agrupan_en_lotes():
+    async def prueba(servicio):
+        respuestas = await asyncio.gather(*[
+            _solicitud(servicio.puerto, 'POST', '/simplificar', f'S → a{i}A\nA → b | ε'.encode())
+            for i in range(20)])
+        assert all(codigo == 200 for codigo, _ in respuestas)
+        # Cada respuesta corresponde a su propia solicitud
+        assert [r['gramatica'].splitlines()[-1] for _, r in respuestas] == \
+            [f'S → a{i}A | a{i}' for i in range(20)]
+        metricas = servicio.metricas.exportar(0, servicio.max_cola)
+        assert metricas['lotes'] < 20 and metricas['tamano_medio_lote'] > 1
+    _con_servicio(prueba, tamano_lote=8, espera_lote=0.05)
+
+
+def test_cola_llena_responde_503():
+    async def prueba(servicio):
+        respuestas = await asyncio.gather(*[
+            _solicitud(servicio.puerto, 'POST', '/simplificar', GRAMATICA.encode('utf-8'))
+            for _ in range(30)])
+        codigos = [codigo for codigo, _ in respuestas]
+        assert 503 in codigos and 200 in codigos
+        assert set(codigos) == {200, 503}
+        assert servicio.metricas.rechazadas == codigos.count(503)
+        assert servicio.metricas.atendidas == codigos.count(200)
+    _con_servicio(prueba, max_cola=2, tamano_lote=1, espera_lote=0)
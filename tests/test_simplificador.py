@@ -0,0 +1,178 @@
+# test_simplificador.py
+import itertools
+import random
+import pytest
+from auxiliares import gramatica_desde, lenguaje_hasta
+from simplificador import SimplificadorCFG, componentes_fuertes
+
+
+def _variantes_referencia(produccion, anulables):
+    """Método original de los 2^m casos"""
+    posiciones = [i for i, s in enumerate(produccion) if s in anulables]
+    variantes = set()
+    for omitidas in itertools.product((False, True), repeat=len(posiciones)):
+        quitar = {p for p, o in zip(posiciones, omitidas) if o}
+        variantes.add(tuple(s for i, s in enumerate(produccion) if i not in quitar))
+    return variantes
+
+
+def test_variantes_coinciden_con_metodo_2_a_la_m():
+    simplificador = SimplificadorCFG()
+    rng = random.Random(3)
+    anulables = {0, 1, 2}
+    for _ in range(500):
+        produccion = [rng.randint(0, 4) for _ in range(rng.randint(0, 8))]
+        variantes = list(simplificador._generar_variantes(produccion, anulables))
+        assert set(variantes) == _variantes_referencia(produccion, anulables)
+        assert len(variantes) == simplificador.contar_variantes(produccion, anulables)
+
+
+def test_rachas_de_anulables_no_generan_duplicados():
+    simplificador = SimplificadorCFG()
+    variantes = list(simplificador._generar_variantes([0, 0, 0, 5], {0}))
+    assert variantes == [(0, 0, 0, 5), (0, 0, 5), (0, 5), (5,)]
+    assert simplificador.contar_variantes([0, 0, 0, 5], {0}) == 4
+
+
+def test_limite_de_variantes():
+    simplificador = SimplificadorCFG()
+    produccion = list(range(20))
+    anulables = set(produccion)
+    todas = simplificador._generar_variantes(produccion, anulables)
+    primeras = list(simplificador._generar_variantes(produccion, anulables, limite=5))
+    assert primeras == list(itertools.islice(todas, 5))
+    assert list(simplificador._generar_variantes(produccion, anulables, limite=0)) == []
+    assert simplificador.contar_variantes(produccion, anulables) == 2 ** 20
+
+
+def test_variantes_sin_anulables_y_produccion_vacia():
+    simplificador = SimplificadorCFG()
+    assert list(simplificador._generar_variantes([1, 2], set())) == [(1, 2)]
+    assert list(simplificador._generar_variantes([], {1})) == [()]
+
+
+GRAMATICA_1 = ('S → 0A0 | 1B1 | BB', 'A → C', 'B → S | A', 'C → S | ε')
+
+
+def _sin_vacia(gramatica, longitud):
+    return lenguaje_hasta(gramatica, longitud) - {''}
+
+
+def test_componentes_fuertes_en_orden_topologico_inverso():
+    sucesores = {1: [2], 2: [3, 1], 3: [4], 4: [3], 5: [1]}
+    componentes = componentes_fuertes([1, 2, 3, 4, 5], sucesores)
+    assert sorted(sorted(c) for c in componentes) == [[1, 2], [3, 4], [5]]
+    posicion = {nt: i for i, c in enumerate(componentes) for nt in c}
+    assert posicion[3] < posicion[1] < posicion[5]
+
+
+def test_componentes_fuertes_en_cadena_larga_no_agota_la_pila():
+    n = 50000
+    sucesores = {i: [i + 1] for i in range(n)}
+    sucesores[n] = [0]
+    assert len(componentes_fuertes(range(n + 1), sucesores)) == 1
+
+
+def test_unitarias_por_componentes_conserva_el_lenguaje():
+    gramatica = gramatica_desde('S → A | aSb', 'A → B', 'B → C | ab', 'C → S | c')
+    sin_unitarias = SimplificadorCFG().eliminar_producciones_unitarias(gramatica)
+    es_no_terminal = gramatica.tabla.no_terminal
+    assert not any(len(p) == 1 and es_no_terminal[p[0]]
+                   for _, bloque in sin_unitarias.bloques() for p in bloque)
+    assert lenguaje_hasta(sin_unitarias, 8) == lenguaje_hasta(gramatica, 8)
+
+
+def test_inutiles_quita_improductivos_e_inalcanzables():
+    gramatica = gramatica_desde('S → aA | b | aC', 'A → aA', 'B → b', 'C → c')
+    util = SimplificadorCFG().eliminar_simbolos_inutiles(gramatica)
+    assert util.producciones == {'S': ['b', 'aC'], 'C': ['c']}
+    assert util.no_terminales == {'S', 'C'}
+
+    vacia = SimplificadorCFG().eliminar_simbolos_inutiles(gramatica_desde('S → aS'))
+    assert vacia.num_producciones() == 0 and vacia.simbolo_inicial == 'S'
+
+
+def test_simplificar_gramatica_1():
+    gramatica = gramatica_desde(*GRAMATICA_1)
+    simplificador = SimplificadorCFG()
+    simplificada = simplificador.simplificar(gramatica)
+    assert 'C' not in simplificada.no_terminales
+    assert _sin_vacia(simplificada, 7) == _sin_vacia(gramatica, 7)
+    assert simplificador.pasos_ejecutados == [
+        ('epsilon', True), ('unitarias', True), ('inutiles', True)]
+
+
+def test_simplificar_solo_repite_pasos_invalidados():
+    simplificador = SimplificadorCFG()
+    gramatica = gramatica_desde('S → aS | b')
+    resultado = simplificador.simplificar(gramatica)
+    assert simplificador.pasos_ejecutados == [
+        ('epsilon', False), ('unitarias', False), ('inutiles', False)]
+    assert resultado is not gramatica and resultado.producciones == gramatica.producciones
+
+    simplificador.simplificar(gramatica_desde('S → A | a', 'A → b'), ('unitarias', 'inutiles'))
+    assert simplificador.pasos_ejecutados == [('unitarias', True), ('inutiles', True)]
+
+    with pytest.raises(ValueError):
+        simplificador.simplificar(gramatica, ('epsilon', 'otro'))
+
+
+def test_simplificar_conserva_el_lenguaje_en_gramaticas_aleatorias():
+    rng = random.Random(11)
+    for _ in range(40):
+        lineas = []
+        for nt in 'SABCD':
+            alternativas = [''.join(rng.choice('SABCDab') for _ in range(rng.randint(0, 3)))
+                            for _ in range(rng.randint(1, 3))]
+            lineas.append(f"{nt} → {' | '.join(a or 'ε' for a in alternativas)}")
+        gramatica = gramatica_desde(*lineas)
+        simplificada = SimplificadorCFG().simplificar(gramatica)
+        assert _sin_vacia(simplificada, 5) == _sin_vacia(gramatica, 5), lineas
+
+
+def test_eliminar_epsilon_comparte_los_bloques_sin_cambios():
+    gramatica = gramatica_desde('S → aA | B', 'A → b | ε', 'B → cB | d', 'C → e | e')
+    simplificada = SimplificadorCFG().eliminar_producciones_epsilon(gramatica)
+    ids = gramatica.tabla.ids
+    assert simplificada.producciones_de(ids['B']) is gramatica.producciones_de(ids['B'])
+    assert simplificada.producciones_de(ids['S']) is not gramatica.producciones_de(ids['S'])
+    # Las producciones repetidas obligan a reescribir el bloque
+    assert simplificada.producciones['C'] == ['e']
+    assert simplificada.producciones == {'S': ['aA', 'a', 'B'], 'A': ['b'],
+                                         'B': ['cB', 'd'], 'C': ['e']}
+    assert gramatica.producciones['A'] == ['b', 'ε']
+
+
+def test_factorizacion_conserva_el_lenguaje():
+    rng = random.Random(17)
+    for _ in range(40):
+        lineas = [f"S → {''.join(rng.choice('ABCab') for _ in range(rng.randint(3, 7)))} | a",
+                  'A → a | ε', 'B → bB | ε', 'C → AB | c']
+        gramatica = gramatica_desde(*lineas)
+        completa = SimplificadorCFG(presupuesto_variantes=None).eliminar_producciones_epsilon(gramatica)
+        factorizada = SimplificadorCFG(presupuesto_variantes=2).eliminar_producciones_epsilon(gramatica)
+        assert _sin_vacia(factorizada, 6) == _sin_vacia(completa, 6), lineas
+        assert '' not in lenguaje_hasta(factorizada, 0)
+
+
+def test_presupuesto_evita_la_explosion_exponencial():
+    gramatica = gramatica_desde('S → ' + 'A' * 5 + 'B' * 5 + 'C' * 5 + 'D' * 5 + 'AB' * 5 + 'x',
+                                'A → a | ε', 'B → b | ε', 'C → c | ε', 'D → d | ε')
+    simplificador = SimplificadorCFG(presupuesto_variantes=1000)
+    simplificada = simplificador.eliminar_producciones_epsilon(gramatica)
+    # 6^4 * 2^10 variantes sin factorizar; la salida queda lineal
+    assert simplificada.num_producciones() < 100
+    estadisticas = simplificador.calcular_estadisticas(gramatica, simplificada)
+    assert estadisticas['factorizadas'] == 1 and estadisticas['auxiliares'] == 13
+    # Los auxiliares usan una tabla propia
+    assert '<F1>' in simplificada.tabla.ids and '<F1>' not in gramatica.tabla.ids
+    assert {'abx', 'abcdx', 'bx', 'x'} <= lenguaje_hasta(simplificada, 5)
+
+
+def test_presupuesto_no_afecta_producciones_pequenas(capsys):
+    gramatica = gramatica_desde('S → aA', 'A → b | ε')
+    simplificador = SimplificadorCFG(presupuesto_variantes=2)
+    simplificada = simplificador.eliminar_producciones_epsilon(gramatica)
+    assert simplificada.producciones == {'S': ['aA', 'a'], 'A': ['b']}
+    simplificador.mostrar_estadisticas(gramatica, simplificada)
+    assert 'factorizadas' not in capsys.readouterr().out
@@ -0,0 +1,128 @@
+# test_validador.py
+import pytest
+from validador import ErrorGramatica, ValidadorGramatica
+
+
+def _escribir(tmp_path, *lineas, nombre='gramatica.txt'):
+    ruta = tmp_path / nombre
+    ruta.write_text('\n'.join(lineas), encoding='utf-8')
+    return str(ruta)
+
+
+def test_valida_y_carga_gramatica(tmp_path):
+    ruta = _escribir(tmp_path, '# comentario', 'S → aAa | ε', '', 'A → <Op>b', '<Op> → c')
+    validador = ValidadorGramatica()
+    assert validador.validar_archivo(ruta)
+
+    gramatica = validador.cargar_gramatica(ruta)
+    assert gramatica.simbolo_inicial == 'S'
+    assert gramatica.producciones == {'S': ['aAa', 'ε'], 'A': ['<Op>b'], '<Op>': ['c']}
+
+
+@pytest.mark.parametrize('linea', [
+    'X → <x y>',      # < y > solo delimitan nombres
+    'X → a>b',
+    'X → aεb',        # ε solo como producción completa
+    'X →',
+    'x → a',
+    'XY → a',
+])
+def test_rechaza_lineas_invalidas(tmp_path, linea):
+    ruta = _escribir(tmp_path, 'S → a', linea)
+    assert not ValidadorGramatica().validar_archivo(ruta)
+
+
+def test_guardar_y_recargar_conserva_la_gramatica(tmp_path):
+    from main import guardar_resultado
+    ruta = _escribir(tmp_path, '<Expr> → <Expr>+<Term> | <Term>', '<Term> → (<Expr>) | a')
+    validador = ValidadorGramatica()
+    gramatica = validador.cargar_gramatica(ruta)
+
+    salida = str(tmp_path / 'salida.txt')
+    guardar_resultado(gramatica, salida)
+    recargada = validador.cargar_gramatica(salida)
+    assert recargada.producciones == gramatica.producciones
+
+
+@pytest.mark.parametrize('usar_mmap', [False, True])
+def test_carga_en_una_pasada_con_y_sin_mmap(tmp_path, usar_mmap):
+    lineas = ['S → ' + ' | '.join(f'a{i % 10}S' for i in range(50)) + ' | ε']
+    lineas += [f'<N{i}> → b<N{i + 1}> | c' for i in range(200)]
+    ruta = _escribir(tmp_path, *lineas)
+    gramatica = ValidadorGramatica().cargar_gramatica(ruta, usar_mmap=usar_mmap)
+    assert gramatica.num_producciones() == 51 + 400
+    assert gramatica.producciones['<N3>'] == ['b<N4>', 'c']
+
+
+def test_mmap_con_archivo_vacio(tmp_path):
+    ruta = _escribir(tmp_path)
+    gramatica = ValidadorGramatica().cargar_gramatica(ruta, usar_mmap=True)
+    assert gramatica.num_producciones() == 0
+
+
+def test_error_gramatica_lista_errores_por_linea(tmp_path):
+    ruta = _escribir(tmp_path, '# Gramática 1', 'S → 0A0 | 1B1 | BB', 'A → C',
+                     'B  S | A', 'C → S | ε', 'c → a')
+    with pytest.raises(ErrorGramatica) as error:
+        ValidadorGramatica().cargar_gramatica(ruta)
+    assert isinstance(error.value, ValueError)
+    assert error.value.errores == ['Línea 4: formato inválido - B  S | A',
+                                   'Línea 6: formato inválido - c → a']
+
+
+def test_archivo_inexistente(tmp_path):
+    validador = ValidadorGramatica()
+    assert not validador.validar_archivo(str(tmp_path / 'no_existe.txt'))
+    with pytest.raises(FileNotFoundError):
+        validador.cargar_gramatica(str(tmp_path / 'no_existe.txt'))
+
+
+def test_reportero_recibe_eventos_con_numero_de_linea(tmp_path):
+    import io
+    import json
+    from reportero import ReporteroJSONL
+    destino = io.StringIO()
+    ruta = _escribir(tmp_path, 'S → a', '', 'S b')
+    ValidadorGramatica(ReporteroJSONL(destino)).validar_archivo(ruta)
+    eventos = [json.loads(linea) for linea in destino.getvalue().splitlines()]
+    assert [e['evento'] for e in eventos] == ['validando_archivo', 'linea_valida',
+                                              'linea_invalida', 'resultado_validacion']
+    assert eventos[2]['linea'] == 3
+
+
+def test_escaner_coincide_con_errores_esperados():
+    from validador import ErrorSintaxis
+    validador = ValidadorGramatica()
+    assert validador.analizar_linea('S → 0A0 | 1B1 | BB') == ('S', ['0A0', '1B1', 'BB'])
+    assert validador.analizar_linea('<E> →<E>+<T>|') == ('<E>', ['<E>+<T>', ''])
+    for linea, columna, tipo in [('B  S | A', 3, 'formato'), ('S → a!', 5, 'formato'),
+                                 ('<S → a', 0, 'formato'), ('S → aε', 4, 'contenido')]:
+        with pytest.raises(ErrorSintaxis) as error:
+            validador.analizar_linea(linea)
+        assert (error.value.columna, error.value.tipo) == (columna, tipo)
+
+
+class _LineaContada(str):
+    """Línea que cuenta los accesos por índice o rebanada"""
+    lecturas = 0
+
+    def __getitem__(self, clave):
+        _LineaContada.lecturas += 1
+        return str.__getitem__(self, clave)
+
+
+def test_escaner_lineal_en_lineas_adversarias():
+    # Los tiempos están en benchmarks/bench_escaner.py; aquí se cuentan
+    # las lecturas de la línea, que no dependen de la carga de la máquina
+    from benchmarks.bench_escaner import LINEAS_ADVERSARIAS
+    from validador import ErrorSintaxis
+    validador = ValidadorGramatica()
+    for generador in LINEAS_ADVERSARIAS.values():
+        for n in (1000, 4000, 16000):
+            linea = _LineaContada(generador(n))
+            _LineaContada.lecturas = 0
+            try:
+                validador.analizar_linea(linea)
+            except ErrorSintaxis:
+                pass
+            assert _LineaContada.lecturas <= 2 * len(linea)
@@ -1,135 +1,225 @@
 # validador.py
-import re
-from gramatica import Gramatica
+import mmap
+import os
+from string import ascii_letters, digits
+from typing import Iterable, Iterator, List, Optional, Tuple
+from gramatica import CARACTERES_NOMBRE, EPSILON, Gramatica
+from reportero import Reportero
+
+
+class ErrorGramatica(ValueError):
+    """Archivo de gramática inválido; `errores` lista los problemas por línea"""
+    def __init__(self, mensaje: str, errores: List[str]):
+        super().__init__(mensaje)
+        self.errores = errores
+
+
+class ErrorSintaxis(ValueError):
+    """
+    Línea mal escrita. `columna` indica dónde se detectó el problema y
+    `tipo` distingue errores de formato de errores de contenido
+    """
+    def __init__(self, columna: int, motivo: str, tipo: str = "formato"):
+        super().__init__(f"columna {columna}: {motivo}")
+        self.columna = columna
+        self.motivo = motivo
+        self.tipo = tipo
+
+
+# Caracteres permitidos en el lado derecho, además de espacios y nombres <nombre>
+CARACTERES_LADO_DERECHO = frozenset(ascii_letters + digits + 'ε|\\()[]{}^$+.?*_')
+
 
 class ValidadorGramatica:
-    def __init__(self):
-        # Regex para validar que una línea está bien escrita
-        # Ejemplo: S → 0A0 | 1B1 | BB
-        self.patron_produccion = re.compile(r'^[A-Z]\s*→\s*([A-Za-z0-9ε|\\()\[\]{}^$+.?*_\s]+(\s*\|\s*[A-Za-z0-9ε|\\()\[\]{}^$+.?*_\s]*)*)\s*$')
-        
-        # Regex para validar producciones individuales
-        self.patron_lado_derecho = re.compile(r'^[A-Za-z0-9ε|\\()\[\]{}^$+.?*_\s]*$')
+    def __init__(self, reportero: Optional[Reportero] = None):
+        self.reportero = reportero or Reportero()
     
     def validar_archivo(self, nombre_archivo: str) -> bool:
         """
         Valida que un archivo de gramática esté bien escrito
-        usando expresiones regulares
         """
-        print(f"=== VALIDANDO ARCHIVO: {nombre_archivo} ===")
+        try:
+            return not self._procesar_archivo(nombre_archivo, None)
+        except Exception:
+            return False
+    
+    def cargar_gramatica(self, nombre_archivo: str, usar_mmap: bool = False) -> Gramatica:
+        """
+        Valida y carga una gramática en una sola pasada por el archivo
+        Las líneas se leen una a una (o desde un mmap para archivos enormes),
+        así nunca se mantiene el archivo completo en memoria
+        Lanza ErrorGramatica con los errores por número de línea si el
+        archivo no es válido
+        """
+        gramatica = Gramatica()
+        errores = self._procesar_archivo(nombre_archivo, gramatica, usar_mmap)
+        if errores:
+            raise ErrorGramatica(f"Archivo {nombre_archivo} no es válido", errores)
+        
+        if self.reportero.activo:
+            self.reportero.evento("gramatica_cargada", archivo=nombre_archivo)
+        return gramatica
+    
+    def cargar_gramatica_texto(self, texto: str, origen: str = "<texto>") -> Gramatica:
+        """Como cargar_gramatica, pero a partir del contenido ya en memoria"""
+        gramatica = Gramatica()
+        errores = self._procesar_lineas(origen, enumerate(texto.splitlines(), 1), gramatica)
+        if errores:
+            raise ErrorGramatica(f"Gramática {origen} no es válida", errores)
+        return gramatica
+    
+    def _procesar_archivo(self, nombre_archivo: str, gramatica: Optional[Gramatica],
+                          usar_mmap: bool = False) -> List[str]:
+        """
+        Recorre el archivo validando cada línea y, si se recibe una
+        gramática, agregando sus producciones. Devuelve los errores encontrados
+        """
+        return self._procesar_lineas(nombre_archivo,
+                                     self._leer_lineas(nombre_archivo, usar_mmap), gramatica)
+    
+    def _procesar_lineas(self, nombre_archivo: str, lineas: Iterable[Tuple[int, str]],
+                         gramatica: Optional[Gramatica]) -> List[str]:
+        """Valida pares (número de línea, texto) y agrega las producciones válidas"""
+        rep = self.reportero
+        if rep.activo:
+            rep.evento("validando_archivo", archivo=nombre_archivo)
+        
+        errores_encontrados = []
+        lineas_validas = 0
         
         try:
-            with open(nombre_archivo, 'r', encoding='utf-8') as archivo:
-                lineas = archivo.readlines()
-            
-            errores_encontrados = []
-            lineas_validas = 0
-            
-            for num_linea, linea in enumerate(lineas, 1):
+            for num_linea, linea in lineas:
                 linea = linea.strip()
                 
                 # Ignorar líneas vacías y comentarios
                 if not linea or linea.startswith('#'):
                     continue
                 
-                # Validar formato de la línea
-                if self.patron_produccion.match(linea):
-                    lineas_validas += 1
-                    print(f"✓ Línea {num_linea}: {linea}")
-                    
-                    # Validación adicional del contenido
-                    if not self._validar_contenido_linea(linea):
-                        errores_encontrados.append(f"Línea {num_linea}: contenido inválido - {linea}")
+                # Validar y separar la línea en una sola pasada
+                try:
+                    no_terminal, alternativas = self.analizar_linea(linea)
+                except ErrorSintaxis as error:
+                    errores_encontrados.append(f"Línea {num_linea}: {error.tipo} inválido - {linea}")
+                    if error.tipo == "formato":
+                        if rep.activo:
+                            rep.evento("linea_invalida", linea=num_linea, texto=linea)
+                        continue
                 else:
-                    errores_encontrados.append(f"Línea {num_linea}: formato inválido - {linea}")
-                    print(f"✗ Línea {num_linea}: {linea}")
-            
-            # Mostrar resultados
-            print(f"\nRESULTADOS DE VALIDACIÓN:")
-            print(f"Líneas válidas: {lineas_validas}")
-            print(f"Errores encontrados: {len(errores_encontrados)}")
-            
-            if errores_encontrados:
-                print("\nERRORES DETECTADOS:")
-                for error in errores_encontrados:
-                    print(f"  - {error}")
-                return False
-            else:
-                print("✓ Archivo válido - todas las producciones están bien escritas")
-                return True
+                    if gramatica is not None and not errores_encontrados:
+                        self._agregar_linea(gramatica, no_terminal, alternativas)
+                
+                lineas_validas += 1
+                if rep.activo:
+                    rep.evento("linea_valida", linea=num_linea, texto=linea)
                 
         except FileNotFoundError:
-            print(f"ERROR: No se encontró el archivo '{nombre_archivo}'")
-            return False
+            if rep.activo:
+                rep.evento("archivo_no_encontrado", archivo=nombre_archivo)
+            raise
         except Exception as e:
-            print(f"ERROR al leer archivo: {e}")
-            return False
+            if rep.activo:
+                rep.evento("error_lectura", archivo=nombre_archivo, mensaje=str(e))
+            raise
+        
+        # Mostrar resultados
+        if rep.activo:
+            rep.evento("resultado_validacion", lineas_validas=lineas_validas,
+                       errores=errores_encontrados)
+        
+        return errores_encontrados
     
-    def _validar_contenido_linea(self, linea: str) -> bool:
-        """Validación adicional del contenido de una línea"""
-        # Separar lado izquierdo y derecho
-        if '→' not in linea:
-            return False
+    def _leer_lineas(self, nombre_archivo: str, usar_mmap: bool) -> Iterator[Tuple[int, str]]:
+        """Genera (número de línea, texto) sin cargar el archivo completo"""
+        if not usar_mmap:
+            with open(nombre_archivo, 'r', encoding='utf-8') as archivo:
+                yield from enumerate(archivo, 1)
+            return
         
-        partes = linea.split('→', 1)
-        if len(partes) != 2:
-            return False
+        with open(nombre_archivo, 'rb') as archivo:
+            if os.fstat(archivo.fileno()).st_size == 0:
+                return
+            with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                for num_linea, linea in enumerate(iter(mapa.readline, b''), 1):
+                    yield num_linea, linea.decode('utf-8')
+    
+    def analizar_linea(self, linea: str) -> Tuple[str, List[str]]:
+        """
+        Analiza una línea 'A → α | β' ya sin espacios en los extremos y
+        devuelve (A, [α, β]). Recorre cada carácter una sola vez, así el
+        costo es lineal incluso en líneas largas mal formadas
+        Lanza ErrorSintaxis si la línea no es válida
+        """
+        n = len(linea)
         
-        lado_izquierdo = partes[0].strip()
-        lado_derecho = partes[1].strip()
+        # Lado izquierdo: una mayúscula o un nombre <nombre>
+        if n and 'A' <= linea[0] <= 'Z':
+            i = 1
+        elif n and linea[0] == '<':
+            i = self._escanear_nombre(linea, 0)
+        else:
+            raise ErrorSintaxis(0, "se esperaba un no terminal")
+        no_terminal = linea[:i]
         
-        # Lado izquierdo debe ser un solo no terminal
-        if not re.match(r'^[A-Z]$', lado_izquierdo):
-            return False
+        while i < n and linea[i].isspace():
+            i += 1
+        if i == n or linea[i] != '→':
+            raise ErrorSintaxis(i, "se esperaba →")
+        i += 1
+        if i == n:
+            raise ErrorSintaxis(i, "falta el lado derecho")
         
-        # Validar cada producción del lado derecho
-        producciones = lado_derecho.split('|')
-        for prod in producciones:
-            prod = prod.strip()
-            if not self.patron_lado_derecho.match(prod):
-                return False
+        # Lado derecho: alternativas separadas por |
+        alternativas = []
+        inicio = i
+        while i < n:
+            char = linea[i]
+            if char == '<':
+                i = self._escanear_nombre(linea, i)
+                continue
+            if char == '|':
+                alternativas.append(linea[inicio:i].strip())
+                inicio = i + 1
+            elif char not in CARACTERES_LADO_DERECHO and not char.isspace():
+                raise ErrorSintaxis(i, f"carácter no permitido '{char}'")
+            i += 1
+        alternativas.append(linea[inicio:].strip())
+        
+        # ε solo puede aparecer como producción completa
+        for alternativa in alternativas:
+            if EPSILON in alternativa and alternativa != EPSILON:
+                raise ErrorSintaxis(linea.index(alternativa), "ε dentro de una producción",
+                                    "contenido")
+        
+        return no_terminal, alternativas
+    
+    def _escanear_nombre(self, linea: str, i: int) -> int:
+        """Reconoce <nombre> a partir de linea[i] == '<' y devuelve la posición siguiente"""
+        j = i + 1
+        n = len(linea)
+        while j < n and linea[j] in CARACTERES_NOMBRE:
+            j += 1
+        if j == i + 1 or j == n or linea[j] != '>':
+            raise ErrorSintaxis(i, "'<' sin nombre válido")
+        return j + 1
+    
+    def _agregar_linea(self, gramatica: Gramatica, no_terminal: str, alternativas: List[str]):
+        """Agrega a la gramática las producciones de una línea ya validada"""
+        # Establecer símbolo inicial (primer no terminal encontrado)
+        if gramatica.inicial < 0:
+            gramatica.establecer_inicial(no_terminal)
         
-        return True
+        for prod in alternativas:
+            gramatica.agregar_produccion(no_terminal, prod)
     
     def cargar_gramatica_desde_archivo(self, nombre_archivo: str) -> Gramatica:
         """Carga una gramática desde un archivo validado"""
-        if not self.validar_archivo(nombre_archivo):
-            raise ValueError(f"Archivo {nombre_archivo} no es válido")
-        
-        gramatica = Gramatica()
-        primer_no_terminal = None
-        
         try:
-            with open(nombre_archivo, 'r', encoding='utf-8') as archivo:
-                lineas = archivo.readlines()
-            
-            for linea in lineas:
-                linea = linea.strip()
-                if not linea or linea.startswith('#'):
-                    continue
-                
-                # Parsear la línea
-                partes = linea.split('→', 1)
-                no_terminal = partes[0].strip()
-                producciones_str = partes[1].strip()
-                
-                # Establecer símbolo inicial (primer no terminal encontrado)
-                if primer_no_terminal is None:
-                    primer_no_terminal = no_terminal
-                    gramatica.establecer_inicial(no_terminal)
-                
-                # Separar producciones por |
-                producciones = [p.strip() for p in producciones_str.split('|')]
-                
-                # Agregar cada producción
-                for prod in producciones:
-                    gramatica.agregar_produccion(no_terminal, prod)
-            
-            print(f"✓ Gramática cargada exitosamente desde {nombre_archivo}")
-            return gramatica
-            
+            return self.cargar_gramatica(nombre_archivo)
+        except ErrorGramatica:
+            raise
         except Exception as e:
-            print(f"ERROR al cargar gramática: {e}")
+            if self.reportero.activo:
+                self.reportero.evento("error_carga", archivo=nombre_archivo, mensaje=str(e))
             raise
     
     def generar_regex_ejemplo(self) -> str: